@@ -1,5 +1,20 @@
+from ._version import version as __version__
 from . import _interface_utils as interface_utils
+from . import _line_buffer as line_buffer
+from . import _structure as structure
+from . import _converters as converters
+from . import _fixed_width as fixed_width
+from . import _compression as compression
 from . import _data_file as data_file
+from . import _columns as columns
+from . import _formatting as formatting
+from . import _column_builder as column_builder
+from . import _conditions as conditions
+from . import _index as index
+from . import _derived as derived
+from . import _schema as schema
 from . import _data as data
+from . import _storage as storage
+from . import _instrument as instrument
 from . import _read_data_file as read_data_file
 from . import _write_data_file as write_data_file
@@ -0,0 +1,209 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Assembly of the entries of a data file directly into one list per
+    quantity, while the file is being read. Each entry is given as the
+    dictionaries found on its file lines (one per structure line).
+
+'''
+
+# Import Python packages
+import numpy as np
+
+# Import Interface toolkit
+from . import interface_utils as utils
+
+
+#######################
+#  Declare the class  #
+#######################
+class column_builder( object ):
+
+    '''
+
+    Collect the quantities of every entry into one list per quantity.
+    Quantities missing from an entry are filled with "" (strings) or 0
+    (digits), depending on the type of the first value of the quantity.
+    Quantities flagged with $ONCE are set apart, and applied to every
+    entry when the data dictionary is generated.
+
+    Attributes
+    ==========
+        quantities (list): quantities in order of first appearance ($ONCE excluded)
+        columns (dict): values of each quantity (one per entry, missing ones filled at the end)
+        types (dict): type of the first value of each quantity
+        once (dict): value of each $ONCE quantity (label including the $ONCE flag)
+        nb_entries (int): number of entries added (empty entries are skipped)
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self):
+
+        '''
+
+        Initialize the column_builder class.
+
+        '''
+
+        # Declare the columns
+        self.quantities = []
+        self.columns = dict()
+        self.types = dict()
+        self.once = dict()
+        self.nb_entries = 0
+
+
+    ###############
+    #  Add entry  #
+    ###############
+    def add_entry(self, entry):
+
+        '''
+
+        Combine the dictionaries of an entry (see combine_entry), and
+        append its quantities to the columns. Empty entries are skipped.
+
+        Argument
+        ========
+            entry (list of dict): quantities found on each line of the entry
+
+        '''
+
+        # Skip the entry if there is no quantity
+        quantities = combine_entry(entry)
+        if len(quantities) == 0:
+            return
+        i_entry = self.nb_entries
+
+        # For each quantity of the entry ..
+        for q, value in quantities.items():
+
+            # Set apart the quantities that apply to every entry
+            if "$ONCE" in q:
+                self.once[q] = value
+                continue
+
+            # Create the column if this is a new quantity
+            column = self.columns.get(q)
+            if column == None:
+                column = []
+                self.columns[q] = column
+                self.quantities.append(q)
+                self.types[q] = type(value)
+
+            # Fill the previous entries where the quantity was missing
+            if len(column) < i_entry:
+                column.extend([self.__missing_value(q)] * (i_entry - len(column)))
+
+            # Add the value
+            column.append(value)
+
+        # Count the entry
+        self.nb_entries += 1
+
+
+    ##############
+    #  Get data  #
+    ##############
+    def get_data(self, once=True):
+
+        '''
+
+        Fill the missing values at the end of the columns, and return
+        the data dictionary (one list per quantity). The $ONCE quantities
+        are added last, with the same value for every entry.
+
+        Argument
+        ========
+            once (bool): if False, leave out the $ONCE quantities
+
+        '''
+
+        # Fill the last entries where quantities are missing
+        data = dict()
+        for q in self.quantities:
+            column = self.columns[q]
+            if len(column) < self.nb_entries:
+                column.extend([self.__missing_value(q)] * (self.nb_entries - len(column)))
+            data[q] = column
+
+        # Apply the $ONCE quantities to every entry
+        if once:
+            for q in self.once:
+                data[q.split("$ONCE")[0]] = [self.once[q]] * self.nb_entries
+
+        # Return the data dictionary
+        return data
+
+
+    ###################
+    #  Missing value  #
+    ###################
+    def __missing_value(self, q):
+
+        '''
+
+        Return the value of a quantity for entries where it is missing.
+
+        Argument
+        ========
+            q (str): quantity label
+
+        '''
+
+        # Empty string for strings, and zero otherwise
+        if self.types[q] == str:
+            return ""
+        return 0
+
+
+###################
+#  Combine entry  #
+###################
+def combine_entry(entry):
+
+    '''
+
+    Combine the dictionaries of an entry (one per file line) into one
+    dictionary, where extra spaces are removed from strings. Quantities
+    found on several lines of the entry are labelled "q", "q 2", "q 3", etc.
+
+    Argument
+    ========
+        entry (list of dict): quantities found on each line of the entry
+
+    '''
+
+    # How many times each quantity appears within the entry
+    q_count = dict()
+
+    # For each quantity of each line ..
+    combined = dict()
+    for dct in entry:
+        for q, value in dct.items():
+
+            # Label the quantity depending on how many times it appeared
+            q_count[q] = q_count.get(q, 0) + 1
+            if q_count[q] > 1:
+                label = q+" "+str(q_count[q])
+            else:
+                label = q
+
+            # Remove extra spaces from strings (or lists of strings)
+            if isinstance(value, (str, np.str_)):
+                value = utils.remove_extra_spaces(value)
+            elif isinstance(value, (list, np.ndarray)):
+                for i_list in range(len(value)):
+                    if isinstance(value[i_list], (str, np.str_)):
+                        value[i_list] = utils.remove_extra_spaces(value[i_list])
+
+            # Add the quantity
+            combined[label] = value
+
+    # Return the combined dictionary
+    return combined
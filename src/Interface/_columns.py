@@ -0,0 +1,870 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Columnar (NumPy-backed) storage for the quantities of a data object.
+    Each column gives back one value per entry with column[i_entry], so
+    that data.data[quantity][i_entry] works the same way as with lists.
+    Values that are missing (None) are stored as a sentinel (NaN for
+    floats, see converters.missing_values) and flagged in a validity mask.
+
+'''
+
+# Import Python packages
+import numpy as np
+
+# Import Interface toolkit
+from . import converters as cv
+
+
+#######################
+#  Declare the class  #
+#######################
+class scalar_column( object ):
+
+    '''
+
+    Column holding one scalar (int, float, or str) per entry in a
+    single typed NumPy array.
+
+    Attributes
+    ==========
+        values (np.ndarray): one value per entry (int64, float64, or unicode)
+        valid (np.ndarray of bool): False where the value is missing (None if nothing is missing)
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, values, valid=None):
+
+        '''
+
+        Initialize the scalar_column class.
+
+        Arguments
+        =========
+            values (np.ndarray): one value per entry
+            valid (np.ndarray of bool): False where the value is missing
+
+        '''
+
+        # Keep the values and their validity
+        self.values = values
+        self.valid = valid
+
+
+    #########
+    #  Len  #
+    #########
+    def __len__(self):
+
+        '''
+
+        Return the number of entries in the column.
+
+        '''
+
+        # Return the number of values
+        return len(self.values)
+
+
+    #############
+    #  Getitem  #
+    #############
+    def __getitem__(self, i_entry):
+
+        '''
+
+        Return the value of an entry as a Python object (int, float, or str),
+        or None if the value is missing. If i_entry is a slice or an array
+        of indexes, return a new column.
+
+        Argument
+        ========
+            i_entry (int, slice, or array): entry index(es)
+
+        '''
+
+        # Return a single Python value
+        if isinstance(i_entry, (int, np.integer)):
+            if not self.valid is None and not self.valid[i_entry]:
+                return None
+            return self.values[i_entry].item()
+
+        # Return a sub-column
+        if self.valid is None:
+            return scalar_column(self.values[i_entry])
+        return scalar_column(self.values[i_entry], self.valid[i_entry])
+
+
+    #############
+    #  Setitem  #
+    #############
+    def __setitem__(self, i_entry, value):
+
+        '''
+
+        Overwrite the value of an entry.
+
+        Arguments
+        =========
+            i_entry (int): entry index
+            value (int, float, str, or None): new value
+
+        '''
+
+        # Flag missing values
+        if value is None:
+            if self.valid is None:
+                self.valid = np.ones(len(self.values), dtype=bool)
+            self.valid[i_entry] = False
+            self.values[i_entry] = missing_value(self.values.dtype)
+
+        # Overwrite the value
+        else:
+            self.values[i_entry] = value
+            if not self.valid is None:
+                self.valid[i_entry] = True
+
+
+    ##########
+    #  Iter  #
+    ##########
+    def __iter__(self):
+
+        '''
+
+        Iterate over the values of every entry, as Python objects.
+
+        '''
+
+        # Iterate over Python values
+        return iter(self.tolist())
+
+
+    ##########
+    #  Repr  #
+    ##########
+    def __repr__(self):
+
+        '''
+
+        Return the printable version of the column.
+
+        '''
+
+        # Return the values with the column type
+        if self.valid is None:
+            return "scalar_column("+repr(self.values)+")"
+        return "scalar_column("+repr(self.values)+", "+repr(self.valid)+")"
+
+
+    #############
+    #  To list  #
+    #############
+    def tolist(self):
+
+        '''
+
+        Return the column as a list of Python values (list storage),
+        where missing values are None.
+
+        '''
+
+        # Return the values as a list
+        if self.valid is None:
+            return self.values.tolist()
+        return cv.to_list(self.values, self.valid)
+
+
+    ###########
+    #  Dtype  #
+    ###########
+    @property
+    def dtype(self):
+
+        '''
+
+        Return the NumPy type of the values.
+
+        '''
+
+        # Return the type of the values
+        return self.values.dtype
+
+
+#######################
+#  Declare the class  #
+#######################
+class ragged_column( object ):
+
+    '''
+
+    Column holding one array (of variable length) per entry. All the
+    arrays are stored one after the other in a single flat array, and
+    the offsets array gives where each entry starts and ends.
+
+    Attributes
+    ==========
+        values (np.ndarray): items of every entry, one after the other
+        offsets (np.ndarray): entry i_entry is values[offsets[i_entry]:offsets[i_entry+1]]
+        valid (np.ndarray of bool): False where an item is missing (None if nothing is missing)
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, values, offsets, valid=None):
+
+        '''
+
+        Initialize the ragged_column class.
+
+        Arguments
+        =========
+            values (np.ndarray): items of every entry, one after the other
+            offsets (np.ndarray): nb_entries+1 indexes delimiting each entry
+            valid (np.ndarray of bool): False where an item is missing
+
+        '''
+
+        # Keep the values, their delimitations, and their validity
+        self.values = values
+        self.offsets = offsets
+        self.valid = valid
+
+
+    #########
+    #  Len  #
+    #########
+    def __len__(self):
+
+        '''
+
+        Return the number of entries in the column.
+
+        '''
+
+        # Return the number of entries
+        return len(self.offsets) - 1
+
+
+    #############
+    #  Getitem  #
+    #############
+    def __getitem__(self, i_entry):
+
+        '''
+
+        Return the array of an entry (a view on the flat array). If
+        items are missing, return a copy where they are None instead.
+        If i_entry is a slice or an array of indexes, return a new column.
+
+        Argument
+        ========
+            i_entry (int, slice, or array): entry index(es)
+
+        '''
+
+        # Return the array of a single entry
+        if isinstance(i_entry, (int, np.integer)):
+            if i_entry < 0:
+                i_entry += len(self)
+            if i_entry < 0 or i_entry >= len(self):
+                raise IndexError("ragged_column index out of range")
+            return self.__entry(self.offsets[i_entry], self.offsets[i_entry+1])
+
+        # Return a sub-column
+        i_entries = np.arange(len(self))[i_entry]
+        return take_ragged(self, i_entries)
+
+
+    ##########
+    #  Iter  #
+    ##########
+    def __iter__(self):
+
+        '''
+
+        Iterate over the arrays of every entry.
+
+        '''
+
+        # Iterate over views on the flat array
+        offsets = self.offsets.tolist()
+        for i_entry in range(len(self)):
+            yield self.__entry(offsets[i_entry], offsets[i_entry+1])
+
+
+    ###########
+    #  Entry  #
+    ###########
+    def __entry(self, i_low, i_upp):
+
+        '''
+
+        Return the items between two offsets, as a view on the flat
+        array, or as a copy with None for missing items.
+
+        Arguments
+        =========
+            i_low (int): index of the first item
+            i_upp (int): index after the last item
+
+        '''
+
+        # Return a view if no item is missing
+        arr = self.values[i_low:i_upp]
+        if self.valid is None or self.valid[i_low:i_upp].all():
+            return arr
+
+        # Replace the missing items by None
+        return np.array(cv.to_list(arr, self.valid[i_low:i_upp]))
+
+
+    ##########
+    #  Repr  #
+    ##########
+    def __repr__(self):
+
+        '''
+
+        Return the printable version of the column.
+
+        '''
+
+        # Return the values and offsets with the column type
+        if self.valid is None:
+            return "ragged_column("+repr(self.values)+", "+repr(self.offsets)+")"
+        return "ragged_column("+repr(self.values)+", "+repr(self.offsets)+", "+repr(self.valid)+")"
+
+
+    #############
+    #  To list  #
+    #############
+    def tolist(self):
+
+        '''
+
+        Return the column as a list of NumPy arrays (list storage),
+        where missing items are None.
+
+        '''
+
+        # Return a copy of each entry
+        return [np.array(arr) for arr in self]
+
+
+    #############
+    #  Lengths  #
+    #############
+    def lengths(self):
+
+        '''
+
+        Return the number of items in each entry.
+
+        '''
+
+        # Return the difference between consecutive offsets
+        return np.diff(self.offsets)
+
+
+    ###########
+    #  Dtype  #
+    ###########
+    @property
+    def dtype(self):
+
+        '''
+
+        Return the NumPy type of the values.
+
+        '''
+
+        # Return the type of the values
+        return self.values.dtype
+
+
+###############
+#  Is column  #
+###############
+def is_column(column):
+
+    '''
+
+    Return True if the input is a scalar_column or a ragged_column.
+
+    Argument
+    ========
+        column: values of a quantity (list or column)
+
+    '''
+
+    # Return whether this is a columnar storage
+    return isinstance(column, (scalar_column, ragged_column))
+
+
+###############
+#  To column  #
+###############
+def to_column(entries):
+
+    '''
+
+    Convert the list of values of a quantity (one item per entry) into
+    a scalar_column or a ragged_column. Values (or array items) that are
+    None are flagged as missing in the validity mask of the column. The
+    input list is returned as is if the values cannot be stored in a
+    typed NumPy array (e.g. if they mix strings and digits).
+
+    Argument
+    ========
+        entries (list): value of a quantity for each entry
+
+    '''
+
+    # Return the input if this is already a column, or if there is nothing to store
+    if is_column(entries) or len(entries) == 0:
+        return entries
+
+    # Find the types present in the list
+    types = set(map(type, entries))
+
+    # If every entry is an array ..
+    if types <= {list, np.ndarray}:
+        arrays = [np.asarray(arr) for arr in entries]
+        if not all(arr.ndim == 1 for arr in arrays):
+            return entries
+
+        # Set apart the missing items of each array
+        arrays = [_typed_array(arr) for arr in arrays]
+        if None in arrays:
+            return entries
+
+        # Find the type that can hold every array (ignoring those without items)
+        dtype = _common_dtype([arr.dtype for arr, valid in arrays \
+                               if valid is None or valid.any()])
+        if dtype is None:
+            return entries
+
+        # Build the flat array and the offsets
+        offsets = np.zeros(len(arrays)+1, dtype=np.int64)
+        np.cumsum([len(arr) for arr, valid in arrays], out=offsets[1:])
+        values = np.concatenate([arr.astype(dtype) if valid is None or valid.any() else \
+            np.full(len(arr), missing_value(dtype), dtype=dtype) for arr, valid in arrays])
+
+        # Build the validity mask if some items are missing
+        valid = None
+        if any(not v is None for arr, v in arrays):
+            valid = np.concatenate([np.ones(len(arr), dtype=bool) if v is None else v \
+                                    for arr, v in arrays])
+        return ragged_column(values, offsets, valid)
+
+    # Set apart the missing values
+    valid = None
+    if type(None) in types:
+        types.discard(type(None))
+        valid = np.array([not value is None for value in entries], dtype=bool)
+        if len(types) == 0:
+            return entries
+
+    # Find the type of the column
+    if types <= {str, np.str_}:
+        dtype = np.dtype(str)
+    elif types <= {int, np.int64}:
+        dtype = np.dtype(np.int64)
+    elif types <= {int, float, np.int64, np.float64}:
+        dtype = np.dtype(np.float64)
+
+    # Keep the list if the types are not compatible
+    else:
+        return entries
+
+    # Replace the missing values by the sentinel
+    if not valid is None:
+        sentinel = missing_value(dtype)
+        entries = [sentinel if value is None else value for value in entries]
+
+    # Return the column (integers are converted to floats if needed)
+    try:
+        return scalar_column(np.array(entries, dtype=dtype), valid)
+    except OverflowError:
+        return entries
+
+
+#################
+#  Typed array  #
+#################
+def _typed_array(arr):
+
+    '''
+
+    Return an array of a ragged quantity as a typed array, where None
+    items are replaced by a sentinel, along with the validity of each item
+    (None if nothing is missing). Return None if there is no typed array
+    that can hold the items.
+
+    Argument
+    ========
+        arr (np.ndarray): items of one entry
+
+    '''
+
+    # Return typed arrays directly
+    if not arr.dtype == object:
+        return arr, None
+
+    # Set apart the missing items
+    items = arr.tolist()
+    valid = np.array([not item is None for item in items], dtype=bool)
+    present = [item for item in items if not item is None]
+
+    # Find the type of the items that are not missing
+    typed = np.array(present)
+    if len(present) == 0:
+        typed = np.zeros(0, dtype=np.float64)
+    if not typed.dtype.kind in ["i", "u", "f", "U"] or not typed.ndim == 1:
+        return None
+
+    # Return the items with the sentinel in place of the missing ones
+    values = np.full(len(items), missing_value(typed.dtype), dtype=typed.dtype)
+    values[valid] = typed
+    return values, valid
+
+
+###################
+#  Missing value  #
+###################
+def missing_value(dtype):
+
+    '''
+
+    Return the sentinel stored in place of missing values in a column
+    (see converters.missing_values).
+
+    Argument
+    ========
+        dtype (np.dtype): type of the column values
+
+    '''
+
+    # Return the sentinel of the Python type matching the NumPy type
+    if dtype.kind in ["i", "u"]:
+        return cv.missing_values[int]
+    if dtype.kind == "f":
+        return cv.missing_values[float]
+    return cv.missing_values[str]
+
+
+##################
+#  Common dtype  #
+##################
+def _common_dtype(dtypes):
+
+    '''
+
+    Return the NumPy type that can hold all arrays of a ragged quantity,
+    or None if the arrays cannot be combined into one typed array.
+
+    Argument
+    ========
+        dtypes (list of np.dtype): type of each array
+
+    '''
+
+    # Collect the kinds of arrays (int, float, unicode)
+    kinds = set(dt.kind for dt in dtypes)
+
+    # Return the common type (float if there is no item at all)
+    if len(kinds) == 0:
+        return np.dtype(np.float64)
+    if kinds <= {"i", "u"}:
+        return np.dtype(np.int64)
+    if kinds <= {"i", "u", "f"}:
+        return np.dtype(np.float64)
+    if kinds == {"U"}:
+        return np.result_type(*dtypes)
+
+    # Return None if the arrays cannot be combined
+    return None
+
+
+#################
+#  Take ragged  #
+#################
+def take_ragged(column, i_entries):
+
+    '''
+
+    Return a new ragged_column made of selected entries of a ragged_column.
+
+    Arguments
+    =========
+        column (ragged_column): input column
+        i_entries (np.ndarray of int): indexes of the selected entries
+
+    '''
+
+    # Find the number of items of each selected entry
+    starts = column.offsets[:-1][i_entries]
+    lengths = column.offsets[1:][i_entries] - starts
+
+    # Build the new offsets
+    offsets = np.zeros(len(i_entries)+1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    # Find the flat index of every selected item
+    i_items = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+
+    # Return the new column
+    if column.valid is None:
+        return ragged_column(column.values[i_items], offsets)
+    return ragged_column(column.values[i_items], offsets, column.valid[i_items])
+
+
+#################
+#  Segment any  #
+#################
+def segment_any(mask, offsets):
+
+    '''
+
+    Return, for each entry of a ragged layout, whether at least one of
+    its items is True in a flat boolean array.
+
+    Arguments
+    =========
+        mask (np.ndarray of bool): one boolean per item
+        offsets (np.ndarray of int): nb_entries+1 indexes delimiting each entry
+
+    '''
+
+    # Count the True items before each offset
+    counts = np.zeros(len(mask)+1, dtype=np.int64)
+    np.cumsum(mask, out=counts[1:])
+
+    # Return True for entries with at least one True item
+    return (counts[offsets[1:]] - counts[offsets[:-1]]) > 0
+
+
+#################
+#  Mask ragged  #
+#################
+def mask_ragged(column, keep, item_mask, item_offsets):
+
+    '''
+
+    Return a new ragged_column with only the kept entries of a column.
+    Within kept entries that have the same number of items as the
+    item_mask layout, only the items flagged as True are kept.
+
+    Arguments
+    =========
+        column (ragged_column): input column
+        keep (np.ndarray of bool): one boolean per entry
+        item_mask (np.ndarray of bool): one boolean per item of the mask layout
+        item_offsets (np.ndarray of int): nb_entries+1 indexes delimiting the mask layout
+
+    '''
+
+    # Find the entry of every item of the column
+    lengths = column.lengths()
+    i_entry_items = np.repeat(np.arange(len(lengths)), lengths)
+
+    # Find the entries where items should be masked
+    match = lengths == np.diff(item_offsets)
+    match_items = match[i_entry_items]
+
+    # First keep every item of the kept entries
+    item_keep = keep[i_entry_items]
+
+    # Apply the item mask where the number of items match
+    i_sel = np.flatnonzero(match_items & item_keep)
+    if len(i_sel) > 0:
+        i_in_entry = i_sel - column.offsets[:-1][i_entry_items[i_sel]]
+        i_mask = item_offsets[:-1][i_entry_items[i_sel]] + i_in_entry
+        item_keep[i_sel] = item_mask[i_mask]
+
+    # Build the new offsets from the number of kept items per kept entry
+    nb_items = np.bincount(i_entry_items[item_keep], minlength=len(lengths))[keep]
+    offsets = np.zeros(len(nb_items)+1, dtype=np.int64)
+    np.cumsum(nb_items, out=offsets[1:])
+
+    # Return the new column
+    if column.valid is None:
+        return ragged_column(column.values[item_keep], offsets)
+    return ragged_column(column.values[item_keep], offsets, column.valid[item_keep])
+
+
+#################
+#  Concatenate  #
+#################
+def concatenate(columns):
+
+    '''
+
+    Return the entries of several columns (or lists) of the same
+    quantity, one after the other, in a single column. A list is
+    returned if the values cannot be stored in a typed NumPy array.
+
+    Argument
+    ========
+        columns (list): columns (or lists) to be combined
+
+    '''
+
+    # Combine scalar columns directly if their types are compatible
+    if all(isinstance(column, scalar_column) for column in columns):
+        dtype = _common_dtype([column.dtype for column in columns])
+        if not dtype is None:
+            values = np.concatenate([column.values.astype(dtype) for column in columns])
+            return scalar_column(values, _concatenate_valid(columns))
+
+    # Combine ragged columns directly if their types are compatible
+    if all(isinstance(column, ragged_column) for column in columns):
+        dtype = _common_dtype([column.dtype for column in columns if len(column.values) > 0])
+        if not dtype is None:
+            values = np.concatenate([column.values.astype(dtype) for column in columns])
+            offsets = [np.zeros(1, dtype=np.int64)]
+            for column in columns:
+                offsets.append(column.offsets[1:] + offsets[-1][-1])
+            return ragged_column(values, np.concatenate(offsets), _concatenate_valid(columns))
+
+    # Combine the entries one by one otherwise
+    entries = []
+    for column in columns:
+        entries += column.tolist() if is_column(column) else list(column)
+    return to_column(entries)
+
+
+#######################
+#  Concatenate valid  #
+#######################
+def _concatenate_valid(columns):
+
+    '''
+
+    Return the validity masks of several columns, one after the other,
+    or None if no value is missing in any of the columns.
+
+    Argument
+    ========
+        columns (list): scalar_column or ragged_column to be combined
+
+    '''
+
+    # Return None if nothing is missing
+    if all(column.valid is None for column in columns):
+        return None
+
+    # Combine the masks (every value is valid in columns without mask)
+    return np.concatenate([np.ones(len(column.values), dtype=bool) \
+        if column.valid is None else column.valid for column in columns])
+
+
+##################
+#  Unlog column  #
+##################
+def unlog_column(column):
+
+    '''
+
+    Return a new column (same layout) with 10**value for every value of
+    a digit column. Integer columns stay integers if every value is
+    between 0 and 18 (exact powers of 10), and become floats otherwise.
+    Missing values stay missing.
+
+    Argument
+    ========
+        column (scalar_column or ragged_column): logged values
+
+    '''
+
+    # Copy the validity mask, and find the values that are not missing
+    valid = None if column.valid is None else column.valid.copy()
+    present = column.values if valid is None else column.values[valid]
+
+    # Keep exact integers if possible
+    if column.dtype.kind in ["i", "u"] and \
+       (len(present) == 0 or (present.min() >= 0 and present.max() <= 18)):
+        exponents = column.values if valid is None else np.where(valid, column.values, 0)
+        values = np.power(10, exponents.astype(np.int64))
+
+    # Un-log as floats otherwise (overflows give inf)
+    else:
+        with np.errstate(over="ignore", invalid="ignore"):
+            values = np.power(10.0, column.values.astype(np.float64))
+
+    # Return the un-logged column
+    return _like(column, values, valid)
+
+
+################
+#  Log column  #
+################
+def log_column(column, log_zero):
+
+    '''
+
+    Return a new column (same layout) with the log10 of every value of a
+    column. Zeros are set to log_zero, while negative values and values
+    that are not digits are missing.
+
+    Arguments
+    =========
+        column (scalar_column or ragged_column): values to be logged
+        log_zero (float): value given to log10(0)
+
+    '''
+
+    # Find the values that are valid digits
+    valid = np.ones(len(column.values), dtype=bool) if column.valid is None else column.valid
+    if column.dtype.kind in ["i", "u", "f"]:
+        values = column.values.astype(np.float64)
+    else:
+        values = np.zeros(len(column.values), dtype=np.float64)
+        valid = np.zeros(len(column.values), dtype=bool)
+
+    # Log the positive values, and set log_zero for zeros
+    positive = valid & (values > 0)
+    zero = valid & (values == 0)
+    logged = np.full(len(values), cv.missing_values[float], dtype=np.float64)
+    np.log10(values, out=logged, where=positive)
+    logged[zero] = log_zero
+
+    # Return the logged column (everything else is missing)
+    valid = positive | zero
+    return _like(column, logged, None if valid.all() else valid)
+
+
+##########
+#  Like  #
+##########
+def _like(column, values, valid):
+
+    '''
+
+    Return a column with the same layout (scalar or ragged) as a given
+    column, holding new values.
+
+    Arguments
+    =========
+        column (scalar_column or ragged_column): column giving the layout
+        values (np.ndarray): one value per entry (or per item)
+        valid (np.ndarray of bool): False where the value is missing
+
+    '''
+
+    # Put the sentinel in place of missing values
+    if not valid is None:
+        values[~valid] = missing_value(values.dtype)
+
+    # Return the column
+    if isinstance(column, ragged_column):
+        return ragged_column(values, column.offsets.copy(), valid)
+    return scalar_column(values, valid)
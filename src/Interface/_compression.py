@@ -0,0 +1,105 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Transparent reading and writing of compressed data files (gzip, bz2,
+    and xz), through the codecs of the Python standard library. Files are
+    decompressed (or compressed) on the fly, one block at a time, so that
+    they never need to be fully decompressed in memory or on disk.
+
+'''
+
+# Import Python packages
+import os
+import bz2
+import gzip
+import lzma
+
+
+# Function opening each type of compressed file, and the name of its compression level argument
+_codecs = {"gzip": (gzip.open, "compresslevel"), \
+           "bz2": (bz2.open, "compresslevel"), \
+           "xz": (lzma.open, "preset")}
+
+# Compression of each file extension
+_extensions = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+
+# First bytes of each type of compressed file
+_magic_bytes = [(b"\x1f\x8b", "gzip"), (b"\xfd7zXZ\x00", "xz"), \
+                (b"BZh1", "bz2"), (b"BZh2", "bz2"), (b"BZh3", "bz2"), \
+                (b"BZh4", "bz2"), (b"BZh5", "bz2"), (b"BZh6", "bz2"), \
+                (b"BZh7", "bz2"), (b"BZh8", "bz2"), (b"BZh9", "bz2")]
+
+
+############
+#  Detect  #
+############
+def detect(path, read_magic=True):
+
+    '''
+
+    Return the compression of a file ("gzip", "bz2", or "xz"), or None
+    if the file is not compressed. The compression is given by the file
+    extension (.gz, .bz2, .xz), or otherwise by the first bytes of the
+    file if it exists.
+
+    Arguments
+    =========
+        path (str): path to the file
+        read_magic (bool): if True, look at the first bytes of the file when
+                           the extension is not one of a compressed file
+
+    '''
+
+    # Use the file extension if possible
+    extension = os.path.splitext(path)[1].lower()
+    if extension in _extensions:
+        return _extensions[extension]
+
+    # Look at the first bytes of the file otherwise
+    if read_magic and os.path.isfile(path):
+        with open(path, "rb") as f:
+            head = f.read(6)
+        for magic, compression in _magic_bytes:
+            if head.startswith(magic):
+                return compression
+
+    # The file is not compressed
+    return None
+
+
+###############
+#  Open file  #
+###############
+def open_file(path, mode="r", level=None):
+
+    '''
+
+    Open a file that may be compressed, and return the file object. In
+    text modes ("r", "w", "a"), lines are read and written as strings,
+    like with the built-in open. Files being written are compressed if
+    their extension is one of a compressed file (see detect), while files
+    being read (or appended) are also recognized by their first bytes.
+
+    Arguments
+    =========
+        path (str): path to the file
+        mode (str): "r", "w", or "a", followed by "b" for binary mode
+        level (int): compression level of written files (None for the default
+                     of each codec: 9 for gzip and bz2, 6 for xz)
+
+    '''
+
+    # Open the file directly if not compressed
+    compression = detect(path, read_magic=not mode.startswith("w"))
+    if compression == None:
+        return open(path, mode)
+
+    # Open the file through its codec (in text mode unless binary is asked)
+    function, level_name = _codecs[compression]
+    if not "b" in mode:
+        mode += "t"
+    if level == None or mode.startswith("r"):
+        return function(path, mode)
+    return function(path, mode, **{level_name: level})
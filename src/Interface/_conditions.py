@@ -0,0 +1,725 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Vectorized evaluation of filtering conditions over the columns
+    (see _columns.py) of a data object.
+
+'''
+
+# Import Python packages
+import collections
+import re
+import numpy as np
+
+# Import Interface toolkit
+from . import columns as cc
+
+
+# One parsed comparison (leaf of a condition expression)
+#   quantity (str): quantity on which the condition is applied
+#   operator (str): =, !=, >=, >, <=, <, in, or not in
+#   value (float or str): number compared with the quantity,
+#                         or string searched within the quantity (in, not in)
+predicate = collections.namedtuple("predicate", ["quantity", "operator", "value"])
+
+# Logical combination of conditions (node of a condition expression)
+#   operator (str): and, or, or not
+#   terms (tuple): predicates and/or expressions to be combined
+expression = collections.namedtuple("expression", ["operator", "terms"])
+
+# Math operators applied on whole arrays
+_math_operators = {"=": np.equal, "!=": np.not_equal, \
+                   ">=": np.greater_equal, ">": np.greater, \
+                   "<=": np.less_equal, "<": np.less}
+
+# Logical operators applied on whole arrays
+_logical_operators = {"and": np.logical_and, "or": np.logical_or}
+
+# Words that cannot be part of an (unquoted) operand
+_keywords = ["and", "or", "not", "in"]
+
+# Quoted string, comparison operator, or word
+_token_pattern = re.compile(r"""\s*(?:("[^"]*"|'[^']*')|(!=|>=|<=|==|=|>|<)|((?:[^\s=<>!"']|!(?!=))+))""")
+
+# Condition expressions already compiled, identified by their text
+# (from the least to the most recently used)
+_cache = collections.OrderedDict()
+_cache_max_size = 1024
+
+
+# Error raised internally when a condition cannot be parsed
+class _syntax_error( Exception ):
+    pass
+
+
+########################
+#  Compile conditions  #
+########################
+def compile_conditions(conditions):
+
+    '''
+
+    Compile a list of conditions into a single expression tree, where
+    the conditions of the list are combined with "and". Each condition
+    can combine comparisons with and, or, not, and parentheses, such as
+    (T9 > 1 and rate < 1e-3) or "ne22" in reaction. Return None if one
+    of the conditions cannot be compiled.
+
+    Argument
+    ========
+        conditions (list of str): conditions to filter data
+
+    '''
+
+    # Compile each condition
+    terms = []
+    for condition in conditions:
+        node = compile_expression(condition)
+        if node is None:
+            return None
+        terms.append(node)
+
+    # Return the combined conditions
+    if len(terms) == 1:
+        return terms[0]
+    return expression("and", tuple(terms))
+
+
+########################
+#  Compile expression  #
+########################
+def compile_expression(condition):
+
+    '''
+
+    Compile one condition into an expression tree made of predicates
+    (leaves) and expressions (and, or, not). Compiled conditions are
+    kept in memory and reused when the same text is provided again (up
+    to _cache_max_size conditions, the least recently used are forgotten).
+    Return None if the condition cannot be compiled.
+
+    Operands are made of one or several words. Quotes must be used if
+    an operand includes and, or, not, in, an operator, or a parenthesis
+    that is not part of a word (e.g. "p (n,g)" in reaction).
+
+    Argument
+    ========
+        condition (str): condition to filter data
+
+    '''
+
+    # Return the compiled condition if already available
+    node = _cache.get(condition, None)
+    if not node is None:
+        _cache.move_to_end(condition)
+        return node
+
+    # Split the condition into tokens and build the expression tree
+    try:
+        parser = _parser(_tokenize(condition), condition)
+        node = parser.parse()
+    except _syntax_error as e:
+        print("Error -", e)
+        return None
+
+    # Keep the compiled condition in memory (forgetting the least recently used)
+    if len(_cache) >= _cache_max_size:
+        _cache.popitem(last=False)
+    _cache[condition] = node
+
+    # Return the compiled condition
+    return node
+
+
+##############
+#  Tokenize  #
+##############
+def _tokenize(condition):
+
+    '''
+
+    Split a condition into a list of (kind, text) tokens, where kind
+    is "str" (quoted string), "op" (comparison operator), "word", "(",
+    or ")". Parentheses are only separated from a word if they are not
+    balanced within the word, so "fe56(n,g)" stays a single word.
+
+    Argument
+    ========
+        condition (str): condition to filter data
+
+    '''
+
+    # Declare the list of tokens
+    tokens = []
+    i_char = 0
+
+    # For each token in the condition ..
+    while i_char < len(condition):
+        match = _token_pattern.match(condition, i_char)
+        if match is None or match.end() == i_char:
+            if len(condition[i_char:].strip()) == 0:
+                break
+            raise _syntax_error("Could not read "+condition[i_char:].strip()+" in "+condition)
+        i_char = match.end()
+        quoted, operator, word = match.groups()
+
+        # Add strings and operators directly
+        if not quoted is None:
+            tokens.append(("str", quoted[1:-1]))
+        elif not operator is None:
+            tokens.append(("op", "=" if operator == "==" else operator))
+
+        # Separate unbalanced parentheses from words
+        elif not word is None:
+            while word.startswith("(") and word.count("(") > word.count(")"):
+                tokens.append(("(", "("))
+                word = word[1:]
+            nb_close = 0
+            while word.endswith(")") and word.count(")") > word.count("("):
+                word = word[:-1]
+                nb_close += 1
+            if len(word) > 0:
+                tokens.append(("word", word))
+            tokens += [(")", ")")] * nb_close
+
+    # Return the list of tokens
+    return tokens
+
+
+#######################
+#  Declare the class  #
+#######################
+class _parser( object ):
+
+    '''
+
+    Recursive-descent parser turning the tokens of a condition into an
+    expression tree. "or" has the lowest priority, then "and", then "not".
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, tokens, condition):
+
+        '''
+
+        Initialize the _parser class.
+
+        Arguments
+        =========
+            tokens (list): (kind, text) tokens of the condition
+            condition (str): original condition (for error messages)
+
+        '''
+
+        # Keep the tokens and the current position
+        self.tokens = tokens
+        self.condition = condition
+        self.i_token = 0
+
+
+    ###########
+    #  Parse  #
+    ###########
+    def parse(self):
+
+        '''
+
+        Return the expression tree of the whole condition.
+
+        '''
+
+        # Error if there is nothing to parse
+        if len(self.tokens) == 0:
+            raise _syntax_error("Empty condition.")
+
+        # Parse the condition and make sure every token was used
+        node = self.__parse_or()
+        if self.i_token < len(self.tokens):
+            raise _syntax_error("Unexpected "+self.tokens[self.i_token][1]+" in "+self.condition)
+
+        # Return the expression tree
+        return node
+
+
+    ##############
+    #  Parse or  #
+    ##############
+    def __parse_or(self):
+
+        '''
+
+        Parse terms separated by "or".
+
+        '''
+
+        # Collect the terms and combine them
+        terms = [self.__parse_and()]
+        while self.__peek_word("or"):
+            self.i_token += 1
+            terms.append(self.__parse_and())
+        return terms[0] if len(terms) == 1 else expression("or", tuple(terms))
+
+
+    ###############
+    #  Parse and  #
+    ###############
+    def __parse_and(self):
+
+        '''
+
+        Parse terms separated by "and".
+
+        '''
+
+        # Collect the terms and combine them
+        terms = [self.__parse_not()]
+        while self.__peek_word("and"):
+            self.i_token += 1
+            terms.append(self.__parse_not())
+        return terms[0] if len(terms) == 1 else expression("and", tuple(terms))
+
+
+    ###############
+    #  Parse not  #
+    ###############
+    def __parse_not(self):
+
+        '''
+
+        Parse a negation, a parenthesized expression, or a comparison.
+
+        '''
+
+        # Negate the following term
+        if self.__peek_word("not"):
+            self.i_token += 1
+            return expression("not", (self.__parse_not(),))
+
+        # Parse the expression within parentheses
+        if self.__peek_kind("("):
+            self.i_token += 1
+            node = self.__parse_or()
+            if not self.__peek_kind(")"):
+                raise _syntax_error("Missing closing parenthesis in "+self.condition)
+            self.i_token += 1
+            return node
+
+        # Parse a comparison
+        return self.__parse_comparison()
+
+
+    ######################
+    #  Parse comparison  #
+    ######################
+    def __parse_comparison(self):
+
+        '''
+
+        Parse "left operator right", and return the predicate.
+
+        '''
+
+        # Read the left-hand side
+        left = self.__parse_operand()
+        if left == None:
+            raise _syntax_error("Side(s) missing in "+self.condition)
+
+        # Read the operator
+        if self.__peek_kind("op"):
+            operator = self.tokens[self.i_token][1]
+            self.i_token += 1
+        elif self.__peek_word("in"):
+            operator = "in"
+            self.i_token += 1
+        elif self.__peek_word("not") and self.__peek_word("in", 1):
+            operator = "not in"
+            self.i_token += 2
+        else:
+            raise _syntax_error("No operator was found in: "+self.condition+\
+                "\n  Valid operators are [=, !=, >=, >, <=, <, in, not in].")
+
+        # Read the right-hand side
+        right = self.__parse_operand()
+        if right == None:
+            raise _syntax_error("Side(s) missing in "+self.condition)
+
+        # The quantity is on the right side for in and not-in
+        if operator in ["in", "not in"]:
+            return predicate(right, operator, left)
+
+        # The quantity is on the left side for math operators
+        try:
+            value = float(right)
+        except ValueError:
+            raise _syntax_error(right+" should be a digit in "+left+" "+operator+" "+right)
+        return predicate(left, operator, value)
+
+
+    ###################
+    #  Parse operand  #
+    ###################
+    def __parse_operand(self):
+
+        '''
+
+        Parse a (possibly multi-word) operand, and return it as a single
+        string (None if there is no operand).
+
+        '''
+
+        # Collect words until an operator, a keyword, or a parenthesis
+        words = []
+        while self.i_token < len(self.tokens):
+            kind, text = self.tokens[self.i_token]
+            if kind == "str" or (kind == "word" and not text in _keywords):
+                words.append(text)
+                self.i_token += 1
+            else:
+                break
+
+        # Return the operand
+        if len(words) == 0:
+            return None
+        return " ".join(words)
+
+
+    ###############
+    #  Peek kind  #
+    ###############
+    def __peek_kind(self, kind, shift=0):
+
+        '''
+
+        Return True if the upcoming token is of a given kind.
+
+        '''
+
+        # Check the kind of the upcoming token
+        i_token = self.i_token + shift
+        return i_token < len(self.tokens) and self.tokens[i_token][0] == kind
+
+
+    ###############
+    #  Peek word  #
+    ###############
+    def __peek_word(self, word, shift=0):
+
+        '''
+
+        Return True if the upcoming token is a given (unquoted) word.
+
+        '''
+
+        # Check the upcoming token
+        return self.__peek_kind("word", shift) and \
+               self.tokens[self.i_token + shift][1] == word
+
+
+#####################
+#  Iter predicates  #
+#####################
+def iter_predicates(node):
+
+    '''
+
+    Yield every predicate (leaf) of an expression tree.
+
+    Argument
+    ========
+        node (predicate or expression): compiled condition
+
+    '''
+
+    # Yield the predicate, or the predicates of every term
+    if isinstance(node, predicate):
+        yield node
+    else:
+        for term in node.terms:
+            for pred in iter_predicates(term):
+                yield pred
+
+
+#########################
+#  Evaluate conditions  #
+#########################
+def evaluate_conditions(node, get_column, indexes=dict()):
+
+    '''
+
+    Evaluate a compiled condition over whole columns. Return keep (one
+    boolean per entry), and, if some predicates apply on array quantities,
+    item_mask (one boolean per array item) with its item_offsets (see
+    ragged_column). Return None if at least one predicate cannot be
+    evaluated over columns (e.g. a quantity stored as a list).
+
+    Arguments
+    =========
+        node (predicate or expression): compiled condition
+        get_column (function): return the column of a quantity
+        indexes (dict): quantity_index (see _index.py) of indexed quantities
+
+    '''
+
+    # Evaluate the expression tree
+    outcome = _evaluate_node(node, get_column, indexes)
+    if outcome is None:
+        return None
+    mask, offsets, decided = outcome
+
+    # Return the entry mask if there is no array quantity involved
+    if offsets is None:
+        return mask, None, None
+
+    # Only keep entries where at least one item satisfies the conditions,
+    # unless the outcome of the entry is a single boolean
+    keep = cc.segment_any(mask, offsets)
+    if not decided is None:
+        keep = np.where(decided[0], decided[1], keep)
+    return keep, mask, offsets
+
+
+###################
+#  Evaluate node  #
+###################
+def _evaluate_node(node, get_column, indexes):
+
+    '''
+
+    Return (mask, offsets, decided) for a node of the expression tree,
+    where offsets is None for entry masks (see evaluate_predicate). When
+    an entry mask is combined with an item mask, the entry mask is repeated
+    over the items of each entry. Like evaluate_entry, the outcome of an
+    entry is a single boolean (rather than one per item) if it is decided
+    by entry masks alone (e.g. True or ..., False and ...). decided is
+    either None, or (is_decided, value) with one boolean per entry, and
+    the items of decided entries are all set to their value. Return None
+    if the node cannot be evaluated over columns. Indexed quantities are
+    looked up in their index instead of being scanned, when possible.
+
+    Arguments
+    =========
+        node (predicate or expression): compiled condition
+        get_column (function): return the column of a quantity
+        indexes (dict): quantity_index (see _index.py) of indexed quantities
+
+    '''
+
+    # Evaluate a comparison, using the index of the quantity if available
+    if isinstance(node, predicate):
+        outcome = None
+        if node.quantity in indexes:
+            outcome = indexes[node.quantity].evaluate(node)
+        if outcome is None:
+            outcome = evaluate_predicate(node, get_column(node.quantity))
+        if outcome is None:
+            return None
+        return outcome[0], outcome[1], None
+
+    # Evaluate the terms of the expression
+    outcomes = []
+    for term in node.terms:
+        outcome = _evaluate_node(term, get_column, indexes)
+        if outcome is None:
+            return None
+        outcomes.append(outcome)
+
+    # Negate the term
+    if node.operator == "not":
+        mask, offsets, decided = outcomes[0]
+        if not decided is None:
+            decided = (decided[0], ~decided[1])
+        return ~mask, offsets, decided
+
+    # Find the layout of the item masks, which must be the same for all terms
+    offsets = None
+    for other_mask, other_offsets, other_decided in outcomes:
+        if offsets is None:
+            offsets = other_offsets
+        elif not other_offsets is None and not np.array_equal(offsets, other_offsets):
+            return None
+
+    # Combine entry masks directly if there is no item mask
+    operator = _logical_operators[node.operator]
+    if offsets is None:
+        mask = outcomes[0][0]
+        for other_mask, other_offsets, other_decided in outcomes[1:]:
+            mask = operator(mask, other_mask)
+        return mask, None, None
+
+    # Entries are decided by a True term for or, and by a False term for and
+    lengths = np.diff(offsets)
+    stop_value = node.operator == "or"
+    stopped = np.zeros(len(lengths), dtype=bool)
+    all_decided = np.ones(len(lengths), dtype=bool)
+
+    # Combine the terms one by one (repeating entry masks over array items)
+    mask = None
+    for other_mask, other_offsets, other_decided in outcomes:
+        if other_offsets is None:
+            stopped |= other_mask == stop_value
+            other_mask = np.repeat(other_mask, lengths)
+        elif other_decided is None:
+            all_decided[:] = False
+        else:
+            stopped |= other_decided[0] & (other_decided[1] == stop_value)
+            all_decided &= other_decided[0]
+        mask = other_mask if mask is None else operator(mask, other_mask)
+
+    # Return the combined mask if no entry is decided
+    is_decided = stopped | all_decided
+    if not is_decided.any():
+        return mask, offsets, None
+
+    # Set the items of decided entries to the value of the entry
+    value = stopped if stop_value else ~stopped
+    mask = np.where(np.repeat(is_decided, lengths), np.repeat(value, lengths), mask)
+    return mask, offsets, (is_decided, value)
+
+
+####################
+#  Evaluate entry  #
+####################
+def evaluate_entry(node, apply_predicate):
+
+    '''
+
+    Evaluate a compiled condition for a single entry. Return a boolean,
+    a boolean array (one per item of an array quantity), or None if
+    something went wrong. This is used when conditions cannot be evaluated
+    over whole columns.
+
+    Arguments
+    =========
+        node (predicate or expression): compiled condition
+        apply_predicate (function): return the outcome of a predicate for the entry
+
+    '''
+
+    # Evaluate a comparison
+    if isinstance(node, predicate):
+        return apply_predicate(node)
+
+    # Negate the term
+    if node.operator == "not":
+        outcome = evaluate_entry(node.terms[0], apply_predicate)
+        if isinstance(outcome, np.ndarray):
+            return ~outcome
+        if outcome is None:
+            return None
+        return not outcome
+
+    # For each term to be combined ..
+    combined = None
+    for term in node.terms:
+        outcome = evaluate_entry(term, apply_predicate)
+        if outcome is None:
+            return None
+
+        # Stop as soon as the outcome cannot change anymore
+        if not isinstance(outcome, np.ndarray):
+            if node.operator == "and" and not outcome:
+                return False
+            if node.operator == "or" and outcome:
+                return True
+
+        # Error if boolean lists are not the same size
+        if isinstance(outcome, np.ndarray) and isinstance(combined, np.ndarray):
+            if not len(outcome) == len(combined):
+                print("Error - Boolean lists are not the same size.")
+                return None
+
+        # Combine the outcome
+        if combined is None:
+            combined = outcome
+        else:
+            combined = _logical_operators[node.operator](combined, outcome)
+
+    # Return the combined outcome
+    return combined
+
+
+########################
+#  Evaluate predicate  #
+########################
+def evaluate_predicate(pred, column):
+
+    '''
+
+    Evaluate one predicate over a whole column. Return (mask, None) if
+    the outcome is one boolean per entry, or (mask, offsets) if the
+    outcome is one boolean per array item. Return None if the predicate
+    cannot be evaluated over this column. Missing values only satisfy
+    the != operator.
+
+    Arguments
+    =========
+        pred (predicate): condition to be evaluated
+        column: column of the quantity (scalar_column or ragged_column)
+
+    '''
+
+    # Return None if the quantity is not stored in a typed column
+    if not cc.is_column(column):
+        return None
+    is_str = column.dtype.kind == "U"
+
+    # If this is an in or not-in operator ..
+    if pred.operator in ["in", "not in"]:
+
+        # Look for the string within each entry (string quantity)
+        if isinstance(column, cc.scalar_column):
+            if not is_str:
+                return None
+            mask = np.char.find(column.values, pred.value) >= 0
+            if not column.valid is None:
+                mask &= column.valid
+
+        # Look for the item within each entry (array quantity)
+        else:
+            if is_str:
+                value = pred.value
+            else:
+                try:
+                    value = float(pred.value)
+                except ValueError:
+                    return None
+            found = column.values == value
+            if not column.valid is None:
+                found &= column.valid
+            mask = cc.segment_any(found, column.offsets)
+
+        # Return the entry mask
+        if pred.operator == "not in":
+            mask = ~mask
+        return mask, None
+
+    # Strings are never equal to digits, and cannot be ordered with them
+    if is_str:
+        if pred.operator == "=":
+            mask = np.zeros(len(column.values), dtype=bool)
+        elif pred.operator == "!=":
+            mask = np.ones(len(column.values), dtype=bool)
+        else:
+            return None
+
+    # Compare every value with the digit
+    else:
+        mask = _math_operators[pred.operator](column.values, pred.value)
+
+    # Missing values are never equal to, nor ordered with, anything
+    if not column.valid is None:
+        if pred.operator == "!=":
+            mask |= ~column.valid
+        else:
+            mask &= column.valid
+
+    # Return the entry or item mask
+    if isinstance(column, cc.scalar_column):
+        return mask, None
+    else:
+        return mask, column.offsets
@@ -0,0 +1,132 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Conversion of whole columns of fields (strings extracted from the
+    input file) into typed NumPy arrays. Each conversion returns the
+    values and a validity mask, where fields that cannot be converted
+    are flagged as False and replaced by a sentinel (see missing_values).
+
+'''
+
+# Import Python packages
+import numpy as np
+
+
+# NumPy type of the converted values
+numpy_types = {int: np.int64, float: np.float64, str: np.str_}
+
+# Sentinel stored in place of the fields that cannot be converted
+missing_values = {int: np.iinfo(np.int64).min, float: np.nan, str: ""}
+
+# Size of the ranges tried one after the other when a whole column fails
+_chunk_size = 256
+
+# Number of fields below which a failing range is converted field by field
+_min_bisect_size = 16
+
+
+####################
+#  Convert column  #
+####################
+def convert_column(fields, q_type):
+
+    '''
+
+    Convert a column of fields into a typed NumPy array, and return
+    the values and the validity mask (True where the conversion worked).
+    The whole column is converted at once when possible. Otherwise, the
+    column is split into chunks, and the chunks that fail are split in
+    halves until the ranges that fail are small enough to be converted
+    field by field.
+
+    Arguments
+    =========
+        fields (np.ndarray or list of str): fields to be converted
+        q_type (type): Python type of the quantity (int, float, or str)
+
+    '''
+
+    # Strings are always valid
+    valid = np.ones(len(fields), dtype=bool)
+    if q_type == str:
+        return np.asarray(fields, dtype=str), valid
+
+    # Nothing can be converted into an unknown type
+    if not q_type in numpy_types:
+        valid[:] = False
+        return np.full(len(fields), np.nan), valid
+
+    # Declare the converted values
+    values = np.empty(len(fields), dtype=numpy_types[q_type])
+
+    # Parse Python strings (faster than NumPy parsing unicode arrays)
+    if isinstance(fields, np.ndarray):
+        fields = fields.tolist()
+
+    # Convert ranges of fields, starting with the whole column
+    ranges = [(0, len(fields))]
+    while len(ranges) > 0:
+        i_low, i_upp = ranges.pop()
+
+        # Convert the whole range at once if possible
+        try:
+            values[i_low:i_upp] = np.fromiter(map(q_type, fields[i_low:i_upp]), \
+                                              dtype=values.dtype, count=i_upp-i_low)
+            continue
+        except (ValueError, OverflowError):
+            pass
+
+        # Split a large range into chunks
+        if i_upp - i_low > _chunk_size:
+            bounds = list(range(i_low, i_upp, _chunk_size)) + [i_upp]
+            ranges += reversed(list(zip(bounds[:-1], bounds[1:])))
+            continue
+
+        # Split the range in halves if it is still large
+        if i_upp - i_low > _min_bisect_size:
+            i_mid = (i_low + i_upp) // 2
+            ranges.append((i_mid, i_upp))
+            ranges.append((i_low, i_mid))
+            continue
+
+        # Convert the fields one by one otherwise
+        for i_field in range(i_low, i_upp):
+            try:
+                values[i_field] = q_type(fields[i_field])
+            except:
+                values[i_field] = missing_values[q_type]
+                valid[i_field] = False
+
+    # Return the values and their validity
+    return values, valid
+
+
+#############
+#  To list  #
+#############
+def to_list(values, valid):
+
+    '''
+
+    Return converted values as a list of Python values, where the
+    fields that could not be converted are None.
+
+    Arguments
+    =========
+        values (np.ndarray): converted values (see convert_column)
+        valid (np.ndarray of bool): validity mask
+
+    '''
+
+    # Convert the values into Python values
+    items = values.tolist()
+
+    # Replace invalid values by None
+    if not valid.all():
+        for i_item in np.flatnonzero(~valid).tolist():
+            items[i_item] = None
+
+    # Return the list of values
+    return items
@@ -7,10 +7,13 @@
 
 # Import Python packages
 import numpy as np
-import copy
 
 # Import Interface toolkit
-from . import interface_utils as utils
+from . import columns as cc
+from . import conditions as cd
+from . import index as ix
+from . import derived as dv
+from . import schema as sc
 
 
 # Declare the class
@@ -24,9 +27,11 @@ class data( object ):
     Attributes
     ==========
         quantities (list): quantities extracted from the file (e.g. Z, A, reaction,..)
-        data (dictionary): list all entries in the file, for the targeted quantity (dict. key)
+        data (derived_dict): list all entries in the file, for the targeted quantity (dict. key)
         nb_quantities (int) : total number of quantities
         nb_entries (int): total number of entries
+        columnar (bool): True if quantities are stored in NumPy columns
+        schema (dict): type, shape, and missing values of each quantity (see schema.quantity_schema)
 
     Functions
     =========
@@ -34,13 +39,17 @@ class data( object ):
         filter_data: return data object given sets of constraints (filters)
         get_quantities: return quantities arrays given sets of constraints
         print_quantities: same as get_quantities, but a printed version on your screen
+        create_index: index a quantity to speed up filtering conditions
+        drop_index: remove the index of a quantity
+        get_valid: return which values of a quantity are not missing (None)
+        drop_derived: free the memory of derived (un-logged) quantities
 
     '''
 
     #################################
     #  Initialization of the class  #
     #################################
-    def __init__(self, data=dict()):
+    def __init__(self, data=dict(), columnar=False, schema=None):
 
         '''
 
@@ -50,38 +59,94 @@ class data( object ):
         =========
             data: data dictionary originating from an input data file 
                   that has already been read.
+            columnar (bool): if True, store quantities in NumPy columns
+            schema (dict): known schema of the quantities (see set_data)
 
         '''
 
         # Initialize the data dictionaty
-        self.set_data(data)
+        self.set_data(data, columnar=columnar, schema=schema)
 
 
     ##############
     #  Set data  #
     ##############
-    def set_data(self, data):
+    def set_data(self, data, columnar=False, schema=None):
         
         '''
 
         Overwrite (or initialize) the data dictionary
 
+        With columnar=False, each quantity is a list with one item per
+        entry, and lists within entries are NumPy arrays. With columnar=True,
+        scalar quantities are stored in typed NumPy arrays (scalar_column),
+        and array quantities are stored in one flat array plus an offsets
+        array (ragged_column). In both cases, data[quantity][i_entry]
+        returns the value of a quantity for a given entry. Quantities that
+        cannot be stored in a typed array (e.g. mixing strings and None)
+        are kept as lists.
+
+        Un-logged quantities (X from log_X) are derived quantities: they
+        are listed in quantities, but only computed when first accessed
+        (see derived.derived_dict and drop_derived).
+
+        The schema of each quantity (see schema.quantity_schema) is taken
+        from the schema argument when complete, and is otherwise inferred
+        once from the values, using the known type if provided (e.g. from
+        the structure file, see schema.from_structure).
+
         Arguments
         =========
             data: data dictionary originating from an input data file 
                   that has already been read.
+            columnar (bool): if True, store quantities in NumPy columns
+            schema (dict): known schema (or type) of the quantities
 
         '''
 
-        # Overwrite and read dictionary keys
+        # Overwrite the data dictionary
+        if not isinstance(data, dv.derived_dict):
+            data = dv.derived_dict(data)
         self.data = data
-        self.__collect_data_quantities()
+        self.columnar = columnar
 
-        # Set lists to NumPy arrays
-        for i_entry in range(self.nb_entries):
-            for quantity in self.data:
-                if isinstance(self.data[quantity][i_entry], list):
-                    self.data[quantity][i_entry] = np.array(self.data[quantity][i_entry])
+        # Reset the columns built from lists, the indexes for filtering, and the schema
+        self.__columns = dict()
+        self.__indexes = dict()
+        self.schema = dict()
+
+        # For each quantity ..
+        for quantity in self.data:
+
+            # Derived quantities will be computed from the converted source
+            if self.data.is_derived(quantity):
+                self.data.drop([quantity])
+                continue
+            values = self.data[quantity]
+
+            # Convert columns back to lists if needed
+            if cc.is_column(values):
+                if not columnar:
+                    self.data[quantity] = values.tolist()
+
+            # Set lists to NumPy arrays, and create columns if needed
+            else:
+                if list in set(map(type, values)):
+                    for i_entry in range(len(values)):
+                        if isinstance(values[i_entry], list):
+                            values[i_entry] = np.array(values[i_entry])
+                if columnar:
+                    self.data[quantity] = cc.to_column(values)
+
+            # Use the given schema if complete, or infer it otherwise
+            hint = None if schema == None else sc.get_hint(schema, quantity)
+            if not hint == None and not hint.nullable == None:
+                self.schema[quantity] = hint
+            else:
+                self.schema[quantity] = sc.infer(self.data[quantity], hint)
+
+        # Read dictionary keys
+        self.__collect_data_quantities()
 
         # Create entries for un-logged (10**) values if needed
         self.__unlog_values()
@@ -110,7 +175,7 @@ class data( object ):
         if self.nb_quantities == 0:
             self.nb_entries = 0
         else:
-            self.nb_entries = len(self.data[q])
+            self.nb_entries = len(self.data[self.quantities[0]])
 
         # Find which quantities are digits
         self.__find_digits()
@@ -124,40 +189,25 @@ class data( object ):
 
         '''
 
-        Find and keep in memory all self.data quantities that are digits.
-        In case the quantity refers to an array, it will be flagged as 
-        a digit quantity if all items in the array are digits (with the
-        exception of None).
+        Find and keep in memory all self.data quantities that are digits,
+        based on their schema. In case the quantity refers to an array, it
+        is flagged as a digit quantity if all items in the array are digits
+        (with the exception of None). The schema of derived quantities is
+        taken from their source quantity.
 
         '''
 
-        # Declare the list of digit quantities
-        self.__digit_q_list = []
-
-        # For each quantity in the data dictionary ..
+        # Complete the schema of quantities added since set_data
         for q in self.quantities:
+            if not q in self.schema:
+                source = self.data.get_source(q)
+                if source == None:
+                    self.schema[q] = sc.infer(self.data[q])
+                else:
+                    self.schema[q] = self.schema[source]._replace(dtype="float")
 
-            # Initially assume that this is a digit quantity
-            is_digit = True
-
-            # For each data entry ..
-            for i_entry in range(self.nb_entries):
-
-                # Switch is_digit to False if a non-digit item is detected
-                if isinstance(self.data[q][i_entry], (list, np.ndarray)):
-                    for item in self.data[q][i_entry]:
-                        if not isinstance(item, (int, float, type(None))):
-                            is_digit = False
-                elif not isinstance(self.data[q][i_entry], (int, float, type(None))):
-                    is_digit = False
-
-                # Exit the "for i_entry" loop if needed
-                if not is_digit:
-                    continue
-
-            # Mark the quantity as a digit if needed
-            if is_digit:
-                self.__digit_q_list.append(q)
+        # Declare the list of digit quantities
+        self.__digit_q_list = [q for q in self.quantities if sc.is_digit(self.schema[q])]
 
 
 
@@ -168,10 +218,10 @@ class data( object ):
         
         '''
 
-        Scan through the self.data dictionary, and create an entry
-        with an un-logged version of every "log_.." quantity. This
-        function assumes that all lists in self.data are numpy
-        arrays already.
+        Scan through the self.data dictionary, and declare an un-logged
+        version of every "log_.." quantity. The un-logged quantities are
+        derived quantities, only computed when first accessed (see
+        _unlog_quantity).
 
         '''
 
@@ -190,52 +240,41 @@ class data( object ):
                         # Switch on flag annoncing that the data have been modified
                         new_quantities = True
 
-                        # Create dictionary entry for the un-logged quantities
-                        self.data[q_unlog] = []
-                        for i_entry in range(self.nb_entries):
-                            self.data[q_unlog].append(self.__unlog_specific_item(self.data[q][i_entry]))
+                        # Declare the un-logged quantity
+                        self.data.add_derived(q_unlog, q, _unlog_quantity)
 
         # Re-collect quantities if needed
         if new_quantities:
             self.__collect_data_quantities()
 
 
-    #########################
-    #  Unlog specific item  #
-    #########################
-    def __unlog_specific_item(self, item):
+    ##################
+    #  Drop derived  #
+    ##################
+    def drop_derived(self, quantities=None):
 
         '''
 
-        Take an item (digit or a list of digits) and return its un-logged
-        version (10**), assuming it is already given in log.
+        Free the memory taken by derived (un-logged) quantities that were
+        already computed. They remain listed in quantities, and are
+        computed again if accessed.
 
         Argument
         ========
-            item (digit or list of digits): values to be un-logged
+            quantities (str or list): derived quantities to drop (None for all)
 
         '''
 
-        # Make a copy of the item to avoid linked variable
-        new_item = copy.deepcopy(item)
-
-        # Un-log directly if not an array
-        if isinstance(item, (int, float)):
-            new_item = 10**(item)
-
-        # If item is an array ..
-        if isinstance(item, (list, np.ndarray)):
-
-            # Unlog each digit in the array
-            for i_item in range(len(item)):
-                if isinstance(item[i_item], (int, float)):
-                    new_item[i_item] = 10**(item[i_item])
-
-            # Make sure item is a numpy array
-            new_item = np.array(new_item)
-
-        # Return the un-logged version of the input item
-        return new_item
+        # Forget the computed values and the columns built out of them
+        if not quantities == None:
+            quantities = self.__str_to_list(quantities)
+        else:
+            quantities = [q for q in self.quantities if self.data.is_derived(q)]
+        self.data.drop(quantities)
+        for q in quantities:
+            if self.data.is_derived(q):
+                self.__columns.pop(q, None)
+                self.__indexes.pop(q, None)
 
 
     #################
@@ -269,91 +308,315 @@ class data( object ):
             print("Error - conditions must be a string or a list of strings.")
             return self
 
-        # Get the operator and the left- and right-hand sides of each condition
-        left_list, operator_list, right_list = self.__organize_conditions(conditions)
-        if left_list == None:
+        # Compile the conditions into a single expression (only parsed once per text)
+        node = cd.compile_conditions(conditions)
+        if node is None:
             return self
 
-        # Check whether the left and right sides are available
-        if self.__sides_dont_exist(left_list, operator_list, right_list):
+        # Check whether the quantities are available
+        if self.__sides_dont_exist(node):
             return self
 
+        # Look up the entries directly if a single condition hits an index
+        if isinstance(node, cd.predicate) and node.quantity in self.__indexes:
+            i_keep = self.__indexes[node.quantity].lookup_entries(node)
+            if not i_keep is None:
+                return self.__take_entries(i_keep)
+
+        # Evaluate the conditions over whole columns
+        outcome = cd.evaluate_conditions(node, self.__get_column, self.__indexes)
+
+        # Loop over entries if the conditions cannot be evaluated over columns
+        if outcome is None:
+            return self.__filter_entries(node)
+
+        # Create and return the filtered data object
+        keep, item_mask, item_offsets = outcome
+        return self.__select_entries(keep, item_mask, item_offsets)
+
+
+    ####################
+    #  Filter entries  #
+    ####################
+    def __filter_entries(self, node):
+
+        '''
+
+        Return a filtered Data object by applying the conditions on each
+        entry one by one. This is used when conditions cannot be evaluated
+        over whole columns (e.g. quantities mixing digits and None).
+
+        Argument
+        ========
+            node (predicate or expression): compiled conditions
+
+        '''
+
         # Declare the filtered Data object
+        quantities = self.__stored_quantities()
         new_data = dict()
-        for key in self.quantities:
+        for key in quantities:
             new_data[key] = []
 
         # For each entry in the file ..
         for i_entry in range(self.nb_entries):
 
-            # Declare the booleans that will define whether all conditions are satisfied 
-            bool_single = True
-            bool_list = []
+            # Evaluate the conditions for this entry
+            outcome = cd.evaluate_entry(node, lambda pred: self.__apply_operator(pred, i_entry))
 
-            # For each condition outcome ..
-            for left, operator, right in zip(left_list, operator_list, right_list):
-                outcome = self.__apply_operator(left, operator, right, i_entry)
+            # Exit if something went wrong
+            if outcome is None:
+                return self
 
-                # If the outcome is a list of booleans, store the list
-                if type(outcome) == np.ndarray:
-                    bool_list.append(outcome)
+            # Copy the entire entry if the outcome is a single boolean
+            if not isinstance(outcome, np.ndarray):
+                if outcome:
+                    for key in quantities:
+                        new_data[key].append(self.data[key][i_entry])
 
-                # Exit if something went wrong
-                elif outcome == None:
-                    return self
+            # If there are anything that respect all conditions ..
+            elif True in outcome:
+                len_outcome = len(outcome)
 
-                # If the condition is not satisfied, move to the next entry
-                elif outcome == False:
-                    bool_single = False
-                    break
+                # For each quantity ..
+                for key in quantities:
 
-            # If there is a chance that the entry satisfies all conditions
-            if bool_single:
+                    # Copy the entry part that is not a list
+                    if not type(self.data[key][i_entry]) == np.ndarray:
+                        new_data[key].append(self.data[key][i_entry])
 
-                # Copy the entire entry if there are no boolean list
-                len_bool_list = len(bool_list)
-                if len_bool_list == 0:
-                    for key in self.quantities:
+                    # Copy the entry part that is not a list of relevant length
+                    elif not len(self.data[key][i_entry]) == len_outcome:
                         new_data[key].append(self.data[key][i_entry])
 
-                # If boolean list(s) is(are) provided ..
-                else:
+                    # Only add values if conditions are respected
+                    else:
+                        new_data[key].append(self.data[key][i_entry][outcome])
+
+        # Create and return the filtered data object
+        return data(data=new_data, columnar=self.columnar, schema=self.schema)
+
+
+    ####################
+    #  Select entries  #
+    ####################
+    def __select_entries(self, keep, item_mask, item_offsets):
+
+        '''
+
+        Return a Data object with only the kept entries. Within kept
+        entries, array quantities that have the same number of items as
+        the item mask only keep the items flagged as True.
+
+        Arguments
+        =========
+            keep (np.ndarray of bool): one boolean per entry
+            item_mask (np.ndarray of bool): one boolean per array item (or None)
+            item_offsets (np.ndarray of int): layout of the item mask (or None)
+
+        '''
+
+        # Indexes of the kept entries
+        i_keep = np.flatnonzero(keep)
+
+        # Select entire entries if there is no item mask
+        if item_mask is None:
+            return self.__take_entries(i_keep)
+
+        # Declare the filtered Data object
+        new_data = dict()
+
+        # For each quantity ..
+        for key in self.__stored_quantities():
+            values = self.data[key]
 
-                    # Combine boolean lists
-                    bool_combined = bool_list[0]
-                    len_bool_combined = len(bool_combined)
-                    for i_b in range(1, len_bool_list):
-                        if len(bool_list[i_b]) == len_bool_combined:
-                            bool_combined *= bool_list[i_b]
-                        else:
-                            print("Error - Boolean lists are not the same size.")
-                            return self
+            # Select entries and items with a few index operations
+            if isinstance(values, cc.scalar_column):
+                new_data[key] = values[i_keep]
+            elif isinstance(values, cc.ragged_column):
+                new_data[key] = cc.mask_ragged(values, keep, item_mask, item_offsets)
 
-                    # If there are anything that respect all conditions ..
-                    if True in bool_combined:
+            # Select entries one by one if the quantity is a list
+            else:
+                new_data[key] = []
+                for i_entry in i_keep:
+                    i_low = item_offsets[i_entry]
+                    i_upp = item_offsets[i_entry+1]
+                    if isinstance(values[i_entry], np.ndarray) and \
+                       len(values[i_entry]) == i_upp - i_low:
+                        new_data[key].append(values[i_entry][item_mask[i_low:i_upp]])
+                    else:
+                        new_data[key].append(values[i_entry])
+
+        # Create and return the filtered data object
+        return data(data=new_data, columnar=self.columnar, schema=self.schema)
+
+
+    ##################
+    #  Take entries  #
+    ##################
+    def __take_entries(self, i_keep):
+
+        '''
 
-                        # For each quantity ..
-                        for key in self.quantities:
+        Return a Data object with only the selected entries.
 
-                            # Copy the entry part that is not a list
-                            if not type(self.data[key][i_entry]) == np.ndarray:
-                                new_data[key].append(self.data[key][i_entry])
+        Argument
+        ========
+            i_keep (np.ndarray of int): indexes of the selected entries (increasing)
 
-                            # Copy the entry part that is not a list of relevant length
-                            elif not len(self.data[key][i_entry]) == len_bool_combined:
-                                new_data[key].append(self.data[key][i_entry])
+        '''
 
-                            # If this quantity is a list of relevant length ..
-                            else:
+        # Declare the filtered Data object
+        new_data = dict()
 
-                                # Only add values if conditions are respected
-                                new_data[key].append([])
-                                for i_b in range(len_bool_combined):
-                                    if bool_combined[i_b]:
-                                        new_data[key][-1].append(self.data[key][i_entry][i_b])
+        # Select entries with a single index operation, or one by one for lists
+        for key in self.__stored_quantities():
+            if cc.is_column(self.data[key]):
+                new_data[key] = self.data[key][i_keep]
+            else:
+                new_data[key] = [self.data[key][i_entry] for i_entry in i_keep]
 
         # Create and return the filtered data object
-        return data(data=new_data)
+        return data(data=new_data, columnar=self.columnar, schema=self.schema)
+
+
+    #######################
+    #  Stored quantities  #
+    #######################
+    def __stored_quantities(self):
+
+        '''
+
+        Return the quantities that are not derived quantities waiting to be
+        computed. Filtered data objects only take these quantities, and
+        declare the derived ones again.
+
+        '''
+
+        # Leave out the derived quantities that were not computed
+        return [q for q in self.quantities if not self.data.is_pending(q)]
+
+
+    ################
+    #  Get column  #
+    ################
+    def __get_column(self, quantity):
+
+        '''
+
+        Return the values of a quantity as a column (see _columns.py). With
+        list storage, the column is built once and kept until set_data is
+        called again. A list is returned if no typed column can be built.
+
+        Argument
+        ========
+            quantity (str): quantity label
+
+        '''
+
+        # Return the stored column directly with columnar storage
+        if cc.is_column(self.data[quantity]):
+            return self.data[quantity]
+
+        # Build the column from the list if not already done
+        if not quantity in self.__columns:
+            self.__columns[quantity] = cc.to_column(self.data[quantity])
+
+        # Return the column
+        return self.__columns[quantity]
+
+
+
+    ###############
+    #  Get valid  #
+    ###############
+    def get_valid(self, quantity):
+
+        '''
+
+        Return which values of a quantity are not missing (None), for
+        example the fields that could not be converted into their type
+        when reading the file. For a scalar quantity, return one boolean
+        per entry. For an array quantity, return a ragged_column where
+        [i_entry] gives one boolean per item. Return None if the quantity
+        does not exist or cannot be stored in a typed column.
+
+        Argument
+        ========
+            quantity (str): quantity label
+
+        '''
+
+        # Check whether the quantity exists
+        if self.__quantities_dont_exist([quantity]):
+            return None
+
+        # Return None if there is no typed column
+        column = self.__get_column(quantity)
+        if not cc.is_column(column):
+            return None
+
+        # Every value is valid if there is no mask
+        valid = column.valid
+        if valid is None:
+            valid = np.ones(len(column.values), dtype=bool)
+
+        # Return the mask with the same layout as the quantity
+        if isinstance(column, cc.scalar_column):
+            return valid
+        return cc.ragged_column(valid, column.offsets)
+
+
+    ##################
+    #  Create index  #
+    ##################
+    def create_index(self, quantity):
+
+        '''
+
+        Index a quantity so that conditions such as "Z = 26", "T9 > 1",
+        or "ne22 in reaction" are answered without scanning every entry.
+        Equality and in conditions use a hash index, and <, <=, >, >=
+        conditions use a sorted index. Indexes are removed by set_data.
+
+        Argument
+        ========
+            quantity (str): quantity to be indexed
+
+        '''
+
+        # Check whether the quantity exists
+        if self.__quantities_dont_exist([quantity]):
+            return
+
+        # Error if the quantity cannot be stored in a typed column
+        column = self.__get_column(quantity)
+        if not cc.is_column(column):
+            print("Error -", quantity, "cannot be indexed (values of mixed types).")
+            return
+
+        # Build the index
+        self.__indexes[quantity] = ix.quantity_index(column)
+
+
+    ################
+    #  Drop index  #
+    ################
+    def drop_index(self, quantity):
+
+        '''
+
+        Remove the index of a quantity (see create_index).
+
+        Argument
+        ========
+            quantity (str): indexed quantity
+
+        '''
+
+        # Remove the index if it exists
+        self.__indexes.pop(quantity, None)
 
 
 
@@ -503,83 +766,6 @@ class data( object ):
         return string
 
 
-    #########################
-    #  Organize Conditions  #
-    #########################
-    def __organize_conditions(self, condition_list):
-
-        '''
-
-        Take a list of conditions, and split them into their left-hand 
-        side, opetator, and right-hand side.
-
-        Argument
-        ========
-            condition_list (list of str): list of conditions to filter data
-
-        '''
-
-        # Declare the lists to be returned
-        left_list = []
-        operator_list = []
-        right_list = []
-
-        # For each condition ..
-        for c in condition_list:
-
-            # Clean and remove extra spaces
-            condition = utils.remove_extra_spaces(c)
-
-            # Find the operator that will split the left and right sides
-            operator = self.__get_operator(condition)
-
-            # Add nothing to the lists if no single operator was found
-            if operator == None:
-                left_list.append(None)
-                operator_list.append(None)
-                right_list.append(None)
-
-            # If a single operator was found ..
-            else:
-
-                # Add spaces for "in" and "not in" to correctly split condition
-                # Ex: "k in string" should split ["k","string"], not ["k","str","g"]
-                if operator == "in":
-                    operator = " in "
-                elif operator == "not in":
-                    operator = " not in "
-
-                # Split the condition using the operator 
-                split = condition.split(operator)
-
-                # Restore operator's name
-                if operator == " in ":
-                    operator = "in"
-                elif operator == " not in ":
-                    operator = "not in"
-
-                # Error message if one side of the condition is missing
-                if not len(split) == 2:
-                    print("Error - Side(s) missing in",c)
-                    left_list.append(None)
-                    operator_list.append(None)
-                    right_list.append(None)
-
-                # Fill the list if everything is ok
-                else:
-                    left_list.append(utils.remove_extra_spaces(split[0]))
-                    operator_list.append(operator)
-                    right_list.append(utils.remove_extra_spaces(split[1]))
-
-        # Return None if there was a problem
-        if None in left_list:
-            return None, None, None
-
-        # Return the organized conditions
-        return left_list, operator_list, right_list
-
-
-
     ############################
     #  Quantities Don't Exist  #
     ############################
@@ -612,173 +798,42 @@ class data( object ):
 
 
 
-    ##################
-    #  Get Operator  #
-    ##################
-    def __get_operator(self, condition):
-
-        '''
-
-        Take a condition, and find the operator that will split
-        the left- and right-hand sides of the condition.
-
-        Argument
-        ========
-            condition (str): condition to filter data
-
-        '''
-
-        # Declare the list of found operators
-        op_found = []
-
-        # Look for special cases for in and not-in
-        if " not in in " in condition or " in not in " in condition:
-            op_found.append("not in")
-            op_found.append("in")
-        elif " not in not in " in condition:
-            op_found.append("not in")
-            op_found.append("not in")
-        elif " in in " in condition:
-            op_found.append("in")
-            op_found.append("in")
-
-        # Look for in and not-in operators
-        else:
-            op_found = self.__add_operator(condition, " not in ", op_found)
-            op_found = self.__add_operator(condition, " in ", op_found, exclude=[" not "])
-
-        # Look for != operator
-        op_found = self.__add_operator(condition, "!=", op_found)
-
-        # Look for >= operator
-        op_found = self.__add_operator(condition, ">=", op_found)
-
-        # Look for <= operator
-        op_found = self.__add_operator(condition, "<=", op_found)
-
-        # Look for = operator
-        op_found = self.__add_operator(condition, "=", op_found, exclude=["!=",">=","<="])
-
-        # Look for > operator
-        op_found = self.__add_operator(condition, ">", op_found, exclude=[">="])
-
-        # Look for < operator
-        op_found = self.__add_operator(condition, "<", op_found, exclude=["<="])
-
-        # Error if no operator was found
-        if len(op_found) == 0:
-            print("Error - No operator was found in:", condition)
-            print("  Valid operators are [=, !=, >=, >, <=, <, in, not in].")
-            return None
-
-        # Error if more than one operator were found
-        if len(op_found) > 1:
-            clean_op = []
-            for op in op_found:
-                if not op in clean_op:
-                    clean_op.append(op)
-            print("Error - Too many operators", clean_op, "were found in",condition)
-            return None
-
-        # Return the one operator if everything went well
-        return op_found[0]
-
-
     #######################
     #  Sides Don't Exist  #
     #######################
-    def __sides_dont_exist(self, left_list, operator_list, right_list):
+    def __sides_dont_exist(self, node):
 
         '''
 
-        Check whether a list of conditions can be applied.
+        Check whether a compiled set of conditions can be applied.
 
-        Arguments
-        =========
-            left_list (list): left-hand side of a condition
-            operator_list (list): operator in between the left and right sides
-            right_list (list): right-hand side of a condition
+        Argument
+        ========
+            node (predicate or expression): compiled conditions
 
         '''
 
         # Declare whether sides exist
         dont_exist = False
 
-        # For each condition ..
-        for left, operator, right in zip(left_list, operator_list, right_list):
-
-            # If the condition is either in or not-in ..
-            if operator in ["in", "not in"]:
-
-                # Check whether the right side is available
-                # Do not return yet, since we want the full list of errors
-                if not right in self.quantities:
-                    print("Error -",right,"is not available.")
-                    dont_exist = True
-
-            # If the condition involves a math operator ..
-            else:
-
-                # Check whether the left side is available
-                if not left in self.quantities:
-                    print("Error -",left,"is not available.")
-                    dont_exist = True
+        # For each comparison in the conditions ..
+        for pred in cd.iter_predicates(node):
 
-                # Check whether the right side is a digit
-                try:
-                    test = float(right)
-                except:
-                    print("Error -",right,"should be a digit in",left,operator,right)
-                    dont_exist = True
+            # Check whether the quantity is available
+            # Do not return yet, since we want the full list of errors
+            if not pred.quantity in self.quantities:
+                print("Error -",pred.quantity,"is not available.")
+                dont_exist = True
 
         # Return whether sides exist
         return dont_exist
 
 
 
-    ##################
-    #  Add Operator  #
-    ##################
-    def __add_operator(self, condition, op, op_found, exclude=[]):
-
-        '''
-
-        Take a condition, and add the targeted operator in a given list
-        of operators each time it is found in the condition.
-
-        Arguments
-        =========
-            condition (str): condition for filtering data
-            op (str): targeted operator 
-            op_found (list of str): operators that were previously found
-            exclude (list of str): operators (e.g. !=) that may include op (e.g. =)
-
-        '''
-
-        # If the targeted operator is in the condition ..
-        if op in condition:
-
-            # Get the number of times the targeted operator appears
-            nb_op = condition.count(op)
-
-            # Get the nummber of times the excluded operators appear
-            nb_exclude = 0
-            for op_ex in exclude:
-                nb_exclude += condition.count(op_ex)
-
-            # Add the targeted operator each time it appears by its own
-            for i in range(max(0, nb_op-nb_exclude)):
-                op_found.append(utils.remove_extra_spaces(op))
-
-        # Return the updated list of found operators
-        return op_found
-
-
-
     ####################
     #  Apply Operator  #
     ####################
-    def __apply_operator(self, left, operator, right, i_entry):
+    def __apply_operator(self, pred, i_entry):
 
         '''
 
@@ -788,47 +843,51 @@ class data( object ):
 
         Arguments
         =========
-            left (str): left-hand side of the condition
-            operator (str): operator for the condition (e.g. =, <, not in)
-            right (str): right-hand side of the condition
+            pred (predicate): compiled condition (quantity, operator, value)
             i_entry (index): entry index in the data
 
         '''
 
+        # Value of the quantity for this entry
+        value = self.data[pred.quantity][i_entry]
+
         # Equal operator ..
-        if operator == "=":
-            return self.data[left][i_entry] == float(right)
+        if pred.operator == "=":
+            return value == pred.value
 
         # If not-equal operator ..
-        if operator == "!=":
-            return self.data[left][i_entry] != float(right)
+        if pred.operator == "!=":
+            return value != pred.value
 
         # If greater-than-or-equal operator ..
-        if operator == ">=":
-            return self.data[left][i_entry] >= float(right)
+        if pred.operator == ">=":
+            return value >= pred.value
 
         # If greater-than operator ..
-        if operator == ">":
-            return self.data[left][i_entry] > float(right)
+        if pred.operator == ">":
+            return value > pred.value
 
         # If less-than-or-equal operator ..
-        if operator == "<=":
-            return self.data[left][i_entry] <= float(right)
+        if pred.operator == "<=":
+            return value <= pred.value
 
         # If less-than operator ..
-        if operator == "<":
-            return self.data[left][i_entry] < float(right)
+        if pred.operator == "<":
+            return value < pred.value
 
         # If in operator:
-        if operator == "in":
-            return self.__apply_in_operator(left, operator, right, i_entry)
+        if pred.operator == "in":
+            return self.__apply_in_operator(pred.value, pred.quantity, i_entry)
 
         # If not-in operator:
-        if operator == "not in":
-            return not self.__apply_in_operator(left, operator, right, i_entry)
+        if pred.operator == "not in":
+            outcome = self.__apply_in_operator(pred.value, pred.quantity, i_entry)
+            if outcome == None:
+                return None
+            return not outcome
 
         # Return an error if the operator is not valid
-        print("Error -", operator, "is not a valid operator.")
+        print("Error -", pred.operator, "is not a valid operator.")
         print("  Valid operators are [=, !=, >=, >, <=, <, in, not in].")
         return False
 
@@ -836,7 +895,7 @@ class data( object ):
     #######################
     #  Apply in Operator  #
     #######################
-    def __apply_in_operator(self, left, operator, right, i_entry):
+    def __apply_in_operator(self, left, right, i_entry):
 
         '''
 
@@ -845,7 +904,6 @@ class data( object ):
         Arguments
         =========
             left (str): left-hand side of the condition
-            operator (str): operator for the condition (e.g. =, <, not in)
             right (str): right-hand side of the condition
             i_entry (index): entry index in the data
 
@@ -874,3 +932,132 @@ class data( object ):
         # Error message if things are inconsistent
         print("Error - ",right,"must either be a string, a list of strings, or a list of digits.")
         return None
+
+
+
+#################
+#  Concatenate  #
+#################
+def concatenate(data_list, columnar=True):
+
+    '''
+
+    Return a single data object with the entries of several data objects,
+    one after the other. All data objects must have the same quantities.
+
+    Arguments
+    =========
+        data_list (list of data): data objects to be combined
+        columnar (bool): if True, store quantities in NumPy columns
+
+    '''
+
+    # Only keep data objects that have entries
+    data_list = [d for d in data_list if d.nb_entries > 0]
+    if len(data_list) == 0:
+        return data(data=dict())
+
+    # Error if the quantities are not the same
+    quantities = data_list[0].quantities
+    for d in data_list[1:]:
+        if not sorted(d.quantities) == sorted(quantities):
+            print("Error - Data objects with different quantities cannot be concatenated.")
+            return None
+
+    # Combine each quantity (derived quantities are declared again)
+    new_data = dict()
+    for q in quantities:
+        if all(d.data.is_derived(q) for d in data_list):
+            continue
+        new_data[q] = cc.concatenate([d.data[q] for d in data_list])
+        if not columnar and cc.is_column(new_data[q]):
+            new_data[q] = new_data[q].tolist()
+
+    # Return the combined data object
+    return data(data=new_data, columnar=columnar)
+
+
+####################
+#  Unlog quantity  #
+####################
+def _unlog_quantity(values):
+
+    '''
+
+    Return the un-logged version (10**) of the values of a quantity,
+    assuming they are given in log. Columns are un-logged at once (see
+    columns.unlog_column). Lists are un-logged item by item, so that each
+    value keeps the type and value given by 10**value, except for lists
+    of integers that stay exact integers, which are un-logged at once.
+
+    Argument
+    ========
+        values (column or list): values of every entry
+
+    '''
+
+    # Un-log the whole column at once
+    if cc.is_column(values):
+        return cc.unlog_column(values)
+
+    # Un-log lists of integers at once if they stay integers
+    column = cc.to_column(values)
+    if isinstance(column, cc.scalar_column) and column.dtype.kind in ["i", "u"]:
+        unlogged = cc.unlog_column(column)
+        if unlogged.dtype.kind in ["i", "u"]:
+            return unlogged.tolist()
+
+    # Un-log each entry otherwise
+    return [_unlog_item(item) for item in values]
+
+
+################
+#  Unlog item  #
+################
+def _unlog_item(item):
+
+    '''
+
+    Take an item (digit or a list of digits) and return its un-logged
+    version (10**), assuming it is already given in log. NumPy digits
+    are un-logged like Python digits, and arrays are returned as NumPy
+    arrays built out of the un-logged digits.
+
+    Argument
+    ========
+        item (digit or list of digits): values to be un-logged
+
+    '''
+
+    # Un-log each digit if item is an array (with NumPy digits as Python digits)
+    if isinstance(item, (list, np.ndarray)):
+        values = item.tolist() if isinstance(item, np.ndarray) else item
+        return np.array([_unlog_digit(value) for value in values])
+
+    # Un-log directly otherwise
+    return _unlog_digit(item)
+
+
+#################
+#  Unlog digit  #
+#################
+def _unlog_digit(value):
+
+    '''
+
+    Return 10**value if the value is a digit, and the value as is otherwise.
+
+    Argument
+    ========
+        value (unknown): value to be un-logged
+
+    '''
+
+    # Use the Python version of NumPy digits
+    if isinstance(value, (np.integer, np.floating)):
+        value = value.item()
+
+    # Un-log the digit
+    if isinstance(value, (int, float)):
+        return 10**(value)
+    return value
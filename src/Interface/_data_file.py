@@ -6,10 +6,12 @@
 '''
 
 # Import Python packages
-import copy
+import os
 
 # Import Interface toolkit
 from . import interface_utils as utils
+from . import compression as cp
+from . import structure as st
 
 # Declare the class
 class data_file( object ):
@@ -48,6 +50,46 @@ class data_file( object ):
         self.__not_main_headers = ["MULTILINE", "ONCE"]
 
 
+    #######################
+    #  Compile structure  #
+    #######################
+    def compile_structure(self, structure_path):
+
+        '''
+
+        Return the compiled version of a structure file, which provides
+        pre-screened instructions on how to read and write data files.
+        Compiled structures are cached (see structure.cache) and are only
+        re-compiled when the structure file is modified. The returned
+        object can be given instead of a structure path to the reading
+        and writing functions.
+
+        Argument
+        ========
+            structure_path (string): path to the input structure file
+
+        '''
+
+        # Return the structure directly if it is already compiled
+        if isinstance(structure_path, st.compiled_structure):
+            return structure_path
+
+        # Identify the structure file with its location and last modification
+        full_path = os.path.abspath(self._root_path+structure_path)
+        stat = os.stat(full_path)
+        key = (full_path, stat.st_mtime_ns, stat.st_size)
+
+        # Compile the structure if it is not already in the cache
+        structure = st.cache.get(key)
+        if structure == None:
+            bloc, header, header_keys = self._create_bloc_structure(structure_path)
+            structure = st.compile_structure(bloc, header)
+            st.cache.put(key, structure)
+
+        # Return the compiled structure
+        return structure
+
+
     ###########################
     #  Create bloc structure  #
     ###########################
@@ -185,24 +227,43 @@ class data_file( object ):
 
         '''
 
-        # Declare the list of lines
-        lines = []
+        # Collect every line of the input file
+        lines = list(self._iter_lines(file_path))
+
+        # Return the list of individual lines
+        return lines, len(lines)
+
+
+    ################
+    #  Iter lines  #
+    ################
+    def _iter_lines(self, file_path, offset=0):
+
+        '''
+
+        Yield the lines of the input file one at a time, without "\n".
+        The file is closed once the last line is reached, or when the
+        generator is closed. Compressed files (see compression.detect)
+        are decompressed on the fly.
+
+        Arguments
+        =========
+            file_path (string): path to the input data file
+            offset (int): byte position (start of a line) where to start reading
+
+        '''
 
         # For each line in the input file ..
-        with open(self._root_path+file_path) as f:
+        with cp.open_file(self._root_path+file_path) as f:
+            if offset > 0:
+                f.seek(offset)
             for line in f:
 
-                # Collect the line without the "\n" character
+                # Yield the line without the "\n" character
                 if line[-1:] == "\n":
-                    lines.append(line[:-1])
+                    yield line[:-1]
                 else:
-                    lines.append(line)
-
-        # Close input file
-        f.close()
-
-        # Return the list of individual lines
-        return lines, len(lines)
+                    yield line
 
 
     ######################
@@ -252,23 +313,8 @@ class data_file( object ):
 
         '''
 
-        # Return True is there is nothing
-        if line == "":
-            return True
-
-        # Scan through all characters
-        char = []
-        for c in line:
-            if not c in char:
-                char.append(c)
-                if len(char) > 1:
-                    return False
-
-        # Empty if only composed of " " and "\n"
-        if char == [" "]:
-            return True
-        else:
-            return False
+        # Empty if there is nothing once spaces are removed
+        return len(line.strip(" ")) == 0
 
 
     ######################
@@ -353,122 +399,3 @@ class data_file( object ):
         # Return float
         if utils.remove_extra_spaces(str_type) == "float":
             return float
-
-
-    ##################
-    #  Remove flags  #
-    ##################
-    def _remove_flags(self, dic):
-
-        '''
-
-        Take an input dictionary, and remove any structure header from
-        its list of keys.
-
-        Argument
-        ========
-            dic (dictionary): Input dictionary with potential structure header
-
-        '''
-
-        # Declare the new dictionary with no header
-        new_dic = dict()
-
-        # For each key in the input dictionary ..
-        for key in dic.keys():
-
-            # Add it to the new dictionary if the key is not a header
-            if not key[0] == "$":
-                new_dic[key] = copy.deepcopy(dic[key])
-
-        # Return the new dictionary
-        return new_dic
-
-
-    ######################
-    #  Screen structure  #
-    ######################
-    def _screen_structure(self, structure, read_structure):
-
-        '''
-
-        Pre-screen the structure to gain insights on how to proceed
-        with the upcoming data extraction process.
-
-        Arguments
-        =========
-            structure (dict): one line of a structure sub-bloc
-            read_structure (list): list of already-covered structures
-
-        '''
-
-        # Check whether the upcoming reading should be skipped
-        skip, read_structure = self.__check_skip(structure, read_structure)
-
-        # If upcoming data is spread over multiple lines ..
-        if "$MULTILINE" in structure:
-
-            # Set multiline flag
-            multiline = True
-
-            # Set multiline variables if number of loops is provided 
-            if utils.remove_all_spaces(structure["$MULTILINE"]).isdigit():
-                ml_is_digit = True
-                ml_end_point = int(structure["$MULTILINE"])
-
-            # Set multiline variables if number of loops is dynamic 
-            else:
-                ml_is_digit = False
-                ml_end_point = utils.remove_initial_spaces(structure["$MULTILINE"])
-
-        # Set multiline flag to False if upcoming data is on one line
-        else:
-            multiline = False
-            ml_is_digit = None
-            ml_end_point = None
-
-        # Remove header flags from structure dictionary
-        structure = self._remove_flags(structure)
-
-        # Return pre-screen result
-        return skip, structure, read_structure, multiline, ml_is_digit, ml_end_point
-
-
-    ################
-    #  Check skip  #
-    ################
-    def __check_skip(self, structure, read_structure):
-
-        '''
-
-        Keep track of the structures already covered and look
-        for the $ONCE header to make sure it is only convered
-        once throughout the reading.
-
-        Arguments
-        =========
-            structure (dict): one line of a structure sub-bloc
-            read_structure (list): list of already-covered structures
-
-
-        '''
-
-        # First assume that the upcoming structure should not be skipped
-        skip = False
-
-        # If this is not the first time the structure is applied
-        if structure in read_structure:
-
-            # Skip if the bloc should be only read once
-            if "$ONCE" in list(structure.keys())[0]:
-                skip = True
-
-        # If this is the first time the structure is applied ..
-        else:
-
-            # Add it to the list of treated structures
-            read_structure.append(structure)
-
-        # Return check result
-        return skip, read_structure
-
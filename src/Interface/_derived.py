@@ -0,0 +1,333 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Data dictionary where some quantities are derived from others (e.g.
+    X from log_X). Derived quantities are listed like any other quantity,
+    but their values are only computed the first time they are accessed,
+    and can be dropped afterward to free memory (they are computed again
+    if needed).
+
+'''
+
+# Import Python packages
+import collections.abc
+
+
+#######################
+#  Declare the class  #
+#######################
+class _pending_value( object ):
+
+    '''
+
+    Placeholder of a derived quantity that has not been computed yet.
+    The placeholder is pickled by reference, so that it remains the same
+    object when a data dictionary is sent to another process.
+
+    '''
+
+    ############
+    #  Reduce  #
+    ############
+    def __reduce__(self):
+        return "_pending"
+
+
+    ##########
+    #  Repr  #
+    ##########
+    def __repr__(self):
+        return "<pending>"
+
+
+# Placeholder of derived quantities that have not been computed yet
+_pending = _pending_value()
+
+
+#######################
+#  Declare the class  #
+#######################
+class derived_dict( collections.abc.MutableMapping ):
+
+    '''
+
+    Dictionary of quantities (label --> values of every entry), where
+    derived quantities are computed on first access out of their source
+    quantity. Setting or deleting a derived quantity turns it into a
+    regular quantity.
+
+    Functions
+    =========
+        add_derived: declare a quantity computed from another one
+        is_derived: whether a quantity is derived
+        get_source: quantity a derived quantity is computed from
+        is_pending: whether a derived quantity has not been computed yet
+        drop: forget the computed values of derived quantities
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, data=None):
+
+        '''
+
+        Initialize the derived_dict class.
+
+        Argument
+        ========
+            data (dict): initial quantities (label --> values)
+
+        '''
+
+        # Values of each quantity, and how derived quantities are computed
+        self.__values = dict()
+        self.__derived = dict()
+
+        # Add the initial quantities
+        if not data == None:
+            for q in data:
+                self.__values[q] = data[q]
+
+
+    #############
+    #  Getitem  #
+    #############
+    def __getitem__(self, q):
+
+        '''
+
+        Return the values of a quantity, computing them first if this
+        is a derived quantity that has not been accessed yet.
+
+        Argument
+        ========
+            q (str): quantity label
+
+        '''
+
+        # Compute the derived quantity if needed
+        values = self.__values[q]
+        if values is _pending:
+            function, source = self.__derived[q]
+            values = function(self[source])
+            self.__values[q] = values
+
+        # Return the values
+        return values
+
+
+    #############
+    #  Setitem  #
+    #############
+    def __setitem__(self, q, values):
+
+        '''
+
+        Set the values of a (regular) quantity.
+
+        Arguments
+        =========
+            q (str): quantity label
+            values: values of every entry
+
+        '''
+
+        # Overwrite the values (the quantity is not derived anymore)
+        self.__values[q] = values
+        self.__derived.pop(q, None)
+
+
+    #############
+    #  Delitem  #
+    #############
+    def __delitem__(self, q):
+
+        '''
+
+        Remove a quantity.
+
+        Argument
+        ========
+            q (str): quantity label
+
+        '''
+
+        # Remove the values and how they are derived
+        del self.__values[q]
+        self.__derived.pop(q, None)
+
+
+    ##########
+    #  Iter  #
+    ##########
+    def __iter__(self):
+
+        '''
+
+        Iterate over the quantity labels, derived ones included.
+
+        '''
+
+        # Iterate without computing anything
+        return iter(self.__values)
+
+
+    #########
+    #  Len  #
+    #########
+    def __len__(self):
+
+        '''
+
+        Return the number of quantities, derived ones included.
+
+        '''
+
+        # Count every label
+        return len(self.__values)
+
+
+    ##############
+    #  Contains  #
+    ##############
+    def __contains__(self, q):
+
+        '''
+
+        Return True if a quantity exists, without computing it.
+
+        Argument
+        ========
+            q (str): quantity label
+
+        '''
+
+        # Look for the label
+        return q in self.__values
+
+
+    ##########
+    #  Repr  #
+    ##########
+    def __repr__(self):
+
+        '''
+
+        Return the printable version of the dictionary, where derived
+        quantities that were not computed yet are shown as <pending>.
+
+        '''
+
+        # Return the values as they are stored
+        return repr(self.__values)
+
+
+    #################
+    #  Add derived  #
+    #################
+    def add_derived(self, q, source, function):
+
+        '''
+
+        Declare a quantity that is computed out of another quantity the
+        first time it is accessed.
+
+        Arguments
+        =========
+            q (str): label of the derived quantity
+            source (str): label of the quantity it is computed from
+            function (function): values of the source --> values of the derived quantity
+
+        '''
+
+        # Keep how the quantity is computed
+        self.__values[q] = _pending
+        self.__derived[q] = (function, source)
+
+
+    ################
+    #  Is derived  #
+    ################
+    def is_derived(self, q):
+
+        '''
+
+        Return True if a quantity is derived from another quantity.
+
+        Argument
+        ========
+            q (str): quantity label
+
+        '''
+
+        # Look for the quantity within the derived ones
+        return q in self.__derived
+
+
+    ################
+    #  Get source  #
+    ################
+    def get_source(self, q):
+
+        '''
+
+        Return the label of the quantity a derived quantity is computed
+        from (None if the quantity is not derived).
+
+        Argument
+        ========
+            q (str): quantity label
+
+        '''
+
+        # Return the source of the derived quantity
+        if not q in self.__derived:
+            return None
+        return self.__derived[q][1]
+
+
+    ################
+    #  Is pending  #
+    ################
+    def is_pending(self, q):
+
+        '''
+
+        Return True if a derived quantity has not been computed yet.
+
+        Argument
+        ========
+            q (str): quantity label
+
+        '''
+
+        # Look for the placeholder
+        return self.__values.get(q) is _pending
+
+
+    ##########
+    #  Drop  #
+    ##########
+    def drop(self, quantities=None):
+
+        '''
+
+        Forget the computed values of derived quantities, which will be
+        computed again if accessed. Regular quantities are not affected.
+
+        Argument
+        ========
+            quantities (list of str): derived quantities to drop (None for all)
+
+        '''
+
+        # Put back the placeholder of each derived quantity
+        if quantities == None:
+            quantities = list(self.__derived)
+        for q in quantities:
+            if q in self.__derived:
+                self.__values[q] = _pending
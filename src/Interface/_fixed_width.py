@@ -0,0 +1,133 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Vectorized extraction of fixed-width (character range) quantities.
+    A batch of lines is stored in a NumPy array of characters, so that
+    each quantity is sliced and converted for every line at once.
+
+'''
+
+# Import Python packages
+import numpy as np
+
+# Import Interface toolkit
+from . import converters as cv
+
+
+# Number of lines stored in memory at once
+_batch_size = 100000
+
+
+#####################
+#  Extract columns  #
+#####################
+def extract_columns(lines, slices, types):
+
+    '''
+
+    Extract character-range quantities from a list of lines, and return
+    one list of values per quantity (one value per line). Values that
+    cannot be converted into their type are None, as when each line is
+    treated one by one.
+
+    Arguments
+    =========
+        lines (list of str): lines of the input file
+        slices (tuple of slice): character range of each quantity
+        types (tuple of types): Python type of each quantity
+
+    '''
+
+    # Convert the fields of each quantity (see converters.convert_column)
+    columns = []
+    for fields, q_type in zip(extract_fields(lines, slices), types):
+        columns.append(cv.to_list(*cv.convert_column(fields, q_type)))
+
+    # Return the columns
+    return columns
+
+
+####################
+#  Extract fields  #
+####################
+def extract_fields(lines, slices):
+
+    '''
+
+    Return, for each character range, a string array with the field
+    found within that range on every line (same as line[sl]).
+
+    Arguments
+    =========
+        lines (list of str): lines of the input file
+        slices (tuple of slice): character range of each quantity
+
+    '''
+
+    # Declare the fields of each range
+    fields = [[] for sl in slices]
+
+    # For each batch of lines ..
+    for i_start in range(0, len(lines), _batch_size):
+
+        # Store the characters of every line in a 2D array
+        chars = _to_char_array(lines[i_start:i_start+_batch_size])
+
+        # Slice each range for every line at once
+        for i_sl, sl in enumerate(slices):
+            fields[i_sl].append(_slice_chars(chars, sl))
+
+    # Return one string array per range
+    return [np.concatenate(f) if len(f) > 0 else np.zeros(0, dtype=str) for f in fields]
+
+
+###################
+#  To char array  #
+###################
+def _to_char_array(lines):
+
+    '''
+
+    Return a 2D array of characters [line index][character index],
+    where lines shorter than the longest one are padded with empty
+    characters.
+
+    Argument
+    ========
+        lines (list of str): lines of the input file
+
+    '''
+
+    # Store the lines in a fixed-width string array, and view each character
+    arr = np.array(lines, dtype=str)
+    width = max(arr.dtype.itemsize // 4, 1)
+    arr = arr.astype("U"+str(width))
+    return arr.view("U1").reshape(len(lines), width)
+
+
+#################
+#  Slice chars  #
+#################
+def _slice_chars(chars, sl):
+
+    '''
+
+    Return the strings found within a character range for every line
+    (same as line[sl] for each line).
+
+    Arguments
+    =========
+        chars (np.ndarray): 2D array of characters (see _to_char_array)
+        sl (slice): character range
+
+    '''
+
+    # Return empty strings if the range is beyond every line
+    sub = chars[:, sl]
+    if sub.shape[1] == 0:
+        return np.zeros(len(chars), dtype="U1")
+
+    # Merge the characters of the range back into strings
+    return np.ascontiguousarray(sub).view("U"+str(sub.shape[1])).reshape(len(chars))
@@ -0,0 +1,410 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    String formatting of the values written by write_data_file. Whole
+    columns are formatted at once (one string per value, or per array
+    item), so that output lines are only assembled out of strings that
+    are already formatted. The strings are the same as those obtained by
+    formatting the values one by one (see format_value).
+
+'''
+
+# Import Python packages
+import collections
+import numpy as np
+
+# Import Interface toolkit
+from . import columns as cc
+
+
+# Formatted values of a quantity
+#   strings (list of str): string of each value (or of each array item, entry after entry)
+#   offsets (list of int): index of the first item of each entry, plus the total (None for scalars)
+formatted_column = collections.namedtuple("formatted_column", ["strings", "offsets"])
+
+
+##################
+#  Format value  #
+##################
+def format_value(value, max_decimal, float_sci, empty):
+
+    '''
+
+    Return the string version of a single value, converting floats
+    into scientific notation if needed. Return None if floats should
+    be in scientific notation without any decimal (max_decimal <= 0).
+
+    Arguments
+    =========
+        value (unknown): value from a data object (float, int, str, etc..)
+        max_decimal (int): number of decimal points for floats in scientific notation
+        float_sci (bool): if True, floats are printed in scientific notation
+        empty (str): string returned when the value is missing (None)
+
+    '''
+
+    # Return empty character if data not provided
+    if value == None:
+        return empty
+
+    # Do nothing if this is already a string
+    if isinstance(value, (str, np.str_)):
+        return value
+
+    # Convert to string if this is an integer
+    elif isinstance(value, (int, np.int_)):
+        return str(value)
+
+    # Return the scientific notation if this is a float
+    elif float_sci:
+        if max_decimal <= 0:
+            return None
+        return ("{:."+str(max_decimal)+"E}").format(value)
+
+    # Return normal float without formating if not in scientific notation
+    else:
+        return str(value)
+
+
+###################
+#  Format column  #
+###################
+def format_column(values, max_decimal, float_sci, empty):
+
+    '''
+
+    Return the string version of every value of a quantity, as a
+    formatted_column. Typed arrays are formatted in one pass, while
+    lists mixing several types are formatted value by value. Return
+    None if the values cannot be formatted ahead of time (entries mixing
+    single values and arrays, or floats in scientific notation without
+    any decimal), in which case values should be formatted one by one.
+
+    Arguments
+    =========
+        values (column or list): values of every entry
+        max_decimal (int): number of decimal points for floats in scientific notation
+        float_sci (bool): if True, floats are printed in scientific notation
+        empty (str): string given to missing values (None)
+
+    '''
+
+    # Format the (flat) array of columns, and flag the missing values
+    if cc.is_column(values):
+        strings = _format_array(values.values, max_decimal, float_sci)
+        if strings == None:
+            return None
+        if not values.valid is None:
+            for i_value in np.flatnonzero(~values.valid).tolist():
+                strings[i_value] = empty
+        if isinstance(values, cc.ragged_column):
+            return formatted_column(strings, values.offsets.tolist())
+        return formatted_column(strings, None)
+
+    # Find the types present in the list
+    types = set(map(type, values))
+
+    # If every entry is an array ..
+    if types <= {list, np.ndarray}:
+
+        # Format all arrays at once if they share the same type
+        offsets = [0]
+        for arr in values:
+            offsets.append(offsets[-1] + len(arr))
+        if types == {np.ndarray} and len(set(arr.dtype for arr in values)) == 1 \
+                and all(arr.ndim == 1 for arr in values):
+            strings = _format_array(np.concatenate(values), max_decimal, float_sci)
+            if not strings == None:
+                return formatted_column(strings, offsets)
+
+        # Format the arrays one by one otherwise
+        strings = []
+        for arr in values:
+            arr_strings = None
+            if isinstance(arr, np.ndarray) and arr.ndim == 1:
+                arr_strings = _format_array(arr, max_decimal, float_sci)
+            if arr_strings == None:
+                arr_strings = _format_list(arr, max_decimal, float_sci, empty)
+                if arr_strings == None:
+                    return None
+            strings.extend(arr_strings)
+        return formatted_column(strings, offsets)
+
+    # Entries mixing single values and arrays are formatted one by one
+    if len(types & {list, np.ndarray}) > 0:
+        return None
+
+    # Format single values of the same type at once
+    present = types - {type(None)}
+    if present <= {float, np.float64} or present <= {int, np.int64} \
+            or present <= {str, np.str_}:
+        column = cc.to_column(values)
+        if cc.is_column(column):
+            formatted = format_column(column, max_decimal, float_sci, empty)
+            if not formatted == None:
+                return formatted
+
+    # Format single values one by one otherwise
+    strings = _format_list(values, max_decimal, float_sci, empty)
+    if strings == None:
+        return None
+    return formatted_column(strings, None)
+
+
+##################
+#  Format array  #
+##################
+def _format_array(arr, max_decimal, float_sci):
+
+    '''
+
+    Return the string of every value of a typed NumPy array (float64,
+    int64, or str). Return None for other types, or if floats should be
+    in scientific notation without any decimal.
+
+    Arguments
+    =========
+        arr (np.ndarray): values to be formatted
+        max_decimal (int): number of decimal points for floats in scientific notation
+        float_sci (bool): if True, floats are printed in scientific notation
+
+    '''
+
+    # Floats, with the format string only built once
+    if arr.dtype == np.float64:
+        if float_sci:
+            if max_decimal <= 0:
+                return None
+            return list(map(("{:."+str(max_decimal)+"E}").format, arr.tolist()))
+        return list(map(str, arr.tolist()))
+
+    # Integers
+    if arr.dtype == np.int64:
+        return list(map(str, arr.tolist()))
+
+    # Strings
+    if arr.dtype.kind == "U":
+        return arr.tolist()
+
+    # Other types are formatted one by one
+    return None
+
+
+#################
+#  Format list  #
+#################
+def _format_list(values, max_decimal, float_sci, empty):
+
+    '''
+
+    Return the string of every value of a list (or array), formatted
+    one by one. Return None if a value cannot be formatted.
+
+    Arguments
+    =========
+        values (list or np.ndarray): values to be formatted
+        max_decimal (int): number of decimal points for floats in scientific notation
+        float_sci (bool): if True, floats are printed in scientific notation
+        empty (str): string given to missing values (None)
+
+    '''
+
+    # Format each value
+    strings = [format_value(value, max_decimal, float_sci, empty) for value in values]
+    if None in strings:
+        return None
+    return strings
+
+
+#######################
+#  Declare the class  #
+#######################
+class line_template( object ):
+
+    '''
+
+    Template of the output lines of a structure line, compiled once per
+    writing out of the positions of the quantities, and filled with the
+    strings of the quantities (in the order of the structure line):
+
+        single quantity with no position: the string alone
+        column indexes: the string of each column followed by the spacing,
+            with the empty character for columns without quantity, and
+            without the spaces at the end of the line
+        character ranges: the string of each quantity truncated to the
+            width of its range, on a fixed-width line of spaces
+
+    Attribute
+    =========
+        max_decimals (list of int): number of decimal points of each quantity in
+            scientific notation, adjusted in case there is not enough space
+            within character ranges
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, positions, max_decimal, spacing, empty):
+
+        '''
+
+        Initialize the line_template class.
+
+        Arguments
+        =========
+            positions (list): column index or character range of each quantity
+                              ([None] for a single quantity with no position)
+            max_decimal (int): number of decimal points for floats in scientific notation
+            spacing (str): characters that provide spacing in between quantities
+            empty (str): string written in columns without quantity (spacing included)
+
+        '''
+
+        # Declare the format string (no format string if character ranges overlap)
+        self.__format = None
+        self.__strip = False
+        self.__ranges = None
+        self.max_decimals = [max_decimal] * len(positions)
+
+        # Single quantity with no position
+        if positions[0] == None:
+            self.__format = "{0}\n".format
+
+        # Column indexes, with the empty character in between
+        elif isinstance(positions[0], int):
+            parts = []
+            for i_c in range(max(positions)+1):
+                if i_c in positions:
+                    parts.append("{" + str(positions.index(i_c)) + "}" + _escape(spacing))
+                else:
+                    parts.append(_escape(empty))
+            self.__format = "".join(parts).format
+            self.__strip = True
+
+        # Character ranges
+        else:
+            self.__compile_ranges(positions, max_decimal)
+
+
+    ####################
+    #  Compile ranges  #
+    ####################
+    def __compile_ranges(self, positions, max_decimal):
+
+        '''
+
+        Compile the template of character ranges. Each string is truncated
+        to the width of its range and padded with spaces. If ranges overlap,
+        strings are written one after the other on the line (the last one
+        wins), so that no format string can be used.
+
+        Arguments
+        =========
+            positions (list): character range (lower, upper index) of each quantity
+            max_decimal (int): number of decimal points for floats in scientific notation
+
+        '''
+
+        # Adjust decimal points in case not enough space
+        self.max_decimals = [min(max_decimal, pos[1]-pos[0]-6) for pos in positions]
+
+        # Collect the length of the line and the ranges that can hold characters
+        self.__length = max(max(pos[1] for pos in positions)+1, 0)
+        self.__ranges = [(pos[0], pos[1]+1) for pos in positions]
+        ranges = sorted([(i_low, i_upp, i_q) for i_q, (i_low, i_upp) \
+                         in enumerate(self.__ranges) if i_upp > i_low])
+
+        # Keep the ranges as they are if they overlap
+        for i_r in range(1, len(ranges)):
+            if ranges[i_r][0] < ranges[i_r-1][1]:
+                return
+
+        # Build the format string, range after range
+        parts = []
+        i_char = 0
+        for i_low, i_upp, i_q in ranges:
+            width = str(i_upp - i_low)
+            parts.append(" " * (i_low - i_char))
+            parts.append("{" + str(i_q) + ":<" + width + "." + width + "}")
+            i_char = i_upp
+        parts.append(" " * (self.__length - i_char) + "\n")
+        self.__format = "".join(parts).format
+
+
+    ##########
+    #  Fill  #
+    ##########
+    def fill(self, strings):
+
+        '''
+
+        Return the output line (str) for the strings of the quantities.
+
+        Argument
+        ========
+            strings (list of str): string of each quantity
+
+        '''
+
+        # Write the strings one after the other if character ranges overlap
+        if self.__format == None:
+            line_list = [" "] * self.__length
+            for q_str, (i_char_min, i_char_upp) in zip(strings, self.__ranges):
+                i_char_max = min(i_char_upp, len(q_str)+i_char_min)
+                if i_char_max > i_char_min:
+                    line_list[i_char_min:i_char_max] = q_str[:i_char_max-i_char_min]
+            return "".join(line_list) + "\n"
+
+        # Fill the format string (removing the spaces at the end for columns)
+        if self.__strip:
+            return self.__format(*strings).rstrip(" ") + "\n"
+        return self.__format(*strings)
+
+
+    ##################
+    #  Fill columns  #
+    ##################
+    def fill_columns(self, columns):
+
+        '''
+
+        Return the output line (str) of every entry, out of the strings of
+        each quantity for every entry.
+
+        Argument
+        ========
+            columns (list of lists of str): strings of each quantity, for every entry
+
+        '''
+
+        # Fill the template line by line if character ranges overlap
+        if self.__format == None:
+            return [self.fill(strings) for strings in zip(*columns)]
+
+        # Fill the format string for every entry at once otherwise
+        lines = map(self.__format, *columns)
+        if self.__strip:
+            return [line.rstrip(" ") + "\n" for line in lines]
+        return list(lines)
+
+
+############
+#  Escape  #
+############
+def _escape(text):
+
+    '''
+
+    Return a text that can be placed in a format string as is.
+
+    Argument
+    ========
+        text (str): text to be escaped
+
+    '''
+
+    # Double the braces
+    return text.replace("{", "{{").replace("}", "}}")
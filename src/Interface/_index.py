@@ -0,0 +1,260 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Secondary indexes on the columns (see _columns.py) of a data
+    object, used to answer point (=, in) and range (<, <=, >, >=)
+    conditions without scanning every entry.
+
+'''
+
+# Import Python packages
+import numpy as np
+
+# Import Interface toolkit
+from . import columns as cc
+
+
+# Operators that can be answered with the sorted index
+_range_operators = [">=", ">", "<=", "<"]
+
+
+#######################
+#  Declare the class  #
+#######################
+class quantity_index( object ):
+
+    '''
+
+    Index of one quantity. The sorted index (argsort of the values)
+    answers range conditions, and the hash index (value --> indexes)
+    answers = and in conditions. For array quantities, every item of
+    every entry is indexed.
+
+    Attributes
+    ==========
+        column (scalar_column or ragged_column): indexed column
+        order (np.ndarray): indexes that sort the values
+        sorted_values (np.ndarray): values in increasing order (NaN last)
+        nb_valid (int): number of sorted values that are not NaN
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, column):
+
+        '''
+
+        Initialize the quantity_index class.
+
+        Argument
+        ========
+            column (scalar_column or ragged_column): column to be indexed
+
+        '''
+
+        # Keep the column and find the entry of every item (array quantity)
+        self.column = column
+        if isinstance(column, cc.ragged_column):
+            self.__item_entries = np.repeat(np.arange(len(column)), column.lengths())
+        else:
+            self.__item_entries = None
+
+        # Build the sorted index (missing values are left out)
+        if column.valid is None:
+            self.order = np.argsort(column.values, kind="stable")
+        else:
+            i_valid = np.flatnonzero(column.valid)
+            self.order = i_valid[np.argsort(column.values[i_valid], kind="stable")]
+        self.sorted_values = column.values[self.order]
+
+        # NaN values are sorted last, and never satisfy any range condition
+        if self.sorted_values.dtype.kind == "f":
+            self.nb_valid = len(self.sorted_values) - int(np.count_nonzero(np.isnan(self.sorted_values)))
+        else:
+            self.nb_valid = len(self.sorted_values)
+
+        # The hash index is only built if needed
+        self.__hash = None
+
+
+    ###################
+    #  Lookup values  #
+    ###################
+    def __lookup_values(self, operator, value):
+
+        '''
+
+        Return the (increasing) indexes of the values that satisfy
+        "quantity operator value", or None if the index cannot be used.
+
+        Arguments
+        =========
+            operator (str): =, >=, >, <=, or <
+            value (float or str): value compared with the quantity
+
+        '''
+
+        # Use the hash index for equality
+        if operator == "=":
+            if self.__hash == None:
+                self.__build_hash()
+            return self.__hash.get(value, np.zeros(0, dtype=np.int64))
+
+        # Find the bounds of the sorted values that satisfy the condition
+        valid = self.sorted_values[:self.nb_valid]
+        if operator == ">=":
+            i_low, i_upp = np.searchsorted(valid, value, side="left"), self.nb_valid
+        elif operator == ">":
+            i_low, i_upp = np.searchsorted(valid, value, side="right"), self.nb_valid
+        elif operator == "<=":
+            i_low, i_upp = 0, np.searchsorted(valid, value, side="right")
+        elif operator == "<":
+            i_low, i_upp = 0, np.searchsorted(valid, value, side="left")
+        else:
+            return None
+
+        # Return the indexes in their original order
+        return np.sort(self.order[i_low:i_upp])
+
+
+    ################
+    #  Build hash  #
+    ################
+    def __build_hash(self):
+
+        '''
+
+        Build the hash index, where each distinct value points to the
+        (increasing) indexes where it appears.
+
+        '''
+
+        # Find where each distinct value starts in the sorted values
+        distinct, i_first = np.unique(self.sorted_values, return_index=True)
+        groups = np.split(self.order, i_first[1:])
+
+        # Map every distinct value to its indexes
+        self.__hash = dict(zip(distinct.tolist(), groups))
+
+
+    ####################
+    #  Lookup entries  #
+    ####################
+    def lookup_entries(self, pred):
+
+        '''
+
+        Return the (increasing) indexes of the entries that satisfy a
+        predicate, or None if the outcome is not one boolean per entry,
+        or if the index cannot be used for this predicate.
+
+        Argument
+        ========
+            pred (predicate): condition on the indexed quantity
+
+        '''
+
+        # Value to be compared with the quantity
+        value = self.__convert_value(pred)
+        if value is None:
+            return None
+
+        # Math operators on scalar quantities
+        if self.__item_entries is None:
+            if pred.operator == "=" or pred.operator in _range_operators:
+                return self.__lookup_values(pred.operator, value)
+            return None
+
+        # Items within array quantities
+        if pred.operator == "in":
+            i_items = self.__lookup_values("=", value)
+            return np.unique(self.__item_entries[i_items])
+
+        # Return None if the index cannot be used
+        return None
+
+
+    ##############
+    #  Evaluate  #
+    ##############
+    def evaluate(self, pred):
+
+        '''
+
+        Return the outcome of a predicate in the same form as
+        conditions.evaluate_predicate, (mask, None) or (mask, offsets),
+        or None if the index cannot be used for this predicate.
+
+        Argument
+        ========
+            pred (predicate): condition on the indexed quantity
+
+        '''
+
+        # Negations are answered with the complement of = and in
+        negate = pred.operator in ["!=", "not in"]
+        if negate:
+            pred = pred._replace(operator={"!=": "=", "not in": "in"}[pred.operator])
+
+        # Entry-level outcome
+        i_entries = self.lookup_entries(pred)
+        if not i_entries is None:
+            mask = np.zeros(len(self.column), dtype=bool)
+            offsets = None
+            mask[i_entries] = True
+
+        # Item-level outcome (math operators on array quantities)
+        elif not self.__item_entries is None and not pred.operator == "in":
+            value = self.__convert_value(pred)
+            if value is None:
+                return None
+            mask = np.zeros(len(self.column.values), dtype=bool)
+            offsets = self.column.offsets
+            mask[self.__lookup_values(pred.operator, value)] = True
+
+        # Return None if the index cannot be used
+        else:
+            return None
+
+        # Return the outcome
+        if negate:
+            mask = ~mask
+        return mask, offsets
+
+
+    ###################
+    #  Convert value  #
+    ###################
+    def __convert_value(self, pred):
+
+        '''
+
+        Return the value of a predicate converted to the type of the
+        indexed values, or None if the index cannot be used (e.g. a
+        substring search within a string quantity).
+
+        Argument
+        ========
+            pred (predicate): condition on the indexed quantity
+
+        '''
+
+        # Strings are only indexed for exact matches of array items
+        if self.column.dtype.kind == "U":
+            if pred.operator in ["in", "not in"] and not self.__item_entries is None:
+                return pred.value
+            return None
+
+        # Substring searches cannot be done on digits
+        if pred.operator in ["in", "not in"] and self.__item_entries is None:
+            return None
+
+        # Digits are compared as floats
+        try:
+            return float(pred.value)
+        except ValueError:
+            return None
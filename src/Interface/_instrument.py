@@ -0,0 +1,412 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Opt-in instrumentation of read_file. When an observer is set on a
+    reader (see read_data_file.observer), each reading collects the wall
+    time spent in each stage along with a few counters, and hands them
+    to the observer once the reading is done. When no observer is set,
+    nothing is timed or counted.
+
+        rec = instrument.recorder()
+        reader.observer = rec
+        d = reader.read_file("data.txt", "structure.txt")
+        print(rec.stats[-1].summary())
+
+'''
+
+# Import Python packages
+import sys
+import time
+import logging
+import collections
+
+
+#######################
+#  Declare the class  #
+#######################
+class read_stats( object ):
+
+    '''
+
+    Wall time spent in each stage of one reading, and counters. The
+    stages of a sequential reading are, in order:
+
+        structure: compile the structure file
+        scan: read the lines, flag the ignored ones, and split them into entries
+        extract: convert the quantities of whole blocks of lines at once
+        assemble: add the entries to the columns (see column_builder)
+        set_data: create the data object (arrays, digit quantities, log_ quantities)
+        validation: compare with the test file, if any
+
+    Parallel readings report count_lines, parse_chunks, and combine
+    instead of scan, extract, and assemble (lines_scanned then only
+    counts the lines that are not ignored, and conversion failures are
+    not counted). A reading loaded from the cache only reports the
+    cache stage.
+
+    Attributes
+    ==========
+        file_path (str): path to the input data file
+        stages (OrderedDict): wall time (seconds) of each stage, in order of first appearance
+        lines_scanned (int): number of lines read from the file
+        lines_ignored (int): number of lines ignored ($IGNORE flags and ignore_lines)
+        nb_entries (int): number of entries produced
+        conversion_failures (int): number of fields that could not be converted (set to None)
+        bytes_read (int): number of characters read, including line breaks
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, file_path=""):
+
+        '''
+
+        Initialize the read_stats class.
+
+        Argument
+        ========
+            file_path (str): path to the input data file
+
+        '''
+
+        # Declare the stages and the counters
+        self.file_path = file_path
+        self.stages = collections.OrderedDict()
+        self.lines_scanned = 0
+        self.lines_ignored = 0
+        self.nb_entries = 0
+        self.conversion_failures = 0
+        self.bytes_read = 0
+
+
+    ###########
+    #  Stage  #
+    ###########
+    def stage(self, name):
+
+        '''
+
+        Return a context manager adding the wall time of its block to
+        a given stage.
+
+        Argument
+        ========
+            name (str): name of the stage
+
+        '''
+
+        # Time the stage
+        return _stage_timer(self, name)
+
+
+    #############
+    #  As dict  #
+    #############
+    def as_dict(self):
+
+        '''
+
+        Return the stages and counters as a dictionary (e.g. for JSON).
+
+        '''
+
+        # Copy the stages and the counters
+        return {"file_path": self.file_path, "stages": dict(self.stages), \
+                "total_seconds": sum(self.stages.values()), \
+                "lines_scanned": self.lines_scanned, "lines_ignored": self.lines_ignored, \
+                "nb_entries": self.nb_entries, "conversion_failures": self.conversion_failures, \
+                "bytes_read": self.bytes_read}
+
+
+    #############
+    #  Summary  #
+    #############
+    def summary(self):
+
+        '''
+
+        Return a summary table of the stages and counters, as a string.
+
+        '''
+
+        # Time spent in each stage, with its share of the total
+        total = sum(self.stages.values())
+        rows = ["Reading "+str(self.file_path), \
+                "  {:<14} {:>11} {:>7}".format("stage", "seconds", "%")]
+        for name, seconds in self.stages.items():
+            rows.append("  {:<14} {:>11.5f} {:>7.1f}".format(name, seconds, \
+                100 * seconds / total if total > 0 else 0.0))
+        rows.append("  {:<14} {:>11.5f} {:>7.1f}".format("total", total, 100.0))
+
+        # Counters
+        for label, value in [("lines scanned", self.lines_scanned), \
+                             ("lines ignored", self.lines_ignored), \
+                             ("entries", self.nb_entries), \
+                             ("conv. failures", self.conversion_failures), \
+                             ("bytes read", self.bytes_read)]:
+            rows.append("  {:<14} {:>11}".format(label, value))
+
+        # Return the table
+        return "\n".join(rows)
+
+
+#######################
+#  Declare the class  #
+#######################
+class _stage_timer( object ):
+
+    '''
+
+    Context manager adding the wall time of its block to a stage.
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, stats, name):
+
+        '''
+
+        Initialize the _stage_timer class.
+
+        Arguments
+        =========
+            stats (read_stats): statistics of the current reading
+            name (str): name of the stage
+
+        '''
+
+        # Keep the targeted stage
+        self.stats = stats
+        self.name = name
+
+
+    ###########
+    #  Enter  #
+    ###########
+    def __enter__(self):
+
+        '''
+
+        Start the timer.
+
+        '''
+
+        # Keep the starting time
+        self.t_start = time.perf_counter()
+        return self
+
+
+    ##########
+    #  Exit  #
+    ##########
+    def __exit__(self, *exc):
+
+        '''
+
+        Add the elapsed time to the stage.
+
+        '''
+
+        # Add the elapsed time (exceptions are not suppressed)
+        t_stage = time.perf_counter() - self.t_start
+        self.stats.stages[self.name] = self.stats.stages.get(self.name, 0.0) + t_stage
+        return False
+
+
+#######################
+#  Declare the class  #
+#######################
+class _no_stage( object ):
+
+    '''
+
+    Context manager doing nothing, used when instrumentation is disabled.
+
+    '''
+
+    ###########
+    #  Enter  #
+    ###########
+    def __enter__(self):
+        return self
+
+
+    ##########
+    #  Exit  #
+    ##########
+    def __exit__(self, *exc):
+        return False
+
+
+# Shared context manager used when instrumentation is disabled
+no_stage = _no_stage()
+
+
+###########
+#  Stage  #
+###########
+def stage(stats, name):
+
+    '''
+
+    Return a context manager timing a stage if stats are collected,
+    or a context manager doing nothing otherwise.
+
+    Arguments
+    =========
+        stats (read_stats): statistics of the current reading (None if disabled)
+        name (str): name of the stage
+
+    '''
+
+    # Do nothing if instrumentation is disabled
+    if stats == None:
+        return no_stage
+    return stats.stage(name)
+
+
+#######################
+#  Declare the class  #
+#######################
+class recorder( object ):
+
+    '''
+
+    Observer keeping the statistics of every reading. It can also be
+    used as a context manager, which sets itself as the observer of a
+    reader and restores the previous observer on exit.
+
+        with instrument.recorder(reader) as rec:
+            reader.read_file("data.txt", "structure.txt")
+        rec.print_summary()
+
+    Attribute
+    =========
+        stats (list of read_stats): statistics of each reading, in order
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, reader=None):
+
+        '''
+
+        Initialize the recorder class.
+
+        Argument
+        ========
+            reader (read_data_file): reader observed within a with block
+
+        '''
+
+        # Declare the statistics
+        self.stats = []
+        self.__reader = reader
+        self.__previous = None
+
+
+    ##########
+    #  Call  #
+    ##########
+    def __call__(self, stats):
+
+        '''
+
+        Keep the statistics of a reading.
+
+        Argument
+        ========
+            stats (read_stats): statistics of the reading
+
+        '''
+
+        # Add the statistics
+        self.stats.append(stats)
+
+
+    ###########
+    #  Enter  #
+    ###########
+    def __enter__(self):
+
+        '''
+
+        Set the recorder as the observer of the reader.
+
+        '''
+
+        # Replace the observer of the reader
+        if not self.__reader == None:
+            self.__previous = self.__reader.observer
+            self.__reader.observer = self
+        return self
+
+
+    ##########
+    #  Exit  #
+    ##########
+    def __exit__(self, *exc):
+
+        '''
+
+        Restore the previous observer of the reader.
+
+        '''
+
+        # Restore the observer of the reader
+        if not self.__reader == None:
+            self.__reader.observer = self.__previous
+        return False
+
+
+    ###################
+    #  Print summary  #
+    ###################
+    def print_summary(self, file=sys.stdout):
+
+        '''
+
+        Print the summary table of every reading.
+
+        Argument
+        ========
+            file (file): where the tables are printed
+
+        '''
+
+        # Print one table per reading
+        for stats in self.stats:
+            print(stats.summary(), file=file)
+
+
+#################
+#  Log summary  #
+#################
+def log_summary(stats, logger=None, level=logging.INFO):
+
+    '''
+
+    Observer logging the summary table of a reading (see read_stats.summary).
+
+        reader.observer = instrument.log_summary
+
+    Arguments
+    =========
+        stats (read_stats): statistics of the reading
+        logger (logging.Logger): where the table is logged (None for the "Interface" logger)
+        level (int): logging level
+
+    '''
+
+    # Log the summary table
+    if logger == None:
+        logger = logging.getLogger("Interface")
+    logger.log(level, stats.summary())
@@ -0,0 +1,213 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+'''
+
+# Standard Python modules
+import collections
+import itertools
+
+
+# Declare the class
+class line_buffer( object ):
+
+    '''
+
+    This class gives indexed access to the lines of a file while only
+    keeping a small lookahead window in memory. Lines can only be
+    visited in increasing order: asking for a line drops every line
+    that comes before it.
+
+    Lines are read from the source in chunks of chunk_size lines. If a
+    classify function is provided, it is called once per chunk to flag
+    the lines that should be skipped (see is_skipped).
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, lines, classify=None, chunk_size=1024):
+
+        '''
+
+        Initialize the line_buffer class.
+
+        Arguments
+        =========
+            lines (iterable of str): lines of the file, without "\n"
+            classify (function): (lines, index of the first line) --> list of bool (True to skip)
+            chunk_size (int): number of lines read from the source at once
+
+        '''
+
+        # Keep the source of lines, the buffered window, and the skip flags
+        self.__source = iter(lines)
+        self.__buffer = collections.deque()
+        self.__skipped = collections.deque()
+        self.__classify = classify
+        self.__chunk_size = chunk_size
+
+        # Line index of the first line in the buffer
+        self.__i_first = 0
+
+        # Becomes True when the source has no more lines
+        self.__exhausted = False
+
+
+    ##############
+    #  Get line  #
+    ##############
+    def get_line(self, i_line):
+
+        '''
+
+        Return the line at a given index, or None if the index is
+        beyond the last line of the file.
+
+        Argument
+        ========
+            i_line (int): line index within the file
+
+        '''
+
+        # Drop the lines that will not be visited anymore
+        while self.__i_first < i_line:
+            if len(self.__buffer) == 0 and not self.__fill():
+                return None
+            nb_drop = min(i_line - self.__i_first, len(self.__buffer))
+            for i_drop in range(nb_drop):
+                self.__buffer.popleft()
+                self.__skipped.popleft()
+            self.__i_first += nb_drop
+
+        # Make sure the targetted line is in the buffer
+        if not self.__has_index(i_line):
+            return None
+
+        # Return the targetted line
+        return self.__buffer[i_line - self.__i_first]
+
+
+    ################
+    #  Is skipped  #
+    ################
+    def is_skipped(self, i_line):
+
+        '''
+
+        Return True if the line at a given index was flagged as a line
+        to be skipped by the classify function.
+
+        Argument
+        ========
+            i_line (int): line index within the file
+
+        '''
+
+        # Return the flag of the line (False if beyond the last line)
+        if self.get_line(i_line) == None:
+            return False
+        return self.__skipped[i_line - self.__i_first]
+
+
+    #############
+    #  Is last  #
+    #############
+    def is_last(self, i_line):
+
+        '''
+
+        Return True if the line at a given index is the last line of the file.
+
+        Argument
+        ========
+            i_line (int): line index within the file
+
+        '''
+
+        # Look one line ahead
+        return not self.__has_index(i_line + 1)
+
+
+    ###########
+    #  Close  #
+    ###########
+    def close(self):
+
+        '''
+
+        Release the source of lines (e.g. close the underlying file).
+
+        '''
+
+        # Close the source if it can be closed
+        if hasattr(self.__source, "close"):
+            self.__source.close()
+        self.__buffer.clear()
+        self.__skipped.clear()
+        self.__exhausted = True
+
+
+    ###############
+    #  Has index  #
+    ###############
+    def __has_index(self, i_line):
+
+        '''
+
+        Fill the buffer up to a given line index, and return whether
+        that line exists.
+
+        Argument
+        ========
+            i_line (int): line index within the file
+
+        '''
+
+        # Read lines from the source until the index is covered
+        while i_line - self.__i_first >= len(self.__buffer):
+            if not self.__fill():
+                return False
+
+        # Return True if the index is covered by the buffer
+        return True
+
+
+    ##########
+    #  Fill  #
+    ##########
+    def __fill(self):
+
+        '''
+
+        Add the next chunk of lines of the source at the end of the
+        buffer, along with their skip flags. Return False if there is
+        no more line to add.
+
+        '''
+
+        # Return False if the source is already exhausted
+        if self.__exhausted:
+            return False
+
+        # Read the next chunk of lines
+        chunk = list(itertools.islice(self.__source, self.__chunk_size))
+        if len(chunk) == 0:
+            self.__exhausted = True
+            return False
+
+        # Flag the lines to be skipped
+        if self.__classify == None:
+            self.__skipped.extend([False] * len(chunk))
+        else:
+            i_chunk = self.__i_first + len(self.__buffer)
+            self.__skipped.extend(self.__classify(chunk, i_chunk))
+
+        # Add the lines
+        self.__buffer.extend(chunk)
+
+        # Return True if lines were added
+        return True
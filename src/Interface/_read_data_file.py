@@ -6,17 +6,50 @@
 '''
 
 # Standard Python modules
+import os
+import sys
 import copy
+import collections
+import hashlib
+import itertools
+import concurrent.futures
 import numpy as np
 
 # Data object to collect the data dictionary resulting from reading
 from . import data as dd
 from . import data_file
+from . import line_buffer as lb
+from . import columns as cc
+from . import structure as st
+from . import column_builder as cb
+from . import converters as cv
+from . import fixed_width as fw
+from . import storage
+from . import schema as sc
+from . import instrument as ins
+from . import compression as cp
+from ._version import version
 
 # Interface toolkit
 from . import interface_utils as utils
 
 
+# Lines waiting for the batch extraction of their quantities
+#   structure (structure_line): instructions on how to extract quantities
+#   lines (list of str): lines of the input file
+_pending_lines = collections.namedtuple("_pending_lines", ["structure", "lines"])
+
+# Split modes where the quantities of several lines can be extracted at once
+_batch_modes = ["char", "index", "line"]
+
+# Format of the readings saved in the cache, to be increased whenever the
+# data objects obtained from the same files change (see cache_key)
+_cache_format = 1
+
+# Hash of the source code of the modules that read data files (see reader_source_hash)
+_reader_hash = None
+
+
 #######################
 #  Declare the class  #
 #######################
@@ -32,7 +65,7 @@ class read_data_file( data_file.data_file ):
     #################################
     #  Initialization of the class  #
     #################################
-    def __init__(self, **kwargs):
+    def __init__(self, cache_dir=None, cache_max_size=None, **kwargs):
 
         '''
 
@@ -41,17 +74,36 @@ class read_data_file( data_file.data_file ):
         Arguments
         =========
             root_path (str): root path from which data files will be read
+            cache_dir (str): if provided, directory where parsed files are cached
+            cache_max_size (int): maximum size of the cache in bytes (None for no limit)
 
         '''
 
         # Initialize the data file class
         data_file.data_file.__init__(self, **kwargs)
 
+        # Minimum size (in bytes) of the file chunks read in parallel (see read_file)
+        self.min_chunk_size = 1 << 22
+
+        # Number of entries extracted at once before being added to the columns
+        self.block_size = 10000
+
+        # Function receiving the statistics of each reading (see instrument.read_stats)
+        # No statistics are collected when this is None
+        self.observer = None
+
+        # Declare the on-disk cache of parsed files (if requested)
+        if cache_dir == None:
+            self.cache = None
+        else:
+            self.cache = storage.data_cache(cache_dir, max_size=cache_max_size)
+
 
     ###############
     #  Read file  #
     ###############
-    def read_file(self, file_path, structure_path, test_path="", ignore_lines=[]):
+    def read_file(self, file_path, structure_path, test_path="", ignore_lines=[], \
+                  columnar=False, workers=1):
 
         '''
 
@@ -59,79 +111,610 @@ class read_data_file( data_file.data_file ):
         store them into a list of dictionaries, where each index 
         is one specific file entry.
 
+        If a cache directory was provided (see __init__), the parsed data
+        are saved in a binary columnar form, and later readings of the
+        same data file with the same structure file are loaded from the
+        cache instead of being parsed. The cache is not used when a test
+        file is provided.
+
+        With workers > 1, large files (see min_chunk_size) are split into
+        chunks aligned with entry boundaries, and the chunks are parsed in
+        parallel processes. This is only possible when every entry covers
+        a fixed number of lines (see structure.count_entry_lines) and when
+        the file is not compressed, otherwise the file is read sequentially.
+
+        Compressed files (.gz, .bz2, .xz, or recognized by their first bytes)
+        are decompressed on the fly while being read (see compression).
+
+        If an observer is set (see instrument), it receives the time spent
+        in each stage of the reading along with a few counters.
+
         Arguments
         =========
             file_path (str): path to the input data file
-            structure_path (str): path to the structure file (how to read data file)
+            structure_path (str or compiled structure): path to the structure file (how to read data file)
             test_path (str): path to the test file to make sure reading was ok
             ignore_lines (list of int): line indexes to be ignored
+            columnar (bool): if True, store quantities in NumPy columns (see data.set_data)
+            workers (int): number of processes (None for the number of CPUs)
+
+        '''
+
+        # Collect statistics if needed
+        stats = None if self.observer == None else ins.read_stats(file_path)
+
+        # Load the data from the cache if available
+        use_cache = not self.cache == None and len(test_path) == 0
+        if use_cache:
+            with ins.stage(stats, "cache"):
+                key = self.__cache_key(file_path, structure_path, ignore_lines)
+                data = self.cache.get(key)
+                if not data == None and not columnar:
+                    data.set_data(data.data, columnar=False)
+            if not data == None:
+                self.__notify(stats, data)
+                return data
+
+        # Parse chunks of the file in parallel if possible
+        data = None
+        if not workers == 1 and len(ignore_lines) == 0:
+            data = self.__read_chunks(file_path, structure_path, workers, columnar, stats)
+            if not data == None:
+                with ins.stage(stats, "validation"):
+                    if not self.__reading_validated(data, test_path):
+                        data = dd.data(dict())
+
+        # Read the file sequentially otherwise
+        if data == None:
+
+            # Initialize reading process
+            self.__init_reading(file_path, structure_path, ignore_lines, stats)
+
+            # Collect the quantities of every entry of the file (and their types)
+            try:
+                builder = self.__assemble(self.__scan_entries(batch=True))
+                hints = sc.from_structure(self.__structure)
+
+            # Delete temporary variables that aimed to assist this read_file function
+            finally:
+                self.__delete_temp_variables()
+
+            # Generate the Data Interface object (if everything went well)
+            data = self.__generate_DI(builder, test_path, columnar, stats, hints)
+
+        # Save the data in the cache if needed
+        if use_cache and data.nb_entries > 0:
+            with ins.stage(stats, "cache"):
+                self.cache.put(key, data)
+
+        # Return the Data Interface object
+        self.__notify(stats, data)
+        return data
+
+
+    ############
+    #  Notify  #
+    ############
+    def __notify(self, stats, data):
+
+        '''
+
+        Hand over the statistics of a reading to the observer (if any).
+
+        Arguments
+        =========
+            stats (read_stats): statistics of the reading (None if not collected)
+            data (data): data object resulting from the reading
 
         '''
 
+        # Send the statistics to the observer
+        if not stats == None:
+            stats.nb_entries = data.nb_entries
+            self.observer(stats)
+
+
+    #################
+    #  Read chunks  #
+    #################
+    def __read_chunks(self, file_path, structure_path, workers, columnar, stats=None):
+
+        '''
+
+        Split the input file into byte ranges, and parse them in parallel
+        processes. A first pass counts the lines to be read in each range,
+        which gives where each entry starts. Each process then parses the
+        entries starting within its range, and the resulting columns are
+        combined in order. $ONCE quantities, only found in the first chunk,
+        are applied to every entry. Return None if the file cannot (or
+        should not) be split.
+
+        Arguments
+        =========
+            file_path (str): path to the input data file
+            structure_path (str or compiled structure): path to the structure file (how to read data file)
+            workers (int): number of processes (None for the number of CPUs)
+            columnar (bool): if True, store quantities in NumPy columns
+            stats (read_stats): statistics of the reading (None if not collected)
+
+        '''
+
+        # Return None if the file is compressed, since positions within the
+        # decompressed content cannot be reached without decompressing it
+        if not cp.detect(self._root_path+file_path) == None:
+            return None
+
+        # Return None if entries do not cover a fixed number of lines
+        with ins.stage(stats, "structure"):
+            structure = self.compile_structure(structure_path)
+        nb_entry_lines = st.count_entry_lines(structure)
+        if nb_entry_lines == None:
+            return None
+        nb_first, nb_next = nb_entry_lines
+
+        # Split the file into byte ranges (return None if there is only one)
+        bounds = self.__chunk_bounds(file_path, structure, workers)
+        if bounds == None or len(bounds) < 3:
+            return None
+        full_path = self._root_path+file_path
+
+        # With a pool of processes ..
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+
+            # Count the lines to be read in each range
+            with ins.stage(stats, "count_lines"):
+                tasks = [(full_path, bounds[i], bounds[i+1], structure.ignore, \
+                          i == 0 and not structure.start == None) for i in range(len(bounds)-1)]
+                nb_lines = list(pool.map(_count_lines_worker, tasks))
+                i_lines = np.concatenate([[0], np.cumsum(nb_lines)]).tolist()
+
+            # Find the entries starting within each range
+            tasks = []
+            once = [l.index for b in structure.bloc for l in b.lines if l.once]
+            for i_chunk in range(len(bounds)-1):
+
+                # Number of lines to skip before the first entry starts
+                i_first = _next_entry_line(i_lines[i_chunk], nb_first, nb_next)
+                nb_skip = i_first - i_lines[i_chunk]
+
+                # Number of entries (None for the last chunk, read until the end)
+                if i_chunk == len(bounds) - 2:
+                    nb_entries = None
+                else:
+                    nb_entries = _nb_entries_before(i_lines[i_chunk+1], nb_first, nb_next) - \
+                                 _nb_entries_before(i_lines[i_chunk], nb_first, nb_next)
+                    if nb_entries == 0:
+                        continue
+
+                # Only the first chunk reads the $START flag and the $ONCE lines
+                if i_chunk == 0:
+                    tasks.append((self._root_path, file_path, structure, 0, 0, nb_entries, []))
+                else:
+                    tasks.append((self._root_path, file_path, structure._replace(start=None), \
+                                  bounds[i_chunk], nb_skip, nb_entries, once))
+
+            # Parse each chunk
+            with ins.stage(stats, "parse_chunks"):
+                chunks = list(pool.map(_read_chunk_worker, tasks))
+
+        # Count the lines read within the byte ranges
+        if not stats == None:
+            stats.lines_scanned = int(i_lines[-1])
+            stats.bytes_read = bounds[-1] - bounds[0]
+
+        # Only keep chunks with entries
+        quantities, columns, once, nb_entries = chunks[0]
+        chunks = [chunk for chunk in chunks if chunk[3] > 0]
+
+        # Return None if chunks do not have the same quantities
+        for chunk in chunks:
+            if not sorted(chunk[0]) == sorted(quantities):
+                return None
+
+        # Combine the columns of every chunk
+        with ins.stage(stats, "combine"):
+            data = dict()
+            for q in quantities:
+                data[q] = cc.concatenate([chunk[1][q] for chunk in chunks])
+                if not columnar and cc.is_column(data[q]):
+                    data[q] = data[q].tolist()
+
+            # Apply the $ONCE quantities to every entry
+            nb_entries = sum(chunk[3] for chunk in chunks)
+            for q in once:
+                data[q.split("$ONCE")[0]] = [once[q]] * nb_entries
+
+        # Create a data instance
+        with ins.stage(stats, "set_data"):
+            return dd.data(data, columnar=columnar, schema=sc.from_structure(structure))
+
+
+    ##################
+    #  Chunk bounds  #
+    ##################
+    def __chunk_bounds(self, file_path, structure, workers):
+
+        '''
+
+        Return the byte positions splitting the input file into ranges
+        of at least min_chunk_size bytes, each range starting at the
+        beginning of a line. The first range starts at the $START flag
+        if provided. Return None if the $START flag is not found.
+
+        Arguments
+        =========
+            file_path (str): path to the input data file
+            structure (compiled_structure): compiled structure
+            workers (int): number of processes (None for the number of CPUs)
+
+        '''
+
+        # Find the number of ranges
+        full_path = self._root_path+file_path
+        size = os.path.getsize(full_path)
+        if workers == None:
+            workers = os.cpu_count()
+
+        # With the input file open in binary mode ..
+        with open(full_path, "rb") as f:
+
+            # Find where the reading starts
+            i_start = 0
+            if not structure.start == None:
+                start = structure.start.encode()
+                for raw in f:
+                    if start in raw:
+                        break
+                    i_start += len(raw)
+                else:
+                    return None
+
+            # Split the rest of the file into ranges of similar size
+            nb_chunks = max(1, min(workers, (size - i_start) // max(self.min_chunk_size, 1)))
+            bounds = [i_start]
+            for i_chunk in range(1, nb_chunks):
+
+                # Move each bound to the beginning of the next line
+                f.seek(max(i_start + (size - i_start) * i_chunk // nb_chunks - 1, bounds[-1]))
+                f.readline()
+                if f.tell() > bounds[-1] and f.tell() < size:
+                    bounds.append(f.tell())
+
+        # Return the bounds
+        bounds.append(size)
+        return bounds
+
+
+    ################
+    #  Read chunk  #
+    ################
+    def _read_chunk(self, file_path, structure, offset, nb_skip, nb_entries, read_once):
+
+        '''
+
+        Parse the entries of one chunk of the input file (see __read_chunks),
+        and return the quantities, their columns, the $ONCE quantities, and
+        the number of entries.
+
+        Arguments
+        =========
+            file_path (str): path to the input data file
+            structure (compiled_structure): compiled structure
+            offset (int): byte position where the chunk starts
+            nb_skip (int): number of lines to skip before the first entry
+            nb_entries (int): number of entries to read (None to read until the end)
+            read_once (list of int): $ONCE structure lines that should not be read
+
+        '''
+
+        # Initialize the reading at the beginning of the chunk
+        self.__structure = structure
+        self.__ignore_lines = np.zeros(0, dtype=np.int64)
+        self.__ignore_regex = st.ignore_regex(structure.ignore)
+        self.__stats = None
+        lines = self._iter_lines(file_path, offset=offset)
+
+        # Skip the lines belonging to an entry that started in the previous chunk
+        while nb_skip > 0:
+            line = next(lines, None)
+            if line == None:
+                break
+            if not self.__should_ignore(line):
+                nb_skip -= 1
+        self.__lines = lb.line_buffer(lines, classify=self.__classify_lines)
+
+        # Collect the quantities of the entries of the chunk
+        try:
+            entries = itertools.islice(self.__scan_entries(set(read_once), True), nb_entries)
+            builder = self.__assemble(entries)
+        finally:
+            self.__delete_temp_variables()
+
+        # Store the quantities in columns (the $ONCE quantities are set apart)
+        quantities = builder.quantities
+        data = dd.data(builder.get_data(once=False), columnar=True)
+        columns = dict((q, data.data[q]) for q in quantities)
+
+        # Return the content of the chunk
+        return quantities, columns, builder.once, builder.nb_entries
+
+
+    ################
+    #  Read files  #
+    ################
+    def read_files(self, file_paths, structure_path, workers=None, concatenate=False, \
+                   ignore_lines=[], columnar=False):
+
+        '''
+
+        Read several data files that share the same structure file, using
+        a pool of processes. The structure is compiled once and sent to
+        every process, and each process returns its data in columnar form
+        to reduce the cost of sending it back. Return a list of data objects
+        (in the same order as file_paths), or a single data object with all
+        entries if concatenate is True.
+
+        Arguments
+        =========
+            file_paths (list of str): paths to the input data files
+            structure_path (str or compiled structure): path to the structure file (how to read data files)
+            workers (int): number of processes (None for the number of CPUs, 1 for no pool)
+            concatenate (bool): if True, combine all files into a single data object
+            ignore_lines (list of int): line indexes to be ignored in every file
+            columnar (bool): if True, store quantities in NumPy columns (see data.set_data)
+
+        '''
+
+        # Compile the structure only once for all files
+        structure = self.compile_structure(structure_path)
+
+        # Options needed to re-create this reader in each process
+        if self.cache == None:
+            options = (self._root_path, None, None)
+        else:
+            options = (self._root_path, self.cache.cache_dir, self.cache.max_size)
+        tasks = [(options, file_path, structure, ignore_lines) for file_path in file_paths]
+
+        # Read the files in this process if only one worker is requested
+        if workers == 1 or len(file_paths) <= 1:
+            columns = [_read_file_worker(task) for task in tasks]
+
+        # Read the files on a pool of processes
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                columns = list(pool.map(_read_file_worker, tasks))
+
+        # Re-create the data objects
+        data_list = [dd.data(data=c, columnar=True) for c in columns]
+
+        # Return a single data object if needed
+        if concatenate:
+            return dd.concatenate(data_list, columnar=columnar)
+
+        # Return the list of data objects
+        if not columnar:
+            for data in data_list:
+                data.set_data(data.data, columnar=False)
+        return data_list
+
+
+    ###############
+    #  Cache key  #
+    ###############
+    def __cache_key(self, file_path, structure_path, ignore_lines):
+
+        '''
+
+        Return the key identifying a reading in the cache, which is a
+        hash of the content of the data and structure files, of the
+        ignored lines, of the library version and cache format, and of
+        the source code of the reading modules (see reader_source_hash),
+        so that readings are not reused once the reading process changed.
+
+        Arguments
+        =========
+            file_path (str): path to the input data file
+            structure_path (str or compiled structure): path to the structure file (how to read data file)
+            ignore_lines (list of int): line indexes to be ignored
+
+        '''
+
+        # Hash the version of the reading process and the reading options
+        h = hashlib.sha256()
+        h.update(version.encode())
+        h.update(str(_cache_format).encode())
+        h.update(_reader_source_hash().encode())
+        h.update(repr(sorted(ignore_lines)).encode())
+
+        # Hash the structure (its content if this is a path)
+        if isinstance(structure_path, str):
+            self.__hash_file(h, structure_path)
+        else:
+            h.update(repr(structure_path).encode())
+
+        # Hash the content of the data file
+        self.__hash_file(h, file_path)
+
+        # Return the key
+        return h.hexdigest()
+
+
+    ###############
+    #  Hash file  #
+    ###############
+    def __hash_file(self, h, file_path):
+
+        '''
+
+        Add the content of a file to a hash, one block at a time.
+
+        Arguments
+        =========
+            h (hashlib hash): hash to be updated
+            file_path (str): path to the file
+
+        '''
+
+        # Add the file size first to separate consecutive files
+        full_path = self._root_path+file_path
+        h.update(str(os.path.getsize(full_path)).encode())
+
+        # Add the content of the file
+        with open(full_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+
+
+    ##################
+    #  Iter entries  #
+    ##################
+    def iter_entries(self, file_path, structure_path, ignore_lines=[]):
+
+        '''
+
+        Walk through the input file incrementally and yield one entry
+        at a time, as a dictionary of quantities. Only a small lookahead
+        window of lines is kept in memory, so this can be used on files
+        that are too large to be loaded with read_file.
+
+        Quantities flagged with $ONCE are added to every yielded entry.
+        Unlike read_file, quantities that are missing from an entry are
+        simply absent from its dictionary (they are not filled with 0 or "").
+
+        Arguments
+        =========
+            file_path (str): path to the input data file
+            structure_path (str or compiled structure): path to the structure file (how to read data file)
+            ignore_lines (list of int): line indexes to be ignored
+
+        '''
+
+        # Work on a copy so that other readings can happen in between yields
+        reader = copy.copy(self)
+
         # Initialize reading process
-        i_line, line = self.__init_reading(file_path, structure_path, ignore_lines)
+        reader.__init_reading(file_path, structure_path, ignore_lines)
+
+        # Quantities that are only read once, but apply to every entry
+        once = dict()
+
+        # For each entry found in the file ..
+        try:
+            for entry in reader.__scan_entries():
+
+                # Clean the entry and combine its dictionaries
+                entry = cb.combine_entry(entry)
+                if len(entry) == 0:
+                    continue
+
+                # Convert lists into NumPy arrays, as done in the data class
+                for q in entry:
+                    if isinstance(entry[q], list):
+                        entry[q] = np.array(entry[q])
+
+                # Move the $ONCE quantities to the list of common quantities
+                for q in list(entry):
+                    if "$ONCE" in q:
+                        once[q.split("$ONCE")[0]] = entry.pop(q)
 
-        # Declare list of entries and structures that have been applied
-        entries = []
-        read_structure = []
+                # Yield the entry with the common quantities
+                entry.update(once)
+                yield entry
+
+        # Delete temporary variables that aimed to assist the reading
+        finally:
+            reader.__delete_temp_variables()
+
+
+    ##################
+    #  Scan entries  #
+    ##################
+    def __scan_entries(self, read_once=None, batch=False):
+
+        '''
+
+        Walk through the lines of the input file and yield the raw
+        content of each entry, as a list of dictionaries (one per
+        structure line).
+
+        With batch=True, lines are kept as _pending_lines (unless their
+        quantities are split with a simple .split()), to be extracted all
+        at once afterward (see __extract_pending).
+
+        Arguments
+        =========
+            read_once (set of int): $ONCE structure lines already applied
+            batch (bool): if True, delay the extraction of quantities
+
+        '''
+
+        # Quantities are needed right away if they set a number of repeats
+        for sub_bloc in self.__structure.bloc:
+            if isinstance(sub_bloc.repeat, str):
+                batch = False
+
+        # Initialize the line index
+        i_line, line = self.__get_start_line_index()
+
+        # Declare the set of $ONCE structure lines that have been applied
+        if read_once == None:
+            read_once = set()
 
         # While the file is not read completely ..
-        ongoing = True
+        ongoing = not line == None
         while ongoing:
 
             # Initialize the quantities of the upcoming entry
-            entries.append([])
+            entry = []
 
             # For each sub-bloc within the main bloc ..
-            for sub_bloc in self.__bloc:
+            for sub_bloc in self.__structure.bloc:
 
                 # Find the number of time this sub-bloc should be
                 # repeated to gather the quantities of a file entry
-                nb_repeats = self.__get_nb_repeats(sub_bloc, entries[-1])
+                nb_repeats = self.__get_nb_repeats(sub_bloc, entry)
                 for i_r in range(nb_repeats):
 
                     # For each line of the sub-bloc ..
-                    for structure in sub_bloc["lines"]:
-
-                        # Pre-screen the structure content to gain insights on how to proceed
-                        skip, structure, read_structure, multiline, ml_is_digit, ml_end_point = \
-                                self._screen_structure(structure, read_structure)
+                    for structure in sub_bloc.lines:
 
-                        # If there is something to collect on this line ..
-                        if not skip:
-                            if not structure == None:
+                        # Skip the line if it should only be read once
+                        if structure.once:
+                            if structure.index in read_once:
+                                continue
+                            read_once.add(structure.index)
 
-                                # If the quantities cover several lines ..
-                                if multiline:
+                        # If the quantities cover several lines ..
+                        if structure.multiline:
 
-                                    # Collect all the quantities listed on these lines
-                                    i_line, line, entries = self.__extract_ml_quantities(\
-                                        i_line, line, structure, entries, ml_is_digit, ml_end_point)
+                            # Collect all the quantities listed on these lines
+                            i_line, line, entry = self.__extract_ml_quantities(\
+                                i_line, line, structure, entry, batch)
 
-                                # If the quantities are not listed over several lines ..
-                                else:
+                        # Keep the line for a batch extraction if needed
+                        elif batch and structure.mode in _batch_modes:
+                            entry.append(_pending_lines(structure, [line]))
 
-                                    # Add the quantity directly to the dictionary
-                                    entries[-1].append(self.__get_quantities(\
-                                            line, structure, split_character=None))
+                        # If the quantities are not listed over several lines ..
+                        else:
 
-                            # Update the targetted line
-                            i_line, line = self.__update_line(i_line)
-                            if i_line == self.__nb_lines:
-                                ongoing = False
-                                break
+                            # Add the quantity directly to the dictionary
+                            entry.append(self.__get_quantities(line, structure))
 
-        # Delete temporary variables that aimed to assist this read_file function
-        self.__delete_temp_variables()
+                        # Update the targetted line
+                        i_line, line = self.__update_line(i_line)
+                        if line == None:
+                            ongoing = False
+                            break
 
-        # Generate and return the Data Interface object (if everything went well)
-        return self.__generate_DI(entries, test_path)
+            # Hand over the entry
+            yield entry
 
 
     ##################
     #  Init reading  #
     ##################
-    def __init_reading(self, file_path, structure_path, ignore_lines):
+    def __init_reading(self, file_path, structure_path, ignore_lines, stats=None):
 
         '''
 
@@ -140,27 +723,24 @@ class read_data_file( data_file.data_file ):
         Arguments
         =========
             file_path (str): path to the input data file
-            structure_path (str): path to the structure file (how to read data file)
-            test_path (str): path to the test file to make sure reading was ok
+            structure_path (str or compiled structure): path to the structure file (how to read data file)
             ignore_lines (list of int): line indexes to be ignored
+            stats (read_stats): statistics of the reading (None if not collected)
 
         '''
 
-        # Read the instructions on how to read the data file
-        self.__bloc, self.__header, self.__header_keys = \
-            self._create_bloc_structure(structure_path)
-
-        # Read all the lines of the input file
-        self.__lines, self.__nb_lines = self._read_lines(file_path)
+        # Get the compiled instructions on how to read the data file
+        self.__stats = stats
+        with ins.stage(stats, "structure"):
+            self.__structure = self.compile_structure(structure_path)
 
         # Temporarily assign self to reeaining recurent variables
-        self.__ignore_lines = ignore_lines
+        # (sorted line indexes, and a single pattern for all $IGNORE flags)
+        self.__ignore_lines = np.unique(np.array(ignore_lines, dtype=np.int64))
+        self.__ignore_regex = st.ignore_regex(self.__structure.ignore)
 
-        # Initialize the line index
-        i_line, line = self.__get_start_line_index()
-
-        # Return dynamic variables
-        return i_line, line
+        # Walk through the lines of the input file with a small lookahead window
+        self.__lines = lb.line_buffer(self._iter_lines(file_path), classify=self.__classify_lines)
 
 
     ###########################
@@ -175,48 +755,52 @@ class read_data_file( data_file.data_file ):
 
         '''
 
+        # Close the input file
+        self.__lines.close()
+
         # Delete variables
-        del self.__bloc
-        del self.__header
-        del self.__header_keys
+        del self.__structure
         del self.__ignore_lines
+        del self.__ignore_regex
         del self.__lines
-        del self.__nb_lines
+        del self.__stats
 
 
     ###########################
     #  Extract ML quantities  #
     ###########################
-    def __extract_ml_quantities(self, i_line, line, structure, entries,\
-                                      ml_is_digit, ml_end_point):
+    def __extract_ml_quantities(self, i_line, line, structure, entry, batch=False):
 
         '''
 
         Extract all quantities involved in a $MULTILINE command and 
-        add them to the entries array.
+        add them to the current entry.
 
         Arguments
         =========
             i_line (int): current line index
             line (str): current line
-            structure (dictionary): instructions on to extract quantities
-            entries: combined dictionaries (the content of the input file)
-            ml_is_digit (bool): True if the number of loops is provided
-            ml_end_point (str or int): Endpoint flag or number of loops 
+            structure (structure_line): instructions on to extract quantities
+            entry: dictionaries of the entry currently being read
+            batch (bool): if True, keep the lines for a batch extraction
 
         '''
 
-        # Create an entry for the data dictionary
-        entries[-1].append(dict())
+        # Create an entry for the data dictionary (or for the lines to be extracted later)
+        if batch and structure.mode in _batch_modes:
+            entry.append(_pending_lines(structure, []))
+        else:
+            entry.append(dict())
+        ml_end_point = structure.ml_end_point
 
         # If the number of multiline loops is provided ..
-        if ml_is_digit:
+        if structure.ml_is_digit:
 
             # Collect quantities over a fixed number of loops
             for i_loop in range(ml_end_point):
 
                 # Collect the quantities on the line
-                entries = self.__extract_ml_line(line, structure, entries)
+                entry = self.__extract_ml_line(line, structure, entry)
 
                 # Go to the next line if needed
                 if not i_loop == (ml_end_point - 1):
@@ -226,40 +810,45 @@ class read_data_file( data_file.data_file ):
         else:
 
             # Collect quantities until the end point is found ..
-            while not ml_end_point in line:
+            while not line == None and not ml_end_point in line:
 
                 # Collect the quantities on the line
-                entries = self.__extract_ml_line(line, structure, entries)
+                entry = self.__extract_ml_line(line, structure, entry)
 
                 # Go to the next line
-                if i_line == (self.__nb_lines - 1):
+                if self.__lines.is_last(i_line):
                     break
                 else:
                     i_line, line = self.__update_line(i_line, stop=ml_end_point)
 
         # Return updated variables
-        return i_line, line, entries
+        return i_line, line, entry
 
 
     #####################
     #  Extract ML line  #
     #####################
-    def __extract_ml_line(self, line, structure, entries):
+    def __extract_ml_line(self, line, structure, entry):
 
         '''
 
-        Extract quantities from a line and add them to the entries
-        array knowing that we are in the $MULTILINE mode and that
+        Extract quantities from a line and add them to the current
+        entry knowing that we are in the $MULTILINE mode and that
         each item in the listare progressively being appended.
 
         Arguments
         =========
             line (str): current line
-            structure (dictionary): instructions on to extract quantities
-            entries: combined dictionaries (the content of the input file)
+            structure (structure_line): instructions on to extract quantities
+            entry: dictionaries of the entry currently being read
 
         '''
 
+        # Keep the line if quantities are extracted later
+        if isinstance(entry[-1], _pending_lines):
+            entry[-1].lines.append(line)
+            return entry
+
         # Collect the quantities on the line
         quantities = self.__get_quantities(line, structure)
 
@@ -267,12 +856,12 @@ class read_data_file( data_file.data_file ):
         for quantity in quantities:
 
             # Add the quantity to the array
-            if not quantity in entries[-1][-1].keys():
-                entries[-1][-1][quantity] = []
-            entries[-1][-1][quantity].append(quantities[quantity])
+            if not quantity in entry[-1].keys():
+                entry[-1][quantity] = []
+            entry[-1][quantity].append(quantities[quantity])
 
-        # Return the updated entries array
-        return entries
+        # Return the updated entry
+        return entry
 
 
     #################
@@ -295,26 +884,23 @@ class read_data_file( data_file.data_file ):
 
         # Increment the line index
         i_line += 1
-        if i_line >= self.__nb_lines:
-            return self.__nb_lines, None
+        line = self.__lines.get_line(i_line)
 
         # Increment the line until this is a line to be treated
-        while i_line in self.__ignore_lines or self.__should_ignore(self.__lines[i_line]):
+        # The line is None if the index is going out of range
+        while not line == None and self.__lines.is_skipped(i_line):
 
             # Stop if the line includes a flag that tell a multiline process to stop
             if not stop == None:
-                if stop in self.__lines[i_line]:
+                if stop in line:
                     break
 
             # Go to the next line
             i_line += 1
+            line = self.__lines.get_line(i_line)
 
-            # Return if the index is going out of range
-            if i_line == self.__nb_lines:
-                return i_line, None
-        
         # Return the new line index
-        return i_line, self.__lines[i_line]
+        return i_line, line
 
 
     ##########################
@@ -325,24 +911,25 @@ class read_data_file( data_file.data_file ):
         '''
 
         Find the line index where the reading process should start within the 
-        input data file.
+        input data file. The returned line is None if there is nothing to read.
 
         '''
 
         # If there is a specific starting flag included in the structure header ..
-        if "START" in self.__header_keys:
+        if not self.__structure.start == None:
 
             # While the current line does include the flag ..
             i_line = 0
-            while not self.__header["START"] in self.__lines[i_line]:
+            line = self.__lines.get_line(i_line)
+            while not line == None and not self.__structure.start in line:
 
                 # Skip the line
                 i_line += 1
+                line = self.__lines.get_line(i_line)
 
-                # Send an error if the starting point is not found
-                if i_line == self.__nb_lines:
-                    print("Error - START flag "+self.__header["START"]+" not found within the file.")
-                    return None
+            # Send an error if the starting point is not found
+            if line == None:
+                print("Error - START flag "+self.__structure.start+" not found within the file.")
 
         # If no starting flag is used ..
         else:
@@ -351,7 +938,7 @@ class read_data_file( data_file.data_file ):
             i_line, line = self.__update_line(-1)
 
         # Return the starting line index
-        return i_line, self.__lines[i_line]
+        return i_line, line
 
 
     ###################
@@ -370,19 +957,56 @@ class read_data_file( data_file.data_file ):
 
         '''
 
-        # Return False if there is no "IGNORE" in the header
-        if not "IGNORE" in self.__header_keys:
+        # Return True if any of the $IGNORE flags is found in the line
+        if self.__ignore_regex == None:
             return False
+        return not self.__ignore_regex.search(line) == None
 
-        # For each set of characters that flags a line as a line to be ignored ..
-        for ign in self.__header["IGNORE"]:
 
-            # Return True if these character are found in the line
-            if ign in line:
-                return True
+    ####################
+    #  Classify lines  #
+    ####################
+    def __classify_lines(self, lines, i_first):
+
+        '''
+
+        Flag the lines of a chunk that should be ignored, either because
+        they include an $IGNORE flag, or because their index is listed in
+        ignore_lines. The flags are found with one search over the whole
+        chunk rather than one search per line and per flag.
+
+        Arguments
+        =========
+            lines (list of str): chunk of lines of the input file
+            i_first (int): line index of the first line of the chunk
+
+        '''
+
+        # Declare the flags
+        skipped = np.zeros(len(lines), dtype=bool)
+
+        # Flag the lines where any of the $IGNORE flags is found
+        if not self.__ignore_regex == None:
+            text = "\n".join(lines)
+            i_chars = [m.start() for m in self.__ignore_regex.finditer(text)]
+            if len(i_chars) > 0:
+                i_starts = np.zeros(len(lines), dtype=np.int64)
+                np.cumsum(np.fromiter(map(len, lines), dtype=np.int64, count=len(lines))[:-1] + 1, \
+                          out=i_starts[1:])
+                skipped[np.searchsorted(i_starts, i_chars, side="right") - 1] = True
 
-        # Return False if the line should not be ignored
-        return False
+        # Flag the line indexes to be ignored
+        i_low, i_upp = np.searchsorted(self.__ignore_lines, [i_first, i_first+len(lines)])
+        skipped[self.__ignore_lines[i_low:i_upp] - i_first] = True
+
+        # Count the lines and characters read, and the ignored lines
+        if not self.__stats == None:
+            self.__stats.lines_scanned += len(lines)
+            self.__stats.lines_ignored += int(np.count_nonzero(skipped))
+            self.__stats.bytes_read += sum(map(len, lines)) + len(lines)
+
+        # Return the flags
+        return skipped.tolist()
 
 
     ####################
@@ -403,12 +1027,10 @@ class read_data_file( data_file.data_file ):
         '''
 
         # Repeat once if no specification was given
-        if not "repeat" in sub_bloc.keys():
+        rp = sub_bloc.repeat
+        if rp == None:
             return 1
 
-        # Copy the repeating instruction
-        rp = sub_bloc["repeat"]
-
         # Return the number of repeats if directly provided
         if isinstance(rp, int):
             return rp
@@ -428,7 +1050,7 @@ class read_data_file( data_file.data_file ):
     ####################
     #  Get quantities  #
     ####################
-    def __get_quantities(self, line, structure, split_character=None):
+    def __get_quantities(self, line, structure):
 
         '''
 
@@ -438,10 +1060,7 @@ class read_data_file( data_file.data_file ):
         Arguments
         =========
             line (string): all characters of a given line from the input file
-            structure (dictionary): instructions on to extract quantities
-            split_character (string): special character used to split the line
-                                      None: split without character
-
+            structure (structure_line): instructions on to extract quantities
 
         '''
 
@@ -449,37 +1068,39 @@ class read_data_file( data_file.data_file ):
         quantities = dict()
 
         # Split the line (if needed)
-        ls = self.__split_line(line, structure, split_character)
+        ls = self.__split_line(line, structure)
 
         # Assing a list to the quantity is a simple split is used
-        if len(structure) == 1 and type(ls) == list and len(ls) > 1:
-            for quantity in structure.keys():
-                quantities[quantity] = ls
-                try:
-                    for i_item in range(len(ls)):
-                        quantities[quantity][i_item] = structure[quantity][0](ls[i_item])
-                except:
-                    quantities[quantity] = None
+        if len(structure.keys) == 1 and type(ls) == list and len(ls) > 1:
+            quantity = structure.keys[0]
+            q_type = structure.types[0]
+            try:
+                quantities[quantity] = [q_type(item) for item in ls]
+            except:
+                quantities[quantity] = None
+                self.__count_failures(1)
 
         # If there is only one quantity in the split line ..
         elif type(ls) == str:
 
             # Adjust the single variable type
-            for quantity in structure.keys():
+            for quantity, q_type in zip(structure.keys, structure.types):
                 try:
-                    quantities[quantity] = structure[quantity](ls)
+                    quantities[quantity] = q_type(ls)
                 except:
                     quantities[quantity] = None
+                    self.__count_failures(1)
 
         # If each value in ls has its own quantity label ..
         else:
 
             # Adjust the variable type of each quantity
-            for value, quantity in zip(ls, structure.keys()):
+            for value, quantity, q_type in zip(ls, structure.keys, structure.types):
                 try:
-                    quantities[quantity] = structure[quantity][0](value)
+                    quantities[quantity] = q_type(value)
                 except:
                     quantities[quantity] = None
+                    self.__count_failures(1)
 
         # Return empty dictionary if all quantities are None
         if len(quantities) == list(quantities.values()).count(None):
@@ -489,255 +1110,243 @@ class read_data_file( data_file.data_file ):
         return quantities
 
 
-    ################
-    #  Split line  #
-    ################
-    def __split_line(self, line, structure, split_character):
+    ##############
+    #  Assemble  #
+    ##############
+    def __assemble(self, entries):
 
         '''
 
-        Split a line following a given instruction.
+        Add the entries to a column_builder as they are read, and return
+        the builder. Entries are taken in blocks of block_size, so that the
+        pending lines of a whole block are extracted at once.
 
-        Arguments
-        =========
-            line (string): all characters of a given line from the input file
-            structure (dictionary): instructions on to extract quantities
-            split_character (string): special character used to split the line
-                                      None: split without character
+        Argument
+        ========
+            entries (iterator): raw content of each entry (see __scan_entries)
 
         '''
 
-        # Copy an example of the input structuree
-        ex_st = structure[list(structure.keys())[0]]
+        # Declare the columns
+        builder = cb.column_builder()
 
-        # Return the line if there is no split
-        if not type(ex_st) == tuple:
-            return line
+        # For each block of entries ..
+        while True:
+            with ins.stage(self.__stats, "scan"):
+                block = list(itertools.islice(entries, self.block_size))
+            if len(block) == 0:
+                break
 
-        # If the .split() function is used with specific index ..
-        if type(ex_st[1]) == int:
-
-            # Define the split line
-            first_split = line.split(split_character)
-            ls = []
+            # Add the entries of the block to the columns
+            with ins.stage(self.__stats, "extract"):
+                block = self.__extract_pending(block)
+            with ins.stage(self.__stats, "assemble"):
+                for entry in block:
+                    builder.add_entry(entry)
 
-            # Extract manually each quantiry
-            for q in structure:
-                ls.append(first_split[structure[q][1]])
+        # Return the columns
+        return builder
 
-            # Return the quantities
-            return ls
 
-        # If the .split() function is used without specific index ..
-        if ex_st[1] == "split":
+    #####################
+    #  Extract pending  #
+    #####################
+    def __extract_pending(self, entries):
 
-            # Return the simple split
-            return line.split(split_character)
+        '''
 
-        # If spaces are used to define where are the quantities ..
-        if type(ex_st[1]) == tuple:
+        Replace every _pending_lines within the entries by the quantities
+        extracted from its lines, as done by __get_quantities (single line)
+        or __extract_ml_line (multiline). The fields of all lines sharing the
+        same structure line are converted at once (see converters.convert_column),
+        and fields that cannot be converted are None.
 
-            # Define the split line
-            ls = []
-            
-            # Exctact manually each quantity
-            for q in structure:
-                i_low = structure[q][1][0]
-                i_upp = structure[q][1][1]
-                ls.append(line[i_low:i_upp+1])
+        Argument
+        ========
+            entries: dictionaries (or _pending_lines) of every entry
 
-            # Return the quantities
-            return ls
+        '''
 
+        # Group the pending lines by structure line
+        groups = dict()
+        for entry in entries:
+            for i_dct in range(len(entry)):
+                if isinstance(entry[i_dct], _pending_lines):
+                    groups.setdefault(entry[i_dct].structure.index, []).append((entry, i_dct))
+
+        # For each group of pending lines ..
+        for items in groups.values():
+            structure = items[0][0][items[0][1]].structure
+            keys = structure.keys
+
+            # Extract the quantities of every line at once
+            lines = []
+            for entry, i_dct in items:
+                lines += entry[i_dct].lines
+            columns = []
+            for fields, q_type in zip(self.__get_fields(lines, structure), structure.types):
+                values, valid = cv.convert_column(fields, q_type)
+                if not self.__stats == None:
+                    self.__count_failures(len(valid) - int(np.count_nonzero(valid)))
+                columns.append(cv.to_list(values, valid))
+            rows = list(zip(*columns))
+
+            # For each pending line(s) ..
+            i_row = 0
+            for entry, i_dct in items:
+                nb_rows = len(entry[i_dct].lines)
+
+                # Single line (empty dictionary if all quantities are None)
+                if not structure.multiline:
+                    row = rows[i_row]
+                    if row.count(None) == len(row):
+                        entry[i_dct] = dict()
+                    else:
+                        entry[i_dct] = dict(zip(keys, row))
 
-    ###################
-    #  Clean strings  #
-    ###################
-    def __clean_strings(self, entries):
+                # Multiline (lines where all quantities are None are skipped)
+                else:
+                    dct = dict()
+                    for row in rows[i_row:i_row+nb_rows]:
+                        if not row.count(None) == len(row):
+                            for key, value in zip(keys, row):
+                                dct.setdefault(key, []).append(value)
+                    entry[i_dct] = dct
 
-        '''
+                # Move to the next pending line(s)
+                i_row += nb_rows
 
-        Remove extra spaces from all strings in the entries dictionary.
+        # Return the entries
+        return entries
 
-        '''
 
-        # For each entry ..
-        for i_entry in range(len(entries)):
+    ####################
+    #  Count failures  #
+    ####################
+    def __count_failures(self, nb_failures):
 
-            # For each dictionary (each file line) in that entry ..
-            for i_dct in range(len(entries[i_entry])):
+        '''
 
-                # For each quantity in that file line ..
-                for quantity in entries[i_entry][i_dct].keys():
+        Add fields that could not be converted to the statistics of the
+        reading (if collected).
 
-                    # Remove extra space if it is a string
-                    if isinstance(entries[i_entry][i_dct][quantity], (str, np.str_)):
-                        entries[i_entry][i_dct][quantity] = \
-                            utils.remove_extra_spaces(\
-                                entries[i_entry][i_dct][quantity])
+        Argument
+        ========
+            nb_failures (int): number of fields that could not be converted
 
-                    # Remove extra space if it is a list of strings
-                    elif isinstance(entries[i_entry][i_dct][quantity], (list, np.ndarray)):
-                        for i_list in range(len(entries[i_entry][i_dct][quantity])):
-                            if isinstance(entries[i_entry][i_dct][quantity][i_list], (str, np.str_)):
-                                entries[i_entry][i_dct][quantity][i_list] = \
-                                    utils.remove_extra_spaces(\
-                                        entries[i_entry][i_dct][quantity][i_list])
+        '''
 
-        # Return the cleaned dictionaries
-        return entries
+        # Add the failures
+        if not self.__stats == None:
+            self.__stats.conversion_failures += nb_failures
 
 
-    #################
-    #  Generate DI  #
-    #################
-    def __generate_DI(self, entries, test_path):
+    ################
+    #  Get fields  #
+    ################
+    def __get_fields(self, lines, structure):
 
         '''
 
-        From a raw entries dictionary read from an ascii file, generate
-        and return a Data Interface object validated  with a test file
-        if provided.
+        Return, for each quantity of a structure line, a string array with
+        the field of that quantity on every line (see __split_line).
 
         Arguments
         =========
-            entries: combined dictionaries (the content of the input file)
-            test_path (str): path to the test file to make sure reading was ok
+            lines (list of str): lines of the input file
+            structure (structure_line): instructions on to extract quantities
 
         '''
 
-        # Get rid of extra spaces
-        entries = self.__clean_strings(entries)
+        # Slice character ranges on every line at once
+        if structure.mode == "char":
+            return fw.extract_fields(lines, structure.slices)
 
-        # Combine the dictionaries if each entry into one single dictionary
-        entries, quantities, quantities_type = self.__clean_dictionaries(entries)
+        # Pick the targeted columns of each split line
+        if structure.mode == "index":
+            splits = [line.split() for line in lines]
+            return [np.array([ls[i_col] for ls in splits], dtype=str) \
+                    for i_col in structure.positions]
 
-        # Create a data object
-        data = self.__transpose_dictionary(entries, quantities, quantities_type)
-
-        # Return the Interface Data object (if everything went well)
-        if self.__reading_validated(data, test_path):
-            return data
-        else:
-            return dd.data(dict())
+        # Use the whole line for every quantity
+        return [np.array(lines, dtype=str)] * len(structure.keys)
 
 
-    ########################
-    #  Clean dictionaries  #
-    ########################
-    def __clean_dictionaries(self, entries):
+    ################
+    #  Split line  #
+    ################
+    def __split_line(self, line, structure):
 
         '''
 
-        Take each entry of a read file, and combine all dictionaries
-        (originating from different file lines within an entry) in
-        order to only have one single dictionary per entry.
+        Split a line following a given instruction.
 
-        Argument
-        ========
-            entries: combined dictionaries (the content of the input file)
+        Arguments
+        =========
+            line (string): all characters of a given line from the input file
+            structure (structure_line): instructions on to extract quantities
 
         '''
 
-        # Declare the list of all possible dictionary keys
-        quantities = []
-        quantities_type = dict()
-
-        # For each entry of the file ..
-        for i_entry in range(len(entries)):
-
-            # Declare the key counter
-            # How many times a dictionary key appears in the combined dictionary
-            q_count = dict()
-
-            # Declare the combined dictionary
-            new_dct = dict()
-
-            # For each dictionary (each line) within the entry ..
-            for dct in entries[i_entry]:
+        # Return the line if there is no split
+        if structure.mode == "line":
+            return line
 
-                # For each quantity within that line ..
-                for q in dct.keys():
+        # If the .split() function is used with specific index ..
+        if structure.mode == "index":
 
-                    # Check if the quantity exists in the combined dictionary
-                    if q in q_count:
-                        q_count[q] += 1
-                    else:
-                        q_count[q] = 1
+            # Extract manually each quantity
+            first_split = line.split()
+            return [first_split[i_col] for i_col in structure.positions]
 
-                    # Enter the quantity in the combined dictionary
-                    if q_count[q] == 1:
-                        new_dct[q] = copy.deepcopy(dct[q])
-                    else:
-                        new_str = q+" "+str(q_count[q])
-                        new_dct[new_str] = copy.deepcopy(dct[q])
-                        quantities.append(new_str)
-                        quantities_type[new_str] = type(dct[q])
+        # If the .split() function is used without specific index ..
+        if structure.mode == "split":
 
-                    # Add the key (quantity) in the list if needed
-                    if not q in quantities:
-                        quantities.append(q)
-                        quantities_type[q] = type(dct[q])
+            # Return the simple split
+            return line.split()
 
-            # Overwrite the entier entry
-            entries[i_entry] = new_dct
+        # If spaces are used to define where are the quantities ..
+        if structure.mode == "char":
 
-        # Remove empty entries
-        entries = list(filter(lambda x: x != dict(), entries))
+            # Extract manually each quantity
+            return [line[sl] for sl in structure.slices]
 
-        # Return the cleaned dictionary
-        return entries, quantities, quantities_type
+        # Return nothing if there is no quantity in the structure
+        return []
 
 
-    ##########################
-    #  Transpose dictionary  #
-    ##########################
-    def __transpose_dictionary(self, entries, quantities, quantities_type):
+    #################
+    #  Generate DI  #
+    #################
+    def __generate_DI(self, builder, test_path, columnar, stats=None, hints=None):
 
         '''
 
-        Take the combined dictionaries (entries) and convert them
-        in a way that each quantity has an array corresponding to the
-        full list of entries.
+        From the columns assembled while reading an ascii file, generate
+        and return a Data Interface object validated  with a test file
+        if provided.
 
         Arguments
         =========
-            entries: combined dictionaries (the content of the input file)
-            quantities: dictionary key (list of quantities in the input file)
-            quantities_type: str, int, float, etc.
+            builder (column_builder): quantities of every entry of the input file
+            test_path (str): path to the test file to make sure reading was ok
+            columnar (bool): if True, store quantities in NumPy columns
+            stats (read_stats): statistics of the reading (None if not collected)
+            hints (dict): type of the quantities given by the structure file
 
         '''
 
-        # Declare the list of quantities
-        data = dict()
-        for q in quantities:
-            data[q] = []
-
-        # For each entry ..
-        for i_entry in range(len(entries)):
-
-            # Available quantities for this entry
-            key_available = entries[i_entry].keys()
-
-            # For each quantity ..
-            for q in quantities:
-
-                # Add the quantity value in the data dictionary
-                if q in key_available:
-                    if "$ONCE" in q:
-                        data[q.split("$ONCE")[0]] = [entries[i_entry][q]] * len(entries)
-                        del data[q]
-                    else:
-                        data[q].append(entries[i_entry][q])
-                else:
-                    if not "$ONCE" in q:
-                        if quantities_type[q] == str:
-                            data[q].append("")
-                        else:
-                            data[q].append(0)
+        # Create a data object
+        with ins.stage(stats, "set_data"):
+            data = dd.data(builder.get_data(), columnar=columnar, schema=hints)
 
-        # Create a data instance
-        return dd.data(data)
+        # Return the Interface Data object (if everything went well)
+        with ins.stage(stats, "validation"):
+            validated = self.__reading_validated(data, test_path)
+        if validated:
+            return data
+        else:
+            return dd.data(dict())
 
 
     #######################
@@ -924,3 +1533,171 @@ class read_data_file( data_file.data_file ):
 
             
 
+
+
+########################
+#  Reader source hash  #
+########################
+def _reader_source_hash():
+
+    '''
+
+    Return a hash (str) of the source code of the modules that turn
+    data files into data objects, computed once per process. Modules
+    whose source file cannot be read are only identified by their name.
+
+    '''
+
+    # Hash the source files of the modules if not already done
+    global _reader_hash
+    if _reader_hash == None:
+        h = hashlib.sha256()
+        for module in [sys.modules[__name__], data_file, dd, lb, cc, st, \
+                       cb, cv, fw, storage, sc, utils]:
+            h.update(module.__name__.encode())
+            try:
+                with open(module.__file__, "rb") as f:
+                    h.update(f.read())
+            except (AttributeError, TypeError, OSError):
+                pass
+        _reader_hash = h.hexdigest()
+
+    # Return the hash
+    return _reader_hash
+
+
+######################
+#  Read file worker  #
+######################
+def _read_file_worker(task):
+
+    '''
+
+    Read one data file within a worker process (see read_files), and
+    return its data dictionary in columnar form.
+
+    Argument
+    ========
+        task (tuple): reader options, file path, compiled structure, and ignored lines
+
+    '''
+
+    # Re-create the reader
+    (root_path, cache_dir, cache_max_size), file_path, structure, ignore_lines = task
+    reader = read_data_file(root_path=root_path, cache_dir=cache_dir, cache_max_size=cache_max_size)
+
+    # Read the file and return its columns
+    return reader.read_file(file_path, structure, ignore_lines=ignore_lines, columnar=True).data
+
+
+########################
+#  Count lines worker  #
+########################
+def _count_lines_worker(task):
+
+    '''
+
+    Return the number of lines to be read (not ignored) within a byte
+    range of a file (see read_data_file.__read_chunks).
+
+    Argument
+    ========
+        task (tuple): file path, start and end bytes, $IGNORE flags, and
+                      whether the first line is read anyway ($START flag)
+
+    '''
+
+    # Declare the line counter
+    full_path, i_start, i_end, ignore, keep_first = task
+    regex = st.ignore_regex(ignore)
+    nb_lines = 0
+
+    # For each line within the byte range ..
+    with open(full_path, "rb") as f:
+        f.seek(i_start)
+        i_byte = i_start
+        while i_byte < i_end:
+            raw = f.readline()
+            if len(raw) == 0:
+                break
+            i_byte += len(raw)
+
+            # Count the line if it should not be ignored
+            line = raw.decode(errors="replace")
+            if keep_first or regex == None or regex.search(line) == None:
+                nb_lines += 1
+            keep_first = False
+
+    # Return the number of lines
+    return nb_lines
+
+
+#######################
+#  Read chunk worker  #
+#######################
+def _read_chunk_worker(task):
+
+    '''
+
+    Parse one chunk of a file within a worker process (see read_data_file._read_chunk).
+
+    Argument
+    ========
+        task (tuple): root path, followed by the arguments of read_data_file._read_chunk
+
+    '''
+
+    # Re-create the reader and parse the chunk
+    reader = read_data_file(root_path=task[0])
+    return reader._read_chunk(*task[1:])
+
+
+#####################
+#  Next entry line  #
+#####################
+def _next_entry_line(i_line, nb_first, nb_next):
+
+    '''
+
+    Return the index of the first line (among lines to be read) where
+    an entry starts, at or after i_line.
+
+    Arguments
+    =========
+        i_line (int): index of a line (among lines to be read)
+        nb_first (int): number of lines covered by the first entry
+        nb_next (int): number of lines covered by every following entry
+
+    '''
+
+    # Return the next entry start
+    if i_line == 0:
+        return 0
+    if i_line <= nb_first:
+        return nb_first
+    return nb_first + -(-(i_line - nb_first) // nb_next) * nb_next
+
+
+#######################
+#  Nb entries before  #
+#######################
+def _nb_entries_before(i_line, nb_first, nb_next):
+
+    '''
+
+    Return the number of entries that start before i_line.
+
+    Arguments
+    =========
+        i_line (int): index of a line (among lines to be read)
+        nb_first (int): number of lines covered by the first entry
+        nb_next (int): number of lines covered by every following entry
+
+    '''
+
+    # Return the number of entry starts
+    if i_line <= 0:
+        return 0
+    if i_line <= nb_first:
+        return 1
+    return 1 + -(-(i_line - nb_first) // nb_next)
@@ -0,0 +1,202 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Schema of the quantities of a data object: the type of the values,
+    whether each entry holds a single value or an array, and whether
+    values can be missing (None). The reader provides the type and shape
+    from the compiled structure, while the schema of other quantities is
+    inferred once from their values.
+
+'''
+
+# Import Python packages
+import collections
+import numpy as np
+
+# Import Interface toolkit
+from . import columns as cc
+
+
+# Schema of one quantity
+#   dtype (str): type of the values ("int", "float", "str", or "object" if mixed)
+#   shape (str): "scalar" (one value per entry), "ragged" (one array per entry), or "mixed"
+#   nullable (bool): True if some values are missing (None when not known yet)
+quantity_schema = collections.namedtuple("quantity_schema", ["dtype", "shape", "nullable"])
+
+# Type of the values for each Python type
+_dtypes = {bool: "int", int: "int", float: "float", str: "str", \
+           np.int64: "int", np.int32: "int", np.float64: "float", np.float32: "float", np.str_: "str"}
+
+# Type of the values for each NumPy kind
+_kinds = {"b": "int", "i": "int", "u": "int", "f": "float", "U": "str", "S": "str"}
+
+
+##############
+#  Is digit  #
+##############
+def is_digit(schema):
+
+    '''
+
+    Return True if the values of a quantity are digits (int or float).
+
+    Argument
+    ========
+        schema (quantity_schema): schema of the quantity
+
+    '''
+
+    # Digits are integers and floats
+    return schema.dtype in ["int", "float"]
+
+
+###########
+#  Infer  #
+###########
+def infer(values, hint=None):
+
+    '''
+
+    Return the schema of a quantity from its values. Columns give their
+    schema directly. For lists, the types are collected once per entry,
+    and once per item only for arrays of Python objects (or for every
+    array if the type of the values is not known from a hint, see
+    from_structure).
+
+    Arguments
+    =========
+        values (column or list): values of every entry
+        hint (quantity_schema): type of the values if already known (or None)
+
+    '''
+
+    # Read the schema of columns directly
+    if cc.is_column(values):
+        shape = "ragged" if isinstance(values, cc.ragged_column) else "scalar"
+        nullable = not values.valid is None and not values.valid.all()
+        return quantity_schema(_kinds.get(values.dtype.kind, "object"), shape, nullable)
+
+    # Collect the types of the entries
+    types = set(map(type, values))
+    nullable = type(None) in types
+    types.discard(type(None))
+    array_types = types & {list, np.ndarray}
+
+    # Find the shape of the entries
+    if len(array_types) == 0:
+        shape = "scalar"
+    elif len(types - array_types) == 0:
+        shape = "ragged"
+    else:
+        shape = "mixed"
+
+    # Collect the types of the array items (only look for missing items if the type is known)
+    dtypes = set()
+    if len(array_types) > 0:
+        for arr in values:
+            if isinstance(arr, (list, np.ndarray)):
+                arr = np.asarray(arr)
+                if arr.dtype == object:
+                    item_types = set(map(type, arr.ravel().tolist()))
+                    nullable = nullable or type(None) in item_types
+                    item_types.discard(type(None))
+                    dtypes |= set(_dtypes.get(t, "object") for t in item_types)
+                elif hint == None:
+                    dtypes.add(_kinds.get(arr.dtype.kind, "object"))
+
+    # Return the schema with the known type
+    if not hint == None:
+        return quantity_schema(hint.dtype, shape, nullable)
+
+    # Return the schema (quantities without any value are floats)
+    dtypes |= set(_dtypes.get(t, "object") for t in types - array_types)
+    return quantity_schema(_common_dtype(dtypes), shape, nullable)
+
+
+##################
+#  Common dtype  #
+##################
+def _common_dtype(dtypes):
+
+    '''
+
+    Return the type that can hold values of several types.
+
+    Argument
+    ========
+        dtypes (set of str): types of the values
+
+    '''
+
+    # Integers can be floats, but nothing else can be mixed
+    if len(dtypes) == 0 or dtypes == {"float"} or dtypes == {"int", "float"}:
+        return "float"
+    if len(dtypes) == 1:
+        return list(dtypes)[0]
+    return "object"
+
+
+####################
+#  From structure  #
+####################
+def from_structure(structure):
+
+    '''
+
+    Return the type (see quantity_schema) of the quantities read with a
+    compiled structure, as given by the structure file. The shape is the
+    one expected from the structure file, and whether values are missing
+    is not known (nullable is None). Quantities read with a simple .split()
+    are left out, since their values can mix digits and strings.
+
+    Argument
+    ========
+        structure (compiled_structure): compiled structure
+
+    '''
+
+    # For each line of the structure ..
+    hints = dict()
+    for sub_bloc in structure.bloc:
+        for st_line in sub_bloc.lines:
+            if st_line.mode == "split":
+                continue
+
+            # Arrays are only found over several lines
+            shape = "ragged" if st_line.multiline else "scalar"
+            for name, q_type in zip(st_line.names, st_line.types):
+                hints[name] = quantity_schema(_dtypes.get(q_type, "object"), shape, None)
+
+    # Return the known types and shapes
+    return hints
+
+
+##############
+#  Get hint  #
+##############
+def get_hint(hints, quantity):
+
+    '''
+
+    Return the hint of a quantity (see from_structure), including the
+    quantities found several times in an entry ("q 2", "q 3", ..).
+    Return None if there is no hint.
+
+    Arguments
+    =========
+        hints (dict): type and shape of each quantity label
+        quantity (str): quantity label
+
+    '''
+
+    # Return the hint of the quantity label
+    if quantity in hints:
+        return hints[quantity]
+
+    # Return the hint of the original label if the quantity was repeated
+    label, sep, count = quantity.rpartition(" ")
+    if len(sep) > 0 and count.isdigit() and label in hints:
+        return hints[label]
+    return None
@@ -0,0 +1,339 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Binary columnar storage of data objects. A data object is saved in
+    a directory holding one .npy file per NumPy array (values and offsets
+    of each column) and a manifest.json file describing the quantities.
+    This module also provides the on-disk cache of parsed data files.
+
+'''
+
+# Import Python packages
+import os
+import json
+import shutil
+import tempfile
+import numpy as np
+
+# Import Interface toolkit
+from . import columns as cc
+from . import data as dd
+from ._version import version
+
+
+# Name of the file describing the content of a saved data object
+_manifest_name = "manifest.json"
+
+
+###############
+#  Save data  #
+###############
+def save_data(data, path):
+
+    '''
+
+    Save a data object in a directory, as one .npy file per array. The
+    directory is first written under a temporary name and then renamed,
+    so that an incomplete save is never visible at the targeted path.
+    An existing directory at the targeted path is overwritten.
+
+    Arguments
+    =========
+        data (data): data object to be saved
+        path (str): path of the directory where the data will be saved
+
+    '''
+
+    # Write the content in a temporary directory next to the targeted path
+    tmp_path = _write_data(data, path)
+
+    # Replace the existing directory if any
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    os.rename(tmp_path, path)
+
+
+###############
+#  Load data  #
+###############
+def load_data(path, mmap_mode=None):
+
+    '''
+
+    Load a data object saved with save_data. Quantities are stored
+    in columns (columnar=True). Return None if nothing can be loaded.
+
+    With mmap_mode="r", the column arrays are memory-mapped read-only
+    instead of being loaded in memory. Several processes opening the
+    same saved data then share the operating system page cache, and
+    only the pages that are actually accessed are read from disk.
+    Filtering and get_quantities only copy the selected entries.
+    Quantities stored as lists (mixed types) are always loaded in memory.
+
+    Arguments
+    =========
+        path (str): path of the directory where the data was saved
+        mmap_mode (str): None to load in memory, or "r" for read-only memory maps
+
+    '''
+
+    # Read the description of the content
+    manifest_path = os.path.join(path, _manifest_name)
+    if not os.path.isfile(manifest_path):
+        print("Error -", path, "does not contain saved data.")
+        return None
+    with open(manifest_path, "r") as f:
+        manifest = json.load(f)
+
+    # For each quantity ..
+    data = dict()
+    for i_q, column in enumerate(manifest["columns"]):
+        prefix = os.path.join(path, str(i_q))
+
+        # Load the validity mask if values are missing
+        valid = None
+        if column.get("masked", False):
+            valid = np.load(prefix+"_valid.npy", mmap_mode=mmap_mode)
+
+        # Load the arrays of the quantity
+        if column["kind"] == "scalar":
+            data[column["quantity"]] = cc.scalar_column(\
+                np.load(prefix+"_values.npy", mmap_mode=mmap_mode), valid)
+        elif column["kind"] == "ragged":
+            data[column["quantity"]] = cc.ragged_column(\
+                np.load(prefix+"_values.npy", mmap_mode=mmap_mode), \
+                np.load(prefix+"_offsets.npy", mmap_mode=mmap_mode), valid)
+        else:
+            data[column["quantity"]] = np.load(prefix+"_list.npy", allow_pickle=True).tolist()
+
+    # Return the data object
+    return dd.data(data=data, columnar=True)
+
+
+################
+#  Write data  #
+################
+def _write_data(data, path):
+
+    '''
+
+    Write a data object in a new temporary directory located next to
+    path, and return the path of the temporary directory.
+
+    Arguments
+    =========
+        data (data): data object to be saved
+        path (str): final path of the directory
+
+    '''
+
+    # Create the temporary directory
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = tempfile.mkdtemp(prefix=".tmp-", dir=parent)
+
+    # Declare the description of the content
+    manifest = {"version": version, "nb_entries": data.nb_entries, "columns": []}
+
+    # For each quantity (derived quantities are declared again when loaded) ..
+    try:
+        quantities = [q for q in data.quantities if not data.data.is_derived(q)]
+        for i_q, quantity in enumerate(quantities):
+            prefix = os.path.join(tmp_path, str(i_q))
+
+            # Convert lists into columns if possible
+            column = cc.to_column(data.data[quantity])
+
+            # Save the arrays of the quantity
+            if isinstance(column, cc.scalar_column):
+                kind = "scalar"
+                np.save(prefix+"_values.npy", column.values)
+            elif isinstance(column, cc.ragged_column):
+                kind = "ragged"
+                np.save(prefix+"_values.npy", column.values)
+                np.save(prefix+"_offsets.npy", column.offsets)
+
+            # Keep lists of mixed types as object arrays
+            else:
+                kind = "list"
+                values = np.empty(len(column), dtype=object)
+                for i_entry in range(len(column)):
+                    values[i_entry] = column[i_entry]
+                np.save(prefix+"_list.npy", values, allow_pickle=True)
+
+            # Save the validity mask if values are missing
+            masked = cc.is_column(column) and not column.valid is None
+            if masked:
+                np.save(prefix+"_valid.npy", column.valid)
+
+            # Add the quantity to the description
+            manifest["columns"].append({"quantity": quantity, "kind": kind, "masked": masked})
+
+        # Write the description last
+        with open(os.path.join(tmp_path, _manifest_name), "w") as f:
+            json.dump(manifest, f)
+
+    # Do not leave incomplete directories behind
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    # Return the temporary directory
+    return tmp_path
+
+
+#######################
+#  Declare the class  #
+#######################
+class data_cache( object ):
+
+    '''
+
+    On-disk cache of data objects, where each data object is saved
+    (see save_data) in a sub-directory named after its key. When the
+    total size of the cache exceeds max_size, the least recently used
+    data objects are removed.
+
+    Attributes
+    ==========
+        cache_dir (str): directory where the data objects are saved
+        max_size (int): maximum size of the cache in bytes (None for no limit)
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, cache_dir, max_size=None):
+
+        '''
+
+        Initialize the data_cache class.
+
+        Arguments
+        =========
+            cache_dir (str): directory where the data objects are saved
+            max_size (int): maximum size of the cache in bytes (None for no limit)
+
+        '''
+
+        # Keep the cache location and size limit
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+
+    #########
+    #  Get  #
+    #########
+    def get(self, key):
+
+        '''
+
+        Return the data object associated with a key (None if not found).
+
+        Argument
+        ========
+            key (str): hexadecimal key of the data object
+
+        '''
+
+        # Return None if the data object is not in the cache
+        path = os.path.join(self.cache_dir, key)
+        if not os.path.isfile(os.path.join(path, _manifest_name)):
+            return None
+
+        # Flag the data object as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        # Return the data object
+        return load_data(path)
+
+
+    #########
+    #  Put  #
+    #########
+    def put(self, key, data):
+
+        '''
+
+        Add a data object to the cache, and remove the least recently
+        used ones if the cache is too large.
+
+        Arguments
+        =========
+            key (str): hexadecimal key of the data object
+            data (data): data object to be saved
+
+        '''
+
+        # Write the data object, unless another process already did it
+        path = os.path.join(self.cache_dir, key)
+        tmp_path = _write_data(data, path)
+        try:
+            os.rename(tmp_path, path)
+        except OSError:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+        # Keep the size of the cache under control
+        self.evict(keep=key)
+
+
+    ###########
+    #  Evict  #
+    ###########
+    def evict(self, keep=None):
+
+        '''
+
+        Remove the least recently used data objects until the total size
+        of the cache is below max_size.
+
+        Argument
+        ========
+            keep (str): key of a data object that should not be removed
+
+        '''
+
+        # Nothing to do if there is no limit
+        if self.max_size == None or not os.path.isdir(self.cache_dir):
+            return
+
+        # Find the size and last use of each data object
+        entries = []
+        for key in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, key)
+            if key.startswith(".") or not os.path.isdir(path):
+                continue
+            size = sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+            entries.append((os.path.getmtime(path), key, size))
+
+        # Remove the oldest data objects first
+        total_size = sum(entry[2] for entry in entries)
+        for mtime, key, size in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+            total_size -= size
+
+
+    ###########
+    #  Clear  #
+    ###########
+    def clear(self):
+
+        '''
+
+        Remove every data object from the cache.
+
+        '''
+
+        # Remove the cache directory
+        if os.path.isdir(self.cache_dir):
+            shutil.rmtree(self.cache_dir)
@@ -0,0 +1,364 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Compiled (pre-screened) version of a structure file, and the
+    cache that keeps compiled structures in memory between readings
+    and writings.
+
+'''
+
+# Standard Python modules
+import re
+import collections
+import threading
+
+# Import Interface toolkit
+from . import interface_utils as utils
+
+
+# One line of a compiled structure
+#   index (int): unique index of the line within the structure
+#   keys (tuple of str): quantity labels, including the $ONCE flag if any
+#   names (tuple of str): quantity labels, without the $ONCE flag
+#   types (tuple of types): Python type of each quantity (int, float, str)
+#   positions (tuple): location of each quantity (None, int, (int,int), or "split")
+#   mode (str): how the line is split ("line", "index", "split", "char", or None)
+#   slices (tuple of slice): character ranges when mode is "char"
+#   once (bool): True if the line should only be read (written) once
+#   multiline (bool): True if the quantities are listed over several lines
+#   ml_is_digit (bool): True if the number of multiline loops is provided
+#   ml_end_point (str or int): multiline endpoint flag or number of loops
+structure_line = collections.namedtuple("structure_line", ["index", "keys", "names", \
+    "types", "positions", "mode", "slices", "once", "multiline", "ml_is_digit", "ml_end_point"])
+
+# One sub-bloc of a compiled structure
+#   repeat (None, int, or str): number of repeats, or quantity that sets it
+#   lines (tuple of structure_line): lines of the sub-bloc
+structure_bloc = collections.namedtuple("structure_bloc", ["repeat", "lines"])
+
+# Compiled structure
+#   bloc (tuple of structure_bloc): reading (writing) instructions
+#   header_keys (tuple of str): header flags provided in the structure file
+#   start (str or None): $START flag
+#   ignore (tuple of str): $IGNORE flags
+compiled_structure = collections.namedtuple("compiled_structure", \
+    ["bloc", "header_keys", "start", "ignore"])
+
+# Compiled regular expressions of the $IGNORE flags (see ignore_regex)
+_ignore_regex = dict()
+
+
+#######################
+#  Compile structure  #
+#######################
+def compile_structure(bloc, header):
+
+    '''
+
+    Take the bloc structure and the header created from a structure
+    file, and return an immutable compiled_structure where every line
+    is already screened (types, positions, multiline, and $ONCE).
+
+    Arguments
+    =========
+        bloc (list of dict): bloc structure (see data_file._create_bloc_structure)
+        header (dict): header of the structure file
+
+    '''
+
+    # Declare the compiled sub-blocs
+    c_bloc = []
+    i_index = 0
+
+    # For each sub-bloc ..
+    for sub_bloc in bloc:
+
+        # Compile each line of the sub-bloc
+        c_lines = []
+        for structure in sub_bloc["lines"]:
+            c_lines.append(_compile_line(structure, i_index))
+            i_index += 1
+
+        # Add the sub-bloc with its repeating instruction (if any)
+        c_bloc.append(structure_bloc(sub_bloc.get("repeat", None), tuple(c_lines)))
+
+    # Collect the header instructions
+    start = header.get("START", None)
+    ignore = tuple(header.get("IGNORE", []))
+
+    # Return the compiled structure
+    return compiled_structure(tuple(c_bloc), tuple(header.keys()), start, ignore)
+
+
+##################
+#  Compile line  #
+##################
+def _compile_line(structure, index):
+
+    '''
+
+    Pre-screen one line of a structure sub-bloc and return its
+    structure_line version.
+
+    Arguments
+    =========
+        structure (dict): one line of a structure sub-bloc
+        index (int): index of the line within the structure
+
+    '''
+
+    # If upcoming data is spread over multiple lines ..
+    if "$MULTILINE" in structure:
+        multiline = True
+
+        # Set multiline variables if number of loops is provided
+        if utils.remove_all_spaces(structure["$MULTILINE"]).isdigit():
+            ml_is_digit = True
+            ml_end_point = int(structure["$MULTILINE"])
+
+        # Set multiline variables if number of loops is dynamic
+        else:
+            ml_is_digit = False
+            ml_end_point = utils.remove_initial_spaces(structure["$MULTILINE"])
+
+    # Set multiline flag to False if upcoming data is on one line
+    else:
+        multiline = False
+        ml_is_digit = None
+        ml_end_point = None
+
+    # Keep the line if it should only be read once
+    keys = list(structure.keys())
+    once = len(keys) > 0 and "$ONCE" in keys[0]
+
+    # Remove header flags from structure dictionary
+    keys = tuple(key for key in keys if not key[0] == "$")
+    names = tuple(key.replace("$ONCE", "") for key in keys)
+
+    # Separate the type and the location of each quantity
+    types = []
+    positions = []
+    for key in keys:
+        if isinstance(structure[key], tuple):
+            types.append(structure[key][0])
+            positions.append(structure[key][1])
+        else:
+            types.append(structure[key])
+            positions.append(None)
+
+    # Find how the line should be split, based on the first quantity
+    slices = ()
+    if len(keys) == 0:
+        mode = None
+    elif positions[0] == None:
+        mode = "line"
+    elif positions[0] == "split":
+        mode = "split"
+    elif isinstance(positions[0], int):
+        mode = "index"
+    else:
+        mode = "char"
+        slices = tuple(slice(pos[0], pos[1]+1) for pos in positions)
+
+    # Return the compiled line
+    return structure_line(index, keys, names, tuple(types), tuple(positions), \
+        mode, slices, once, multiline, ml_is_digit, ml_end_point)
+
+
+#######################
+#  Count entry lines  #
+#######################
+def count_entry_lines(structure):
+
+    '''
+
+    Return the number of (non-ignored) file lines covered by the first
+    entry, and by every following entry, when this number is fixed by
+    the structure. The first entry also covers the $ONCE lines. Return
+    None if the number of lines can change from one entry to another
+    (dynamic $MULTILINE end point, or repeats set by a quantity).
+
+    Argument
+    ========
+        structure (compiled_structure): compiled structure
+
+    '''
+
+    # Declare the line counters
+    nb_once = 0
+    nb_lines = 0
+
+    # For each sub-bloc ..
+    for sub_bloc in structure.bloc:
+
+        # Return None if the number of repeats is read from the file
+        if sub_bloc.repeat == None:
+            nb_repeats = 1
+        elif isinstance(sub_bloc.repeat, int):
+            nb_repeats = sub_bloc.repeat
+        else:
+            return None
+
+        # Count the lines covered by each structure line
+        for st_line in sub_bloc.lines:
+            if st_line.multiline and not st_line.ml_is_digit:
+                return None
+            nb = st_line.ml_end_point if st_line.multiline else 1
+            if st_line.once:
+                nb_once += nb
+            else:
+                nb_lines += nb * nb_repeats
+
+    # Return None if entries do not cover any line
+    if nb_lines == 0:
+        return None
+
+    # Return the number of lines of the first and following entries
+    return nb_once + nb_lines, nb_lines
+
+
+##################
+#  Ignore regex  #
+##################
+def ignore_regex(ignore):
+
+    '''
+
+    Return a compiled regular expression that finds any of the $IGNORE
+    flags within a line, or None if there is no flag. The expression is
+    only compiled once for a given set of flags.
+
+    Argument
+    ========
+        ignore (tuple of str): $IGNORE flags (see compiled_structure)
+
+    '''
+
+    # Return None if nothing should be ignored
+    if len(ignore) == 0:
+        return None
+
+    # Combine the flags into a single expression if not already done
+    if not ignore in _ignore_regex:
+        _ignore_regex[ignore] = re.compile("|".join(re.escape(ign) for ign in ignore))
+
+    # Return the compiled expression
+    return _ignore_regex[ignore]
+
+
+#######################
+#  Declare the class  #
+#######################
+class structure_cache( object ):
+
+    '''
+
+    This class keeps compiled structures in memory, identified by the
+    path, the modification time, and the size of their structure file.
+    The least recently used structure is dropped when the cache is full.
+
+    '''
+
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, max_size=64):
+
+        '''
+
+        Initialize the structure_cache class.
+
+        Argument
+        ========
+            max_size (int): maximum number of compiled structures kept in memory
+
+        '''
+
+        # Declare the cache content and the lock protecting it
+        self.max_size = max_size
+        self.__content = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+
+    #########
+    #  Get  #
+    #########
+    def get(self, key):
+
+        '''
+
+        Return the compiled structure associated with a key (None if not found).
+
+        Argument
+        ========
+            key (tuple): path, modification time, and size of the structure file
+
+        '''
+
+        # Return the structure and flag it as recently used
+        with self.__lock:
+            if not key in self.__content:
+                return None
+            self.__content.move_to_end(key)
+            return self.__content[key]
+
+
+    #########
+    #  Put  #
+    #########
+    def put(self, key, structure):
+
+        '''
+
+        Add a compiled structure to the cache.
+
+        Arguments
+        =========
+            key (tuple): path, modification time, and size of the structure file
+            structure (compiled_structure): compiled structure
+
+        '''
+
+        # Add the structure and drop the least recently used ones
+        with self.__lock:
+            self.__content[key] = structure
+            self.__content.move_to_end(key)
+            while len(self.__content) > max(self.max_size, 0):
+                self.__content.popitem(last=False)
+
+
+    ###########
+    #  Clear  #
+    ###########
+    def clear(self):
+
+        '''
+
+        Remove every compiled structure from the cache.
+
+        '''
+
+        # Empty the cache
+        with self.__lock:
+            self.__content.clear()
+
+
+    #########
+    #  Len  #
+    #########
+    def __len__(self):
+
+        '''
+
+        Return the number of compiled structures in the cache.
+
+        '''
+
+        # Return the size of the cache
+        return len(self.__content)
+
+
+# Cache shared by every reading and writing instance
+cache = structure_cache()
@@ -0,0 +1,11 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Version of the Interface library (also used by setup.cfg).
+
+'''
+
+# Version of the library
+version = "0.0.1"
@@ -7,12 +7,15 @@
 
 # Standard Python modules
 import sys
+import collections
 import numpy as np
-import copy
 
 # Data object to collect the data dictionary resulting from reading
 from . import data as dd
 from . import data_file
+from . import columns as cc
+from . import formatting as fmt
+from . import compression as cp
 
 # Import Interface toolkit
 from . import interface_utils as utils
@@ -31,7 +34,8 @@ class write_data_file( data_file.data_file ):
     #################################
     #  Initialization of the class  #
     #################################
-    def __init__(self, empty_char="&", spacing=" ", float_sci=False, **kwargs):
+    def __init__(self, empty_char="&", spacing=" ", float_sci=False, \
+                 compression_level=None, **kwargs):
 
         '''
 
@@ -43,6 +47,8 @@ class write_data_file( data_file.data_file ):
             spacing (str): characters that provide spacing in between quantities
             root_path (str): root path to which data files will be written
             float_sci (bool): if True, floats will be printed in scientific notations
+            compression_level (int): compression level of files written with a .gz, .bz2,
+                                     or .xz extension (None for the default of each codec)
 
         '''
 
@@ -53,6 +59,7 @@ class write_data_file( data_file.data_file ):
         self.__spacing = spacing
         self.__empty_char = empty_char + self.__spacing
         self.__float_sci = float_sci
+        self.__compression_level = compression_level
 
         # Define what should be log(zero)
         self.__log_zero = -99.0
@@ -62,103 +69,269 @@ class write_data_file( data_file.data_file ):
     #  Write file  #
     ################
     def write_file(self, file_path, structure_path, data_ori, \
-                   max_entry_per_w=100, max_decimal=3, \
-                   append=False, float_sci=False):
+                   max_entry_per_w=None, max_decimal=3, \
+                   append=False, float_sci=False, flush_size=1<<20):
 
         '''
 
         Write a data file out of a data object, following a given
-        structure file.
+        structure file. The values of each quantity are formatted all
+        at once (see formatting.format_column), and the output lines of
+        each structure line are assembled out of these strings for every
+        entry (see assemble_lines), by filling a template of the line
+        compiled once per writing (see formatting.line_template). Entries
+        are written by blocks whose output lines are around flush_size
+        characters, so that the writing time grows linearly with the size
+        of the output while the memory used by the output lines is bounded.
 
         Arguments
         =========
             file_path (str): path to data file to be writen
-            structure_path (str): path to the structure file (how to read data file)
+            structure_path (str or compiled structure): path to the structure file (how to read data file)
             data_ori (Data object): object containing the data to be writen
+            max_entry_per_w (int): deprecated, replaced by flush_size
             max_decimal (int): number of decimals for digits in scientific notation
             append (bool): If True, writing process will add to an existing file
+            float_sci (bool): if True, floats will be printed in scientific notations
+            flush_size (int): number of characters of output lines held before writing to the file
+
+        '''
+
+        # The number of entries per write is replaced by a number of characters
+        if not max_entry_per_w == None:
+            print("Warning - max_entry_per_w is deprecated, use flush_size instead.")
+
+        # The Data object is only read, so that it is not externally modified
+        data = data_ori
+
+        # Initialize writing process (returns output file)
+        f, structure = self.__init_writing(file_path, structure_path, data.nb_entries, append)
+
+        # Compile the template of each structure line
+        templates = self.__compile_templates(structure, max_decimal)
+
+        # Write every entry, and close the file
+        try:
+            self._write_entries(f, structure, templates, data.data, data.nb_entries, \
+                max_decimal, float_sci, flush_size, set())
+        finally:
+            f.close()
+
+
+    #################
+    #  Open writer  #
+    #################
+    def open_writer(self, file_path, structure_path, max_decimal=3, append=False, \
+                    float_sci=False, flush_size=1<<20, batch_size=1000):
+
+        '''
+
+        Open a data file where entries are written as they come, following
+        a given structure file, without building a data object first. Each
+        entry is a dictionary (quantity label --> value of the entry). The
+        returned entry_writer keeps at most batch_size entries in memory
+        before writing them, so that the memory used does not grow with the
+        number of entries. Close the writer (or use it as a context manager)
+        to write the last entries.
+
+            with writer.open_writer("data.txt", "structure.txt") as w:
+                for entry in entries:
+                    w.write_entry(entry)
+
+        Arguments
+        =========
+            file_path (str): path to data file to be writen
+            structure_path (str or compiled structure): path to the structure file (how to read data file)
+            max_decimal (int): number of decimals for digits in scientific notation
+            append (bool): If True, writing process will add to an existing file
+            float_sci (bool): if True, floats will be printed in scientific notations
+            flush_size (int): number of characters of output lines held before writing to the file
+            batch_size (int): number of entries accumulated before being written
+
+        '''
+
+        # Initialize writing process (returns output file)
+        f, structure = self.__init_writing(file_path, structure_path, None, append)
+
+        # Return the writer of entries, with the template of each structure line
+        templates = self.__compile_templates(structure, max_decimal)
+        return entry_writer(self, f, structure, templates, max_decimal, \
+                            float_sci, flush_size, batch_size)
+
+
+    ###################
+    #  Write entries  #
+    ###################
+    def _write_entries(self, f, structure, templates, data, nb_entries, \
+                       max_decimal, float_sci, flush_size, read_once, skip=None):
 
         '''
 
-        # Make a hard copy of the Data object so that it is not externally modified
-        data = copy.deepcopy(data_ori)
+        Write the output lines of several entries to an open file. This is
+        used by write_file (every entry of a data object at once) and by
+        entry_writer (one batch of entries at a time). Entries are written
+        by blocks, and the number of entries of a block is adjusted to the
+        size of the entries already written, so that the output lines held
+        in memory stay around flush_size characters.
+
+        Arguments
+        =========
+            f (file): output file
+            structure (compiled_structure): instructions on how to write the data file
+            templates (dict): template of each structure line (see compile_templates)
+            data (dict): values of every entry for each quantity
+            nb_entries (int): number of entries
+            max_decimal (int): number of decimals for digits in scientific notation
+            float_sci (bool): if True, floats will be printed in scientific notations
+            flush_size (int): number of characters of output lines held before writing to the file
+            read_once (set): index of the $ONCE structure lines that have been applied
+            skip (dict): entries (set of indexes) for which a structure line is not
+                         written, for each structure line index (None if none)
+
+        '''
 
         # Overwrite scientific notation flag
         self.__float_sci = float_sci
 
-        # Initialize writing process (returns output file)
-        f, bloc = self.__init_writing(file_path, structure_path, data, max_decimal, append)
+        # Collect the quantities used by the structure (and the un-logged ones)
+        labels = []
+        for sub_bloc in structure.bloc:
+            for st_line in sub_bloc.lines:
+                for key in st_line.names:
+                    labels.append(key)
+                    if len(key) >= 5 and key[:4] == "log_":
+                        labels.append(key[4:])
+        labels = [q for q in set(labels) if q in data]
+
+        # Write one entry first, and then as many entries as
+        # should fit in flush_size characters, block after block
+        i_start = 0
+        nb_block = 1
+        size = 0
+        while i_start < nb_entries:
+            i_stop = min(i_start + nb_block, nb_entries)
+
+            # Write the output lines of the block, and clear the memory
+            block = {q: data[q][i_start:i_stop] for q in labels}
+            text = "".join(self.__block_lines(structure, templates, block, \
+                i_start, i_stop - i_start, max_decimal, read_once, skip))
+            f.write(text)
 
-        # Log values if needed
-        data = self.__log_values(bloc, data)
+            # Adjust the number of entries of the next block
+            size += len(text)
+            i_start = i_stop
+            nb_block = max(1, (flush_size * i_start) // max(size, 1))
 
-        # Declare output text and structures that have been applied
-        text = ""
-        read_structure = []
 
-        # Copy data and declare number of accumulated entries
-        d = data.data
-        cumul = 0
+    #################
+    #  Block lines  #
+    #################
+    def __block_lines(self, structure, templates, data, i_start, nb_entries, \
+                      max_decimal, read_once, skip):
 
-        # For each entry in the data object ..
-        for i_entry in range(data.nb_entries):
+        '''
 
-            # For each sub-bloc within the main structure bloc ..
-            for sub_bloc in bloc:
+        Return the output lines (list of str) of a block of entries.
 
-                # For each structure line representing this entry ..
-                for structure in sub_bloc["lines"]:
+        Arguments
+        =========
+            structure (compiled_structure): instructions on how to write the data file
+            templates (dict): template of each structure line (see compile_templates)
+            data (dict): values of every entry of the block for each quantity
+            i_start (int): index of the first entry of the block
+            nb_entries (int): number of entries in the block
+            max_decimal (int): number of decimals for digits in scientific notation
+            read_once (set): index of the $ONCE structure lines that have been applied
+            skip (dict): entries (set of indexes) for which a structure line is not
+                         written, for each structure line index (None if none)
 
-                    # Pre-screen the structure content to gain insights on how to proceed
-                    skip, structure, read_structure, multiline, ml_is_digit, ml_end_point = \
-                        self._screen_structure(structure, read_structure)
+        '''
 
-                    # If there is something to be written (i.e. ignore $ONCE) ..
-                    if not skip:
+        # Log values if needed (kept aside from the data)
+        logged = self.__log_values(structure, data, nb_entries)
 
-                        # Reformat keys and positions for the writing process
-                        keys, positions = self.__reformat_key_pos(structure)
+        # Declare output lines
+        lines = []
 
-                        # If quantities (lists) should be outputed on multiple lines ..
-                        if multiline:
+        # View of the data and logged quantities
+        d = collections.ChainMap(logged, data)
 
-                            # Extract the number of lines needed
-                            key_temp = list(structure.keys())[0]
-                            nb_lines = len(d[key_temp][i_entry])
+        # Declare the formatted values of each quantity, and the
+        # output lines of each structure line (filled when first needed)
+        formatted = dict()
+        assembled = dict()
 
-                            # Collect quantities for each line (each array index) ..
-                            for i_list in range(nb_lines):
-                                text += self.__generate_line(i_entry, keys, positions, d, \
-                                        max_decimal, i_list=i_list)
+        # For each entry ..
+        for i_entry in range(nb_entries):
 
-                            # Add multiline endpoint if needed
-                            if not ml_is_digit:
-                                text += ml_end_point + "\n"
+            # For each sub-bloc within the main structure bloc ..
+            for sub_bloc in structure.bloc:
 
-                        # Collect quantities directly if positioned on a single line ..
+                # For each structure line representing this entry ..
+                for st_line in sub_bloc.lines:
+
+                    # Skip the line if it should only be written once
+                    if st_line.once:
+                        if st_line.index in read_once:
+                            continue
+                        read_once.add(st_line.index)
+
+                    # Skip the line if nothing should be written for this entry
+                    if not skip == None and i_start+i_entry in skip.get(st_line.index, ()):
+                        continue
+
+                    # Assemble the output lines of every entry if not already done
+                    template = templates[st_line.index]
+                    if not st_line.index in assembled:
+                        assembled[st_line.index] = self.__assemble_lines(\
+                            st_line, d, max_decimal, template, formatted)
+                    st_lines = assembled[st_line.index]
+
+                    # Copy the output lines if they are already assembled
+                    if not st_lines == None:
+                        if st_line.multiline:
+                            entry_lines = st_lines.strings[\
+                                st_lines.offsets[i_entry]:st_lines.offsets[i_entry+1]]
+                            if not st_line.ml_is_digit:
+                                entry_lines.append(st_line.ml_end_point + "\n")
+                            lines.extend(entry_lines)
                         else:
-                            text += self.__generate_line(i_entry, keys, positions, d, max_decimal)
-
-            # Write if needed, and clear the memory
-            # Should be last operation of the 'for i_entry' loop
-            cumul += 1
-            if cumul == max_entry_per_w:
-                f.write(text)
-                text = ''
-                cumul = 0
-
-        # Write the remaining part
-        if not text == '':
-            f.write(text)
+                            lines.append(st_lines.strings[i_entry])
+                        continue
+
+                    # Copy keys and positions for the writing process
+                    keys, positions = st_line.names, st_line.positions
+
+                    # If quantities (lists) should be outputed on multiple lines ..
+                    if st_line.multiline:
+
+                        # Extract the number of lines needed
+                        nb_lines = len(d[keys[0]][i_entry])
 
-        # Close the file
-        f.close()
+                        # Collect quantities for each line (each array index) ..
+                        for i_list in range(nb_lines):
+                            line = self.__generate_line(i_entry, keys, positions, d, \
+                                   max_decimal, template, i_list=i_list)
+                            lines.append(line)
+
+                        # Add multiline endpoint if needed
+                        if not st_line.ml_is_digit:
+                            lines.append(st_line.ml_end_point + "\n")
+
+                    # Collect quantities directly if positioned on a single line ..
+                    else:
+                        line = self.__generate_line(i_entry, keys, positions, d, \
+                               max_decimal, template)
+                        lines.append(line)
+
+        # Return the output lines
+        return lines
 
 
     ##################
     #  Init writing  #
     ##################
-    def __init_writing(self, file_path, structure_path, data, max_decimal, append):
+    def __init_writing(self, file_path, structure_path, nb_entries, append):
 
         '''
 
@@ -167,84 +340,130 @@ class write_data_file( data_file.data_file ):
         Arguments
         =========
             file_path (str): path to data file to be writen
-            structure_path (str): path to the structure file (how to read data file)
-            data (Data object): object containing the data to be writen
-            max_decimal (int): number of decimals for digits in scientific notation
+            structure_path (str or compiled structure): path to the structure file (how to read data file)
+            nb_entries (int): number of entries to be writen (None if not known)
             append (bool): If True, writing process will add to an existing file
 
         '''
 
-        # Open output file
+        # Open output file (compressed if needed, see compression.open_file)
         if append:
-            f = open(self._root_path+file_path, "a")
+            f = cp.open_file(self._root_path+file_path, "a", self.__compression_level)
         else:
-            f = open(self._root_path+file_path, "w")
+            f = cp.open_file(self._root_path+file_path, "w", self.__compression_level)
 
-        # Read the instructions on how to write the data file
-        bloc, header, header_keys = self._create_bloc_structure(structure_path)
+        # Get the compiled instructions on how to write the data file
+        structure = self.compile_structure(structure_path)
 
         # Prepare empty file if there is no data
-        if data.nb_entries == 0:
+        if nb_entries == 0:
             f.write("")
 
         # Return output file object
-        return f, bloc
+        return f, structure
+
+
+    #######################
+    #  Compile templates  #
+    #######################
+    def __compile_templates(self, structure, max_decimal):
+
+        '''
+
+        Return the template of the output lines of each structure line
+        (see formatting.line_template), by structure line index. Lines
+        where a single quantity is listed on multiple columns, and lines
+        with un-recognized positions, have no template (None).
+
+        Arguments
+        =========
+            structure (compiled_structure): instructions on how to write the data file
+            max_decimal (int): number of decimal points for floats in scientific notation
+
+        '''
+
+        # For each structure line ..
+        templates = dict()
+        for sub_bloc in structure.bloc:
+            for st_line in sub_bloc.lines:
+                keys, positions = st_line.names, st_line.positions
+
+                # Compile the template if the positions are recognized
+                if (len(keys) == 1 and positions[0] == None) or \
+                        isinstance(positions[0], (int, tuple)):
+                    templates[st_line.index] = fmt.line_template(positions, \
+                        max_decimal, self.__spacing, self.__empty_char)
+                else:
+                    templates[st_line.index] = None
+
+        # Return the templates
+        return templates
 
 
     ################
     #  Log values  #
     ################
-    def __log_values(self, bloc, data):
+    def __log_values(self, structure, data, nb_entries):
 
         '''
 
-        Take a Data object and create a log10(digit) version of quantities
-        found in the structure bloc if needed.
+        Take the data of several entries and create a log10(digit) version of
+        quantities found in the structure bloc if needed. The logged quantities
+        are returned in a separate dictionary, and the data is not modified.
+        Whole columns are logged at once (see columns.log_column), and
+        quantities that cannot be stored in a column are logged item by item.
 
         Arguments
         =========
-            bloc (list of dictionaries): dictionaries containing the structure file info
-            data (Data object): object containing the data to be writen
+            structure (compiled_structure): instructions on how to write the data file
+            data (dict): values of every entry for each quantity
+            nb_entries (int): number of entries
 
         '''
 
         # Collect all new quantities that starts with "log_"
         q_log_list = []
-        for sub_bloc in bloc:
-            for structure in sub_bloc["lines"]:
-                for key, pos in structure.items():
+        for sub_bloc in structure.bloc:
+            for st_line in sub_bloc.lines:
+                for key in st_line.names:
                     if len(key) >= 5:
                         if key[:4] == "log_":
                             q_log_list.append(key)
 
+        # Declare the logged quantities
+        logged = dict()
+
         # For each quantities that need to be logged ..
         for q in q_log_list:
 
             # If the logged quantity does not already exist
             # and if the un-logged quantity exists ..
             q_unlog = q[4:]
-            if (not q in data.quantities) and (q_unlog in data.quantities):
+            if (not q in data) and (not q in logged) and (q_unlog in data):
+
+                # Log the whole column at once if possible
+                column = cc.to_column(data[q_unlog])
+                if cc.is_column(column):
+                    logged[q] = cc.log_column(column, self.__log_zero)
+                    continue
 
-                # Create dictionary entry for the logged quantities
-                data.data[q] = []
-                for i_entry in range(data.nb_entries):
+                # Create dictionary entry for the logged quantities otherwise
+                logged[q] = []
+                for i_entry in range(nb_entries):
 
                     # Log value directly if not an array
-                    if isinstance(data.data[q_unlog][i_entry], (int, float)):
-                        data.data[q].append(self.__log_single_value(data.data[q_unlog][i_entry]))
+                    if isinstance(data[q_unlog][i_entry], (int, float)):
+                        logged[q].append(self.__log_single_value(data[q_unlog][i_entry]))
 
                     # Log values if array is provided
-                    elif isinstance(data.data[q_unlog][i_entry], (list, np.ndarray)):
-                        data.data[q].append([])
-                        for i_item in range(len(data.data[q_unlog][i_entry])):
-                            data.data[q][-1].append(\
-                                self.__log_single_value(data.data[q_unlog][i_entry][i_item]))
+                    elif isinstance(data[q_unlog][i_entry], (list, np.ndarray)):
+                        logged[q].append([])
+                        for i_item in range(len(data[q_unlog][i_entry])):
+                            logged[q][-1].append(\
+                                self.__log_single_value(data[q_unlog][i_entry][i_item]))
 
-                # Add the logged quantities in the list of available quantities
-                data.quantities.append(q)
-
-        # Return the updated data object
-        return data
+        # Return the logged quantities
+        return logged
 
 
     ######################
@@ -264,7 +483,7 @@ class write_data_file( data_file.data_file ):
 
         # Special case of log(0)
         if value == 0:
-            log_value = copy.deepcopy(self.__log_zero)
+            log_value = self.__log_zero
 
         # If value is not equal zero ..
         else:
@@ -284,46 +503,6 @@ class write_data_file( data_file.data_file ):
         return log_value
 
 
-    ######################
-    #  Reformat key pos  #
-    ######################
-    def __reformat_key_pos(self, structure):
-
-        '''
-
-        From an instruction structure line, reformat the quantity label
-        and the output position so that any case can be passed to the
-        generalized string generator functions.
-
-        Argument
-        ========
-            structure (dict): one line from the structure sub-bloc
-
-        '''
-
-        # Declare the re-formatted quantities and positions
-        keys = []
-        positions = []
-
-        # For each item in the structure dictionary ..
-        for key, pos in structure.items():
-
-            # Remove the $ONCE flag from the quantity name if necessary
-            if "$ONCE" in key:
-                keys.append(key.replace("$ONCE", ""))
-            else:
-                keys.append(key)
-
-            # Add empty quantity location if originally not provided
-            if isinstance(pos, tuple):
-                positions.append(pos[1])
-            else:
-                positions.append(None)
-
-        # Return formated structure instructions
-        return keys, positions
-
-
     #########################
     #  Format str quantity  #
     #########################
@@ -341,29 +520,13 @@ class write_data_file( data_file.data_file ):
 
         '''
 
-        # Return empty character if data not provided
-        if quantity == None:
-            return self.__empty_char
-
-        # Do nothing if this is already a string
-        if isinstance(quantity, (str, np.str_)):
-            return quantity
+        # Format the quantity
+        q_str = fmt.format_value(quantity, max_decimal, self.__float_sci, self.__empty_char)
+        if q_str == None:
+            print("Error - Column width insufficient for digits in scientific notation.")
 
-        # Convert to string if this is an integer
-        elif isinstance(quantity, (int, np.int_)):
-            return str(quantity)
-
-        # Return the scientific notation if this is a float
-        elif self.__float_sci:
-            if max_decimal <= 0:
-                print("Error - Column width insufficient for digits in scientific notation.")
-                return None
-            sci_notation = "{:."+str(max_decimal)+"E}"
-            return sci_notation.format(quantity)
-
-        # Return normal float without formating if not in scientific notation
-        else:
-            return str(quantity)
+        # Return the string (None if it could not be formatted)
+        return q_str
 
 
 
@@ -409,7 +572,7 @@ class write_data_file( data_file.data_file ):
     ###################
     #  Generate line  #
     ###################
-    def __generate_line(self, i_entry, keys, positions, d, max_decimal, i_list=None):
+    def __generate_line(self, i_entry, keys, positions, d, max_decimal, template, i_list=None):
 
         '''
 
@@ -423,83 +586,109 @@ class write_data_file( data_file.data_file ):
             positions (list): list of column indexes for each quantity
             d (dict): data variable of a Data Interface object
             max_decimal (int): number of decimal points for floats in scientific notation
+            template (line_template): compiled template of the line (None if not recognized)
             i_list (int): if provided, current data array index within the $MULTILINE mode)
 
         '''
 
-        # Return line if only one quantity with no position specified
-        if len(keys) == 1 and positions[0] == None:
-            quantity = self.__get_specific_quantity(keys[0], i_entry, i_list, d)
-            return self.__format_str_quantity(quantity, max_decimal) + "\n"
-
-        # Return line if positions are column indexes ..
-        if isinstance(positions[0], int):
-            return self.__generate_line_col(i_entry, keys, positions, \
-                    d, max_decimal, i_list)
-
         # Return line if a single quantity should be listed on multiple columns ..
         if len(keys) == 1 and positions[0] == "split":
             return self.__generate_line_split(i_entry, keys, positions, \
                     d, max_decimal)
 
-        # Return line if the positions are defined by character ranges ..
-        if isinstance(positions[0], tuple):
-            return self.__generate_line_char(i_entry, keys, positions, \
-                    d, max_decimal, i_list)
-
         # Return nothing if structure is un-recognized ..
-        print("Error - structure '", keys, positions, "' not recognized.")
-        return None
+        if template == None:
+            print("Error - structure '", keys, positions, "' not recognized.")
+            return None
 
+        # Collect the string of each quantity
+        strings = []
+        for key, md in zip(keys, template.max_decimals):
+            quantity = self.__get_specific_quantity(key, i_entry, i_list, d)
+            strings.append(self.__format_str_quantity(quantity, md))
+
+        # Return nothing if a quantity could not be formatted
+        if None in strings:
+            return None
+
+        # Return the formated output line
+        return template.fill(strings)
 
-    #######################
-    #  Generate line col  #
-    #######################
-    def __generate_line_col(self, i_entry, keys, positions, d, max_decimal, i_list):
+
+    ####################
+    #  Assemble lines  #
+    ####################
+    def __assemble_lines(self, st_line, d, max_decimal, template, formatted):
 
         '''
 
-        Generate an output line string countaining data structured 
-        by column indexes.
+        Return the output line (str) of every entry for a given structure
+        line, as a formatted_column (one output line per entry, or one per
+        array item in the $MULTILINE mode), assembled out of the formatted
+        values of the quantities. Return None if the lines should be
+        generated entry by entry (see generate_line), which is the case
+        for $ONCE lines and for values that cannot be formatted ahead of time.
 
         Arguments
         =========
-            i_entry (int): current data entry index
-            keys (list): list of quantities
-            positions (list): list of column indexes for each quantity
+            st_line (structure_line): compiled structure line
             d (dict): data variable of a Data Interface object
             max_decimal (int): number of decimal points for floats in scientific notation
-            i_list (int): if provided, current data array index within the $MULTILINE mode)
+            template (line_template): compiled template of the line (None if not recognized)
+            formatted (dict): formatted values of each quantity and number of decimals
 
         '''
 
-        # Declare the output line
-        line  = ""
-
-        # Collect the maximum number of columns
-        i_c_max = np.max(positions)
-
-        # For each column in this output line
-        for i_c in range(i_c_max+1):
+        # Copy keys and positions for the writing process
+        keys, positions = st_line.names, st_line.positions
 
-            # If this column index is in the structure file ..
-            if i_c in positions:
+        # Generate lines entry by entry if written once, or if something is missing
+        if st_line.once or not all(key in d for key in keys):
+            return None
 
-                # Find the structure key associated with this column
-                key = keys[ positions.index(i_c) ]
-
-                # Collect the targeted quantity
-                quantity = self.__get_specific_quantity(key, i_entry, i_list, d)
-
-                # Add data to the current output column
-                line += self.__format_str_quantity(quantity, max_decimal) + self.__spacing
+        # Collect the formatted values of each quantity
+        if len(keys) == 1 and positions[0] == "split":
+            max_decimals = [max_decimal]
+        elif not template == None:
+            max_decimals = template.max_decimals
+        else:
+            return None
+        columns = []
+        for key, md in zip(keys, max_decimals):
+            if not (key, md) in formatted:
+                formatted[(key, md)] = fmt.format_column(d[key], md, \
+                    self.__float_sci, self.__empty_char)
+            if formatted[(key, md)] == None:
+                return None
+            columns.append(formatted[(key, md)])
 
-            # Add empty character if the column is not in the structure file
+        # Return the lines of a single quantity listed on multiple columns
+        offsets = columns[0].offsets
+        if len(keys) == 1 and positions[0] == "split":
+            if st_line.multiline:
+                return None
+            strings = columns[0].strings
+            if offsets == None:
+                lines = [utils.remove_last_spaces(q_str) + "\n" for q_str in strings]
             else:
-                line += self.__empty_char
+                lines = [utils.remove_last_spaces("".join([q_str + self.__spacing \
+                    for q_str in strings[offsets[i]:offsets[i+1]]])) + "\n" \
+                    for i in range(len(offsets)-1)]
+            return fmt.formatted_column(lines, None)
+
+        # Array items are written on separate lines, in which case
+        # all arrays of an entry must have the same number of items
+        if st_line.multiline:
+            if offsets == None or not all(column.offsets == offsets for column in columns):
+                return None
 
-        # Return the formated output line
-        return utils.remove_last_spaces(line) + "\n"
+        # Single values are written on one line
+        elif not all(column.offsets == None for column in columns):
+            return None
+
+        # Fill the template with the strings of each quantity
+        lines = template.fill_columns([column.strings for column in columns])
+        return fmt.formatted_column(lines, offsets)
 
 
     #########################
@@ -522,9 +711,6 @@ class write_data_file( data_file.data_file ):
 
         '''
 
-        # Declare the output line
-        line  = ""
-
         # Copy the key of the targeted quantity
         key = keys[0]
 
@@ -532,102 +718,319 @@ class write_data_file( data_file.data_file ):
         if isinstance(d[key][i_entry], (list, np.ndarray)):
 
             # Separate all items in the list by spaces
+            parts = []
             for item in d[key][i_entry]:
-                line += self.__format_str_quantity(item, max_decimal) + self.__spacing
+                parts.append(self.__format_str_quantity(item, max_decimal))
+                parts.append(self.__spacing)
+            line = "".join(parts)
 
         # Add quantity directly if not a list
         else:
-            line += self.__format_str_quantity(d[key][i_entry], max_decimal)
+            line = self.__format_str_quantity(d[key][i_entry], max_decimal)
 
         # Return the formated output line
         return utils.remove_last_spaces(line) + "\n"
 
 
 
-    ########################
-    #  Generate line char  #
-    ########################
-    def __generate_line_char(self, i_entry, keys, positions, d, max_decimal, i_list):
+    ###########################
+    #  Get specific quantity  #
+    ###########################
+    def __get_specific_quantity(self, key, i_entry, i_list, d):
 
         '''
 
-        Generate an output line string countaining data structured 
-        by character index ranges.
+        Return data for a specific quantity, entry, and array index if provided.
 
         Arguments
         =========
+            key (str): quantity label
             i_entry (int): current data entry index
-            keys (list): list of quantities
-            positions (list): list of column indexes for each quantity
-            d (dict): data variable of a Data Interface object
-            max_decimal (int): number of decimal points for floats in scientific notation
-            i_list (int): if provided, current data array index within the $MULTILINE mode)
+            i_list (int): if not None, array index of the current quantity
+            d (dict): data dictionary of the Interface Data object
 
         '''
 
-        # Collect the highest character index
-        i_char_highest = -1
-        for pos in positions:
-            if pos[1] > i_char_highest:
-                i_char_highest = pos[1]
+        # Return specific quantity if the item is part of a list
+        if isinstance(i_list, int):
+            return d[key][i_entry][i_list]
+        
+        # Return quantity if it is not a list
+        else:
+            return d[key][i_entry]
+
 
-        # Initialize the empty list of characters
-        line_list = [" "] * (i_char_highest+1)
 
-        # For each quantity in the structure line ..
-        for key, pos in zip(keys, positions):
+#######################
+#  Declare the class  #
+#######################
+class entry_writer( object ):
 
-            # Copy its lower-bound character index
-            i_char_min = pos[0]
+    '''
 
-            # Adjust decimal points in case not enough space
-            md = min(max_decimal, pos[1]-i_char_min-6)
+    Writer of entries given one at a time, returned by
+    write_data_file.open_writer. Each entry is a dictionary (quantity
+    label --> value of the entry, with arrays for the quantities written
+    in the $MULTILINE mode). Entries are kept in a batch, and the batch
+    is written to the file (see write_data_file.write_file) every time
+    it reaches batch_size entries. $ONCE lines are only written for the
+    first entry, log_ quantities are computed out of the un-logged ones,
+    and quantities of the structure missing from an entry are written
+    as missing values (empty character). Missing $MULTILINE quantities
+    are given as many missing values as the arrays of the same structure
+    line found in the entry. If the entry has none of its arrays, the
+    structure line is written with missing values when its number of
+    lines is fixed ($MULTILINE: N), or not written at all otherwise.
+
+    Functions
+    =========
+        write_entry: add an entry to the file
+        write_entries: add every entry of an iterable to the file
+        close: write the remaining entries and close the file
 
-            # Collect the targeted quantity
-            quantity = self.__get_specific_quantity(key, i_entry, i_list, d)
+    '''
 
-            # Collect the string to be incorporated in the current character range
-            q_str = self.__format_str_quantity(quantity, md)
+    #################################
+    #  Initialization of the class  #
+    #################################
+    def __init__(self, writer, f, structure, templates, max_decimal, \
+                 float_sci, flush_size, batch_size):
 
-            # Find the upper-bound character index
-            i_char_max = min(pos[1]+1, len(q_str)+i_char_min)
+        '''
 
-            # Assign each character to the output list of characters
-            for i_char in range(i_char_min, i_char_max):
-                line_list[i_char] = q_str[i_char-i_char_min]
+        Initialize the entry_writer class.
 
-        # Convert list of characters to a string
-        line = ""
-        for char in line_list:
-            line += char
+        Arguments
+        =========
+            writer (write_data_file): writer formatting the output lines
+            f (file): output file
+            structure (compiled_structure): instructions on how to write the data file
+            templates (dict): template of each structure line
+            max_decimal (int): number of decimals for digits in scientific notation
+            float_sci (bool): if True, floats will be printed in scientific notations
+            flush_size (int): number of characters of output lines held before writing to the file
+            batch_size (int): number of entries accumulated before being written
 
-        # Return the formated 
-        return line + "\n"
+        '''
 
+        # Copy the writing instructions
+        self.__writer = writer
+        self.__f = f
+        self.__structure = structure
+        self.__templates = templates
+        self.__max_decimal = max_decimal
+        self.__float_sci = float_sci
+        self.__flush_size = flush_size
+        self.__batch_size = max(batch_size, 1)
+
+        # Declare the current batch of entries, and the $ONCE lines that have been applied
+        self.__batch = []
+        self.__read_once = set()
+
+        # Collect the quantities written in the file, and the $MULTILINE lines
+        self.__names = []
+        self.__multiline = []
+        for sub_bloc in structure.bloc:
+            for st_line in sub_bloc.lines:
+                self.__names.extend(st_line.names)
+                if st_line.multiline:
+                    self.__multiline.append(st_line)
 
-    ###########################
-    #  Get specific quantity  #
-    ###########################
-    def __get_specific_quantity(self, key, i_entry, i_list, d):
+
+    ###########
+    #  Enter  #
+    ###########
+    def __enter__(self):
+        return self
+
+
+    ##########
+    #  Exit  #
+    ##########
+    def __exit__(self, *exc):
 
         '''
 
-        Return data for a specific quantity, entry, and array index if provided.
+        Write the remaining entries and close the file.
+
+        '''
+
+        # Close the writer (exceptions are not suppressed)
+        self.close()
+        return False
+
+
+    #################
+    #  Write entry  #
+    #################
+    def write_entry(self, entry):
+
+        '''
+
+        Add an entry to the file. The entry is written once the current
+        batch of entries is full. The dictionary is copied, so that it can
+        be reused for the next entry.
+
+        Argument
+        ========
+            entry (dict): value of each quantity for this entry
+
+        '''
+
+        # Refuse entries if the file is closed
+        if self.__f == None:
+            print("Error - Cannot write entries, the writer is closed.")
+            return
+
+        # Add a copy of the entry (which may be modified by the caller
+        # before the batch is written), and write the batch if full
+        self.__batch.append(dict(entry))
+        if len(self.__batch) >= self.__batch_size:
+            self.__write_batch()
+
+
+    ###################
+    #  Write entries  #
+    ###################
+    def write_entries(self, entries):
+
+        '''
+
+        Add every entry of an iterable (e.g. a generator) to the file.
+
+        Argument
+        ========
+            entries (iterable of dict): value of each quantity, for each entry
+
+        '''
+
+        # Add the entries one by one
+        for entry in entries:
+            self.write_entry(entry)
+
+
+    ###########
+    #  Close  #
+    ###########
+    def close(self):
+
+        '''
+
+        Write the remaining entries and close the file.
+
+        '''
+
+        # Do nothing if already closed
+        if self.__f == None:
+            return
+
+        # Write the last batch, and close the file
+        try:
+            self.__write_batch()
+        finally:
+            self.__f.close()
+            self.__f = None
+
+
+    #################
+    #  Write batch  #
+    #################
+    def __write_batch(self):
+
+        '''
+
+        Write the current batch of entries to the file, and clear it.
+
+        '''
+
+        # Do nothing if there is no entry
+        nb_entries = len(self.__batch)
+        if nb_entries == 0:
+            return
+
+        # Collect the values of every entry for each quantity
+        data = dict()
+        for entry in self.__batch:
+            for q in entry:
+                if not q in data:
+                    data[q] = [other.get(q) for other in self.__batch]
+
+        # Fill the $MULTILINE quantities missing from entries
+        skip = self.__fill_multiline(data, nb_entries)
+
+        # Quantities missing from every entry are written as missing values
+        # (unless they can be computed out of the un-logged quantity)
+        for q in self.__names:
+            if not q in data and not (len(q) >= 5 and q[:4] == "log_" and q[4:] in data):
+                data[q] = [None] * nb_entries
+
+        # Write the entries, and clear the batch
+        self.__batch = []
+        self.__writer._write_entries(self.__f, self.__structure, self.__templates, \
+            data, nb_entries, self.__max_decimal, self.__float_sci, \
+            self.__flush_size, self.__read_once, skip=skip)
+
+
+    ####################
+    #  Fill multiline  #
+    ####################
+    def __fill_multiline(self, data, nb_entries):
+
+        '''
+
+        Give an array of missing values (None) to each $MULTILINE quantity
+        missing from an entry, as long as the first array of the same
+        structure line found in the entry. If the entry has none of these
+        arrays, they are given the number of lines of the structure line
+        ($MULTILINE: N), or empty arrays when lines are closed by an end
+        point, in which case the structure line is not written for this
+        entry. Return the entries (set of indexes) for
+        which each structure line (index) should be skipped.
 
         Arguments
         =========
-            key (str): quantity label
-            i_entry (int): current data entry index
-            i_list (int): if not None, array index of the current quantity
-            d (dict): data dictionary of the Interface Data object
+            data (dict): values of every entry for each quantity (modified here)
+            nb_entries (int): number of entries
 
         '''
 
-        # Return specific quantity if the item is part of a list
-        if isinstance(i_list, int):
-            return d[key][i_entry][i_list]
-        
-        # Return quantity if it is not a list
-        else:
-            return d[key][i_entry]
-
+        # For each structure line written on multiple lines ..
+        skip = dict()
+        for st_line in self.__multiline:
+
+            # Collect the values of each quantity (the un-logged
+            # quantity for log_ labels that can be computed)
+            sources = []
+            for q in st_line.names:
+                if len(q) >= 5 and q[:4] == "log_" and not q in data and q[4:] in data:
+                    q = q[4:]
+                if not q in data:
+                    data[q] = [None] * nb_entries
+                sources.append(data[q])
+
+            # For each entry ..
+            for i_entry in range(nb_entries):
+
+                # Extract the number of lines out of the first array found
+                nb_lines = None
+                for values in sources:
+                    if not values[i_entry] is None:
+                        nb_lines = len(values[i_entry])
+                        break
+
+                # If the entry has none of the arrays, write the number of
+                # lines required by the structure, or skip the structure line
+                if nb_lines == None:
+                    if st_line.ml_is_digit:
+                        nb_lines = st_line.ml_end_point
+                    else:
+                        skip.setdefault(st_line.index, set()).add(i_entry)
+                        nb_lines = 0
+
+                # Give missing values to the missing quantities
+                for values in sources:
+                    if values[i_entry] is None:
+                        values[i_entry] = [None] * nb_lines
+
+        # Return the skipped entries
+        return skip
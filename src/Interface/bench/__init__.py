@@ -0,0 +1,10 @@
+'''
+
+    Benchmark suite of the Interface package, run with
+
+        python -m Interface.bench --help
+
+'''
+
+from . import _cases as cases
+from . import _runner as runner
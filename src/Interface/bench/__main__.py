@@ -0,0 +1,98 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Command line entry point of the benchmark suite.
+
+        python -m Interface.bench --entries 100000 --output new.json
+        python -m Interface.bench --compare base.json new.json
+        python -m Interface.bench --compare base.json --cases char index
+
+    With --compare and a single file, the benchmark is run and compared
+    with that file. The exit code is 1 if any stage is slower than the
+    reference by more than --threshold.
+
+'''
+
+# Import Python packages
+import sys
+import json
+import argparse
+
+# Import the benchmark tools
+from . import _cases
+from . import _runner
+
+
+##########
+#  Main  #
+##########
+def main(argv=None):
+
+    '''
+
+    Parse the command line arguments, run (or compare) the benchmark,
+    and return the exit code.
+
+    Argument
+    ========
+        argv (list of str): command line arguments (None for sys.argv)
+
+    '''
+
+    # Declare the command line arguments
+    parser = argparse.ArgumentParser(prog="python -m Interface.bench", \
+        description="Time read_file, filter_data, get_quantities, and write_file on synthetic files.")
+    parser.add_argument("--cases", nargs="+", default=None, \
+        help="cases to run, among "+", ".join(_cases.cases.keys()))
+    parser.add_argument("--entries", type=int, default=10000, help="number of entries per file")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs per stage")
+    parser.add_argument("--no-memory", action="store_true", help="do not measure the peak memory")
+    parser.add_argument("--directory", default=None, help="where synthetic files are written")
+    parser.add_argument("--output", default=None, help="JSON file where the results are saved")
+    parser.add_argument("--compare", nargs="+", default=None, metavar="JSON", \
+        help="reference results (and results to compare, if already available)")
+    parser.add_argument("--threshold", type=float, default=0.1, \
+        help="relative slowdown flagged as a regression (default 0.1)")
+    args = parser.parse_args(argv)
+
+    # Load the reference results if needed
+    if not args.compare == None:
+        if len(args.compare) > 2:
+            print("Error - --compare takes one or two JSON files.")
+            return 2
+        base = _runner.load_results(args.compare[0])
+        if base == None:
+            return 2
+
+    # Load the results to be compared, or run the benchmark
+    if not args.compare == None and len(args.compare) == 2:
+        results = _runner.load_results(args.compare[1])
+    else:
+        results = _runner.run(case_names=args.cases, nb_entries=args.entries, \
+            repeat=args.repeat, memory=not args.no_memory, directory=args.directory)
+        if not results == None:
+            _runner.print_results(results)
+    if results == None:
+        return 2
+
+    # Save the results if needed
+    if not args.output == None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    # Compare with the reference results if needed
+    if not args.compare == None:
+        rows = _runner.compare(base, results, threshold=args.threshold)
+        _runner.print_comparison(rows)
+        if any(row[-1] for row in rows):
+            return 1
+
+    # Return the exit code
+    return 0
+
+
+# Run the benchmark
+if __name__ == "__main__":
+    sys.exit(main())
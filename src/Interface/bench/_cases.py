@@ -0,0 +1,286 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Synthetic benchmark cases. Each case covers one feature of the
+    structure files (character ranges, column indexes, multicolumn,
+    fixed and dynamic $MULTILINE, $ONCE, $IGNORE, and log_ quantities),
+    and generates a data file with a given number of entries.
+
+'''
+
+# Import Python packages
+import os
+import collections
+import numpy as np
+
+
+# One benchmark case
+#   name (str): label of the case
+#   structure (str): content of the structure file used to read the data file
+#   write_structure (str): content of the structure file used to write (None to use structure)
+#   generate (function): (random generator, number of entries) --> list of lines of the data file
+#   conditions (str): filtering conditions used with filter_data and get_quantities
+#   quantities (list of str): quantities returned by get_quantities
+case = collections.namedtuple("case", ["name", "structure", "write_structure", \
+    "generate", "conditions", "quantities"])
+
+# Labels used for string quantities
+_labels = ["h1", "he4", "c12", "o16", "ne20", "mg24", "si28", "fe56"]
+
+
+##############
+#  Gen char  #
+##############
+def _gen_char(rng, nb_entries):
+
+    '''
+
+    Generate the lines of the "char" case (character ranges).
+
+    Arguments
+    =========
+        rng (np.random.Generator): random generator
+        nb_entries (int): number of entries
+
+    '''
+
+    # One line per entry
+    lines = []
+    for i_entry in range(nb_entries):
+        lines.append("{:<8}{:>6}{:>14.6e}{:>14.6e}".format(_labels[i_entry % len(_labels)], \
+            int(rng.integers(0, 1000)), rng.random(), rng.normal()))
+    return lines
+
+
+###############
+#  Gen index  #
+###############
+def _gen_index(rng, nb_entries, comment_every=0):
+
+    '''
+
+    Generate the lines of the "index" case (column indexes), with
+    a comment line every comment_every entries if needed.
+
+    Arguments
+    =========
+        rng (np.random.Generator): random generator
+        nb_entries (int): number of entries
+        comment_every (int): number of entries between comment lines (0 for none)
+
+    '''
+
+    # One line per entry
+    lines = []
+    for i_entry in range(nb_entries):
+        if comment_every > 0 and i_entry % comment_every == 0:
+            lines.append("# comment line "+str(i_entry))
+        lines.append(_labels[i_entry % len(_labels)]+" "+str(int(rng.integers(1, 100)))+ \
+            " "+repr(float(rng.random())))
+    return lines
+
+
+#####################
+#  Gen multicolumn  #
+#####################
+def _gen_multicolumn(rng, nb_entries):
+
+    '''
+
+    Generate the lines of the "multicolumn" case (one list per line).
+
+    Arguments
+    =========
+        rng (np.random.Generator): random generator
+        nb_entries (int): number of entries
+
+    '''
+
+    # Two lines per entry, with lists of 2 to 10 values
+    lines = []
+    for i_entry in range(nb_entries):
+        lines.append(str(i_entry))
+        values = rng.random(int(rng.integers(2, 11)))
+        lines.append(" ".join(repr(v) for v in values.tolist()))
+    return lines
+
+
+#########################
+#  Gen multiline fixed  #
+#########################
+def _gen_multiline_fixed(rng, nb_entries):
+
+    '''
+
+    Generate the lines of the "multiline_fixed" case ($MULTILINE: 4).
+
+    Arguments
+    =========
+        rng (np.random.Generator): random generator
+        nb_entries (int): number of entries
+
+    '''
+
+    # One label line and four lines of values per entry
+    lines = []
+    for i_entry in range(nb_entries):
+        lines.append(_labels[i_entry % len(_labels)])
+        for t in [0.1, 0.5, 1.0, 5.0]:
+            lines.append(repr(t)+" "+repr(float(rng.random())))
+    return lines
+
+
+###########################
+#  Gen multiline dynamic  #
+###########################
+def _gen_multiline_dynamic(rng, nb_entries):
+
+    '''
+
+    Generate the lines of the "multiline_dynamic" case ($MULTILINE: END).
+
+    Arguments
+    =========
+        rng (np.random.Generator): random generator
+        nb_entries (int): number of entries
+
+    '''
+
+    # One label line, 1 to 8 lines of values, and the end flag per entry
+    lines = []
+    for i_entry in range(nb_entries):
+        lines.append("entry "+str(i_entry))
+        for i_row in range(int(rng.integers(1, 9))):
+            lines.append(str(i_row)+" "+repr(float(rng.normal())))
+        lines.append("END")
+    return lines
+
+
+##############
+#  Gen once  #
+##############
+def _gen_once(rng, nb_entries):
+
+    '''
+
+    Generate the lines of the "once" case ($ONCE line followed by entries).
+
+    Arguments
+    =========
+        rng (np.random.Generator): random generator
+        nb_entries (int): number of entries
+
+    '''
+
+    # Common line, then one line per entry
+    lines = ["1.5 2.5"]
+    for i_entry in range(nb_entries):
+        lines.append(_labels[i_entry % len(_labels)]+" "+repr(float(rng.random())))
+    return lines
+
+
+################
+#  Gen ignore  #
+################
+def _gen_ignore(rng, nb_entries):
+
+    '''
+
+    Generate the lines of the "ignore" case (comment lines to be ignored).
+
+    Arguments
+    =========
+        rng (np.random.Generator): random generator
+        nb_entries (int): number of entries
+
+    '''
+
+    # Same as the index case, with a comment line every 5 entries
+    return _gen_index(rng, nb_entries, comment_every=5)
+
+
+#############
+#  Gen log  #
+#############
+def _gen_log(rng, nb_entries):
+
+    '''
+
+    Generate the lines of the "log" case (log_ quantities).
+
+    Arguments
+    =========
+        rng (np.random.Generator): random generator
+        nb_entries (int): number of entries
+
+    '''
+
+    # One line per entry, with log values and positive values
+    lines = []
+    for i_entry in range(nb_entries):
+        lines.append(_labels[i_entry % len(_labels)]+" "+repr(float(rng.uniform(-2, 8)))+ \
+            " "+repr(float(rng.uniform(0.01, 10))))
+    return lines
+
+
+# Declare every benchmark case
+cases = collections.OrderedDict((c.name, c) for c in [
+    case("char", "label: str, 0-7\na: int, 8-13\nx: float, 14-27\ny: float, 28-41\n", \
+         None, _gen_char, "a > 500", ["label", "x"]),
+    case("index", "name: str, 0\nz: int, 1\nvalue: float, 2\n", \
+         None, _gen_index, "z >= 50", ["name", "value"]),
+    case("multicolumn", "id: int\n\nvalues: float, multicolumn\n", \
+         None, _gen_multicolumn, "id < 100", ["values"]),
+    case("multiline_fixed", "name: str\n\n$MULTILINE: 4\nt: float, 0\nrate: float, 1\n", \
+         None, _gen_multiline_fixed, "rate > 0.5", ["name", "rate"]),
+    case("multiline_dynamic", "name: str\n\n$MULTILINE: END\nx: int, 0\ny: float, 1\n", \
+         None, _gen_multiline_dynamic, "y > 0", ["x", "y"]),
+    case("once", "$ONCE\nc1: float, 0\nc2: float, 1\n\nlabel: str, 0\nvalue: float, 1\n", \
+         None, _gen_once, "value < 0.5", ["label", "c1"]),
+    case("ignore", "$IGNORE: #\n\nname: str, 0\nz: int, 1\nvalue: float, 2\n", \
+         None, _gen_ignore, "fe56 in name", ["z", "value"]),
+    case("log", "name: str, 0\nlog_rho: float, 1\nt: float, 2\n", \
+         "name: str, 0\nlog_rho: float, 1\nlog_t: float, 2\n", _gen_log, "rho > 1e3", ["rho", "t"]),
+])
+
+
+################
+#  Write case  #
+################
+def write_case(c, directory, nb_entries, seed=0):
+
+    '''
+
+    Write the structure files and the data file of a case in a directory,
+    and return the names of the data file, the structure file, and the
+    structure file used for writing, relative to the directory.
+
+    Arguments
+    =========
+        c (case): benchmark case
+        directory (str): directory where the files are written
+        nb_entries (int): number of entries in the data file
+        seed (int): seed of the random generator
+
+    '''
+
+    # Names of the files
+    data_name = c.name+".txt"
+    structure_name = c.name+"_structure.txt"
+    write_name = c.name+"_structure_w.txt"
+
+    # Write the structure files
+    with open(os.path.join(directory, structure_name), "w") as f:
+        f.write(c.structure)
+    with open(os.path.join(directory, write_name), "w") as f:
+        f.write(c.structure if c.write_structure == None else c.write_structure)
+
+    # Write the data file
+    lines = c.generate(np.random.default_rng(seed), nb_entries)
+    with open(os.path.join(directory, data_name), "w") as f:
+        f.write("\n".join(lines)+"\n")
+
+    # Return the names of the files
+    return data_name, structure_name, write_name
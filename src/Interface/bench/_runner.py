@@ -0,0 +1,302 @@
+'''
+
+    Creation date: October, 2026
+    Contributors: Benoit Cote (cotebenoit8@gmail.com)
+
+    Timing of the read_file, filter_data, get_quantities, and write_file
+    stages on the synthetic benchmark cases (see _cases.py), and
+    comparison between the results of two runs.
+
+'''
+
+# Import Python packages
+import os
+import sys
+import json
+import time
+import platform
+import tempfile
+import tracemalloc
+import numpy as np
+
+# Import Interface toolkit
+from .. import read_data_file as rdf
+from .. import write_data_file as wdf
+from .._version import version
+from . import _cases
+
+
+# Stages timed for each case
+stages = ["read", "filter", "get_quantities", "write"]
+
+
+#########
+#  Run  #
+#########
+def run(case_names=None, nb_entries=10000, repeat=3, memory=True, directory=None):
+
+    '''
+
+    Run the benchmark and return the results as a dictionary that can
+    be saved in JSON. Each stage is run repeat times, and the fastest
+    time is kept. The peak memory allocated by Python during each stage
+    is measured in a separate run (with tracemalloc), so that it does
+    not slow down the timed runs.
+
+    Arguments
+    =========
+        case_names (list of str): cases to be run (None for all cases)
+        nb_entries (int): number of entries in each synthetic data file
+        repeat (int): number of timed runs of each stage
+        memory (bool): if True, measure the peak memory of each stage
+        directory (str): where synthetic files are written (None for a temporary directory)
+
+    '''
+
+    # Select the cases
+    if case_names == None:
+        case_names = list(_cases.cases.keys())
+    for name in case_names:
+        if not name in _cases.cases:
+            print("Error -", name, "is not a benchmark case.")
+            print("  Available cases are", list(_cases.cases.keys()))
+            return None
+
+    # Declare the results
+    results = {"interface_version": version, "python": platform.python_version(), \
+               "numpy": np.__version__, "platform": platform.platform(), \
+               "nb_entries": nb_entries, "repeat": repeat, "cases": dict()}
+
+    # Run each case in the targeted (or a temporary) directory
+    if directory == None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in case_names:
+                results["cases"][name] = _run_case(_cases.cases[name], tmp_dir, nb_entries, repeat, memory)
+    else:
+        os.makedirs(directory, exist_ok=True)
+        for name in case_names:
+            results["cases"][name] = _run_case(_cases.cases[name], directory, nb_entries, repeat, memory)
+
+    # Return the results
+    return results
+
+
+##############
+#  Run case  #
+##############
+def _run_case(c, directory, nb_entries, repeat, memory):
+
+    '''
+
+    Generate the files of a case, time each stage, and return the
+    results of the case.
+
+    Arguments
+    =========
+        c (case): benchmark case
+        directory (str): where synthetic files are written
+        nb_entries (int): number of entries in the synthetic data file
+        repeat (int): number of timed runs of each stage
+        memory (bool): if True, measure the peak memory of each stage
+
+    '''
+
+    # Generate the files
+    data_name, structure_name, write_name = _cases.write_case(c, directory, nb_entries)
+    out_name = c.name+"_out.txt"
+    root_path = directory+os.sep
+    reader = rdf.read_data_file(root_path=root_path)
+    writer = wdf.write_data_file(root_path=root_path)
+
+    # Read the file once to get the data used by the other stages
+    d = reader.read_file(data_name, structure_name)
+
+    # Function running each stage
+    functions = {
+        "read": lambda: reader.read_file(data_name, structure_name),
+        "filter": lambda: d.filter_data(c.conditions),
+        "get_quantities": lambda: d.get_quantities(c.quantities, c.conditions),
+        "write": lambda: writer.write_file(out_name, write_name, d),
+    }
+
+    # Time each stage
+    timings = dict()
+    for stage in stages:
+        timings[stage] = _time_stage(functions[stage], repeat, memory)
+
+    # Add the throughput of each stage
+    file_size = os.path.getsize(os.path.join(directory, data_name))
+    out_size = os.path.getsize(os.path.join(directory, out_name))
+    for stage in stages:
+        seconds = max(timings[stage]["seconds"], 1e-9)
+        timings[stage]["entries_per_second"] = d.nb_entries / seconds
+        if stage == "read":
+            timings[stage]["bytes_per_second"] = file_size / seconds
+        elif stage == "write":
+            timings[stage]["bytes_per_second"] = out_size / seconds
+
+    # Return the results of the case
+    return {"nb_entries": d.nb_entries, "file_bytes": file_size, "stages": timings}
+
+
+################
+#  Time stage  #
+################
+def _time_stage(function, repeat, memory):
+
+    '''
+
+    Return the fastest time of a function over several runs, and its
+    peak memory allocation if needed.
+
+    Arguments
+    =========
+        function (function): stage to be timed
+        repeat (int): number of timed runs
+        memory (bool): if True, measure the peak memory
+
+    '''
+
+    # Keep the fastest run
+    seconds = None
+    for i_run in range(max(repeat, 1)):
+        t_start = time.perf_counter()
+        function()
+        t_run = time.perf_counter() - t_start
+        if seconds == None or t_run < seconds:
+            seconds = t_run
+    timing = {"seconds": seconds}
+
+    # Measure the peak memory in a separate run
+    if memory:
+        tracemalloc.start()
+        try:
+            function()
+            timing["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    # Return the timing
+    return timing
+
+
+#############
+#  Compare  #
+#############
+def compare(base, new, threshold=0.1):
+
+    '''
+
+    Compare the results of two runs, and return one row per case and
+    stage found in both runs: (case, stage, base seconds, new seconds,
+    ratio new/base, and whether this is a regression, i.e. a ratio
+    above 1+threshold).
+
+    Arguments
+    =========
+        base (dict): results of the reference run (see run)
+        new (dict): results of the run to be compared
+        threshold (float): relative slowdown above which a stage is a regression
+
+    '''
+
+    # For each case and stage found in both runs ..
+    rows = []
+    for name in base["cases"]:
+        if not name in new["cases"]:
+            continue
+        for stage in stages:
+            if not stage in base["cases"][name]["stages"] or \
+               not stage in new["cases"][name]["stages"]:
+                continue
+
+            # Compare the times
+            t_base = base["cases"][name]["stages"][stage]["seconds"]
+            t_new = new["cases"][name]["stages"][stage]["seconds"]
+            ratio = t_new / max(t_base, 1e-9)
+            rows.append((name, stage, t_base, t_new, ratio, ratio > 1 + threshold))
+
+    # Return the comparison
+    return rows
+
+
+###################
+#  Print results  #
+###################
+def print_results(results, file=sys.stdout):
+
+    '''
+
+    Print a summary table of the results of a run.
+
+    Arguments
+    =========
+        results (dict): results of a run (see run)
+        file (file): where the table is printed
+
+    '''
+
+    # Print the header
+    print("{:<18} {:<15} {:>11} {:>14} {:>11} {:>12}".format(\
+        "case", "stage", "seconds", "entries/s", "MB/s", "peak MB"), file=file)
+
+    # Print one row per case and stage
+    for name, result in results["cases"].items():
+        for stage, timing in result["stages"].items():
+            mb_s = timing.get("bytes_per_second", None)
+            peak = timing.get("peak_memory_bytes", None)
+            print("{:<18} {:<15} {:>11.5f} {:>14.0f} {:>11} {:>12}".format(\
+                name, stage, timing["seconds"], timing["entries_per_second"], \
+                "-" if mb_s == None else "{:.2f}".format(mb_s / 1e6), \
+                "-" if peak == None else "{:.2f}".format(peak / 1e6)), file=file)
+
+
+######################
+#  Print comparison  #
+######################
+def print_comparison(rows, file=sys.stdout):
+
+    '''
+
+    Print the comparison between two runs (see compare).
+
+    Arguments
+    =========
+        rows (list of tuple): comparison rows
+        file (file): where the table is printed
+
+    '''
+
+    # Print the header
+    print("{:<18} {:<15} {:>11} {:>11} {:>8}".format(\
+        "case", "stage", "base (s)", "new (s)", "ratio"), file=file)
+
+    # Print one row per case and stage, flagging regressions
+    for name, stage, t_base, t_new, ratio, regression in rows:
+        print("{:<18} {:<15} {:>11.5f} {:>11.5f} {:>8.3f}{}".format(\
+            name, stage, t_base, t_new, ratio, "  <-- slower" if regression else ""), file=file)
+
+
+##################
+#  Load results  #
+##################
+def load_results(path):
+
+    '''
+
+    Load the results of a run saved in JSON (None if not found).
+
+    Argument
+    ========
+        path (str): path to the JSON file
+
+    '''
+
+    # Return None if the file does not exist
+    if not os.path.isfile(path):
+        print("Error -", path, "not found.")
+        return None
+
+    # Return the results
+    with open(path, "r") as f:
+        return json.load(f)
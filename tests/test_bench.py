@@ -0,0 +1,54 @@
+# Tests for the benchmark suite
+# Created by: Benoit Cote (October, 2026)
+
+# Import Python packages
+import json
+
+# Import Interface tools
+from Interface import bench
+from Interface.bench import __main__ as bench_main
+
+
+# TestBench class
+# ===============
+class TestBench:
+    """Class that tests the benchmark suite on small synthetic files. """
+
+
+    # Test run
+    # ========
+    def test_run(self, tmp_path):
+        '''Testing that every case runs and reports every stage. '''
+
+        # Run every case on a few entries
+        results = bench.runner.run(nb_entries=20, repeat=1, memory=False, directory=str(tmp_path))
+        assert sorted(results["cases"].keys()) == sorted(bench.cases.cases.keys())
+        for name, result in results["cases"].items():
+            assert result["nb_entries"] == 20
+            assert list(result["stages"].keys()) == bench.runner.stages
+
+        # Unknown cases are refused
+        assert bench.runner.run(case_names=["not_a_case"]) == None
+
+
+    # Test compare
+    # ============
+    def test_compare(self, tmp_path):
+        '''Testing the comparison of two runs from the command line. '''
+
+        # Save a run and compare it with itself
+        base = str(tmp_path / "base.json")
+        assert bench_main.main(["--cases", "char", "--entries", "10", "--repeat", "1", \
+            "--no-memory", "--output", base]) == 0
+        assert bench_main.main(["--compare", base, base]) == 0
+
+        # Flag a regression when a stage is twice as slow
+        with open(base, "r") as f:
+            results = json.load(f)
+        results["cases"]["char"]["stages"]["read"]["seconds"] *= 2
+        slow = str(tmp_path / "slow.json")
+        with open(slow, "w") as f:
+            json.dump(results, f)
+        assert bench_main.main(["--compare", base, slow, "--threshold", "0.5"]) == 1
+        rows = bench.runner.compare(json.load(open(base)), results, threshold=0.5)
+        assert [row[1] for row in rows if row[-1]] == ["read"]
@@ -0,0 +1,196 @@
+# Tests for the columnar (NumPy-backed) storage
+# Created by: Benoit Cote (October, 2026)
+
+# Import Python packages
+import numpy as np
+
+# Import Interface tools
+from Interface import read_data_file
+from Interface import columns
+from Interface import converters
+from Interface import schema
+from Interface import data
+
+
+# TestColumnar class
+# ==================
+class TestColumnar:
+    """Class that tests the columnar storage of data objects. """
+
+    # Instantiate the reading scripts and setting root folder
+    rdf = read_data_file.read_data_file(root_path="./tests/data/")
+
+
+    # Test storage
+    # ============
+    def test_storage(self):
+        '''Testing the type of columns created when reading. '''
+
+        # Read data file with columnar storage
+        d = self.rdf.read_file("file_5.txt", "file_5_structure.txt", columnar=True)
+        assert d.columnar
+
+        # Scalar quantities should be typed NumPy columns
+        assert isinstance(d.data["q_value"], columns.scalar_column)
+        assert d.data["q_value"].dtype == np.float64
+        assert d.data["comp1"].dtype.kind == "U"
+
+        # Multiline quantities should be flat arrays with offsets
+        assert isinstance(d.data["T9"], columns.ragged_column)
+        assert list(d.data["T9"].offsets) == [0, 3, 6]
+        assert list(d.data["T9"].values) == [1e-3, 2e-3, 3e-3, 1.1e-3, 2.2e-3, 3.3e-3]
+
+        # Values should be accessible entry by entry
+        assert d.data["comp2"][0] == "gd134"
+        assert type(d.data["q_value"][1]) == float
+        assert list(d.data["rate"][1]) == [0.123E-09, 3.783E-09, 1.543E-09]
+
+
+    # Test files
+    # ==========
+    def test_files(self):
+        '''Testing that columnar and list storages give the same data. '''
+
+        # For each test file ..
+        for i_file in range(1, 10):
+            f = "file_"+str(i_file)+".txt"
+            s = "file_"+str(i_file)+"_structure.txt"
+
+            # Read the file with both storages
+            d = self.rdf.read_file(f, s)
+            d_c = self.rdf.read_file(f, s, columnar=True)
+
+            # Compare the data entry by entry
+            assert d.quantities == d_c.quantities
+            assert d.nb_entries == d_c.nb_entries
+            for q in d.quantities:
+                for i_entry in range(d.nb_entries):
+                    v, v_c = d.data[q][i_entry], d_c.data[q][i_entry]
+                    if isinstance(v, np.ndarray):
+                        assert list(v) == list(v_c)
+                    else:
+                        assert v == v_c
+
+
+    # Test filter
+    # ===========
+    def test_filter(self):
+        '''Testing the filtering of columnar data. '''
+
+        # Read the test-case file to be filtered
+        d = self.rdf.read_file("file_8.txt", "file_8_structure.txt", columnar=True)
+
+        # Filter with digit, string, and array conditions
+        f = d.filter_data(["right > 10", "h in string"])
+        assert f.columnar
+        assert f.nb_entries == 1
+        assert f.data["label"][0] == "label2"
+        assert list(f.data["left"][0]) == [1, 2, 3, 4, 5]
+
+        # Convert back to list storage
+        d.set_data(d.data, columnar=False)
+        assert isinstance(d.data["label"], list)
+        assert isinstance(d.data["left"][0], np.ndarray)
+
+
+    # Test missing values
+    # ===================
+    def test_missing(self):
+        '''Testing the validity mask of values that could not be converted. '''
+
+        # Convert a column where some fields are not digits
+        fields = ["1.5", "---", "2"] * 20 + ["bad"]
+        values, valid = converters.convert_column(fields, float)
+        assert values.dtype == np.float64
+        assert valid.sum() == 40 and not valid[-1]
+        assert np.isnan(values[1])
+        assert converters.to_list(values, valid)[:3] == [1.5, None, 2.0]
+
+        # Missing values are flagged in the columns
+        d = self.rdf.read_file("file_7.txt", "file_7_structure.txt", columnar=True)
+        assert isinstance(d.data["r1"], columns.ragged_column)
+        assert list(d.data["r1"][0]) == [None, 1.1]
+        assert list(d.get_valid("r1")[1]) == [False, False]
+        assert list(d.get_valid("a")[0]) == [True, True]
+
+        # Missing values never satisfy comparisons
+        f = d.filter_data("r1 > 2")
+        assert f.nb_entries == 2
+        assert list(f.data["r1"][0]) == [2.2]
+
+
+    # Test log columns
+    # ================
+    def test_log(self):
+        '''Testing the log10 and 10** of whole columns. '''
+
+        # Log scalars: zeros give -99, negatives and missing values are None
+        col = columns.to_column([100.0, 0, -1.0, None])
+        assert columns.log_column(col, -99.0).tolist() == [2.0, -99.0, None, None]
+
+        # Un-log integers exactly if possible, and as floats otherwise
+        assert columns.unlog_column(columns.to_column([0, 2])).tolist() == [1, 100]
+        assert columns.unlog_column(columns.to_column([-1, 2])).tolist() == [0.1, 100.0]
+
+        # Log and un-log ragged quantities through their flat array
+        col = columns.to_column([np.array([1.0, 10.0]), np.array([0.0, None])])
+        logged = columns.log_column(col, -99.0)
+        assert isinstance(logged, columns.ragged_column)
+        assert list(logged[0]) == [0.0, 1.0] and list(logged[1]) == [-99.0, None]
+        assert list(columns.unlog_column(logged)[0]) == [1.0, 10.0]
+
+        # Lists keep the type of 10**value for each value
+        d = data.data({"log_x": [1, -1, 19, 2.0, None]})
+        x = d.data["x"]
+        assert x == [10, 0.1, 10**19, 100.0, None]
+        assert [type(v) for v in x[:4]] == [int, float, int, float]
+        d = data.data({"log_y": [[0, 2], [-1, 1], np.array([1, 2])]})
+        assert [arr.dtype.kind for arr in d.data["y"]] == ["i", "f", "i"]
+        assert list(d.data["y"][1]) == [0.1, 10.0]
+
+
+    # Test derived quantities
+    # =======================
+    def test_derived(self):
+        '''Testing that un-logged quantities are only computed when accessed. '''
+
+        # The un-logged quantity is listed, but not computed yet
+        d = self.rdf.read_file("file_1_log.txt", "file_1_structure_log.txt", columnar=True)
+        assert "value" in d.quantities
+        assert d.data.is_derived("value") and d.data.is_pending("value")
+
+        # Filtered data objects declare it again without computing it
+        f = d.filter_data("Z > 1")
+        assert d.data.is_pending("value") and f.data.is_pending("value")
+        assert np.allclose(f.data["value"].values, [2e-3, 3e-3])
+
+        # It is computed on first access, and can be dropped
+        assert np.allclose(d.get_quantities("value"), [[1e-3], [2e-3], [3e-3]])
+        assert not d.data.is_pending("value")
+        d.drop_derived()
+        assert d.data.is_pending("value")
+        assert len(d.filter_data("value > 1.5e-3").data["Z"]) == 2
+
+
+    # Test schema
+    # ===========
+    def test_schema(self):
+        '''Testing the schema given by the reader and inferred from values. '''
+
+        # Schema given by the structure file, with missing values
+        for columnar in [False, True]:
+            d = self.rdf.read_file("file_7.txt", "file_7_structure.txt", columnar=columnar)
+            assert d.schema["r1"] == schema.quantity_schema("float", "ragged", True)
+            assert d.schema["a"].shape == "ragged" and not d.schema["a"].nullable
+
+        # Schema inferred from hand-built dictionaries
+        d = data.data({"s": ["a", None], "x": [1, 2.5], "y": [np.array([1, 2]), 3]})
+        assert d.schema["s"] == schema.quantity_schema("str", "scalar", True)
+        assert d.schema["x"] == schema.quantity_schema("float", "scalar", False)
+        assert d.schema["y"] == schema.quantity_schema("int", "mixed", False)
+
+        # Un-logged quantities are digits
+        d = data.data({"log_x": [np.array([0, 1]), np.array([2])]})
+        assert d.quantities == ["log_x", "x"]
+        assert d.schema["x"] == schema.quantity_schema("float", "ragged", False)
+        assert list(d.data["x"][1]) == [100]
@@ -6,6 +6,8 @@ import numpy  as np
 
 # Import Interface tools
 from Interface import read_data_file
+from Interface import data
+from Interface import conditions
 
 
 # TestFiltering class
@@ -334,6 +336,72 @@ class TestFiltering:
         self.__compare_filter(quantities, conditions, expected)
 
 
+    # Test filter #10
+    # ===============
+    def test_filter_10(self):
+        '''Testing conditions combined with and, or, not, and parentheses. '''
+
+        # Compare filtered data with the raw data
+        quantities = "label"
+        conditions = "number > 1 and h in string"
+        expected = [["label2"]]
+        self.__compare_filter(quantities, conditions, expected)
+
+        # Compare filtered data with the raw data
+        quantities = ["label", "right"]
+        conditions = "(number > 1 and right < 40) or \"Niak\" in string"
+        expected = [["label2",[13,24,35]], ["label3",[3,4,5,7,8]], ["label4",[0.2,0.3,0.4]]]
+        self.__compare_filter(quantities, conditions, expected)
+
+        # Compare filtered data with the raw data
+        quantities = ["label", "right"]
+        conditions = "left = 3 or right = 5"
+        expected = [["label1",[3,5]], ["label2",[35]], ["label3",[5]], ["label4",[0.4]]]
+        self.__compare_filter(quantities, conditions, expected)
+
+        # Compare filtered data with the raw data
+        quantities = ["label", "left"]
+        conditions = ["not (right > 5)", "not k in string"]
+        expected = [["label4",[1,2,3]]]
+        self.__compare_filter(quantities, conditions, expected)
+
+        # Compare filtered data with the raw data
+        quantities = ["label", "left"]
+        conditions = ["(right>5 and left<4) or number<0"]
+        expected = [["label2",[1,2,3]], ["label3",[1,2,3,4,5]]]
+        self.__compare_filter(quantities, conditions, expected)
+
+
+    # Test filter #11
+    # ===============
+    def test_filter_11(self):
+        '''Testing entry and item conditions on entries without any item. '''
+
+        # Entries with and without array items
+        d = data.data(data={"label": ["label1", "label2", "label3"], "number": [1, 2, 3], \
+            "right": [np.array([1.0, 5.0]), np.array([]), np.array([])]}, columnar=True)
+
+        # Entries decided by the entry condition keep all their items
+        for conditions, expected in [("number = 2 or right > 3", [["label1",[5.0]], ["label2",[]]]), \
+                ("not (number != 2 and right > 3)", [["label1",[1.0]], ["label2",[]]])]:
+            test = d.get_quantities(["label", "right"], conditions=conditions)
+            assert self.__to_list(test) == expected
+
+
+    # Test condition cache
+    # ====================
+    def test_condition_cache(self):
+        '''Testing that the least recently used conditions are forgotten first. '''
+
+        # Compile more conditions than the cache can hold, while reusing one
+        node = conditions.compile_expression("number > 1")
+        for i in range(conditions._cache_max_size):
+            conditions.compile_expression("number > " + str(i+2))
+            assert conditions.compile_expression("number > 1") is node
+        assert not "number > 2" in conditions._cache
+        assert len(conditions._cache) == conditions._cache_max_size
+
+
     # Compare filter
     # ==============
     def __compare_filter(self, quantities, conditions, expected):
@@ -366,3 +434,23 @@ class TestFiltering:
 
         # Return the converted array
         return arr
+
+
+# TestFilteringColumnar class
+# ===========================
+class TestFilteringColumnar(TestFiltering):
+    """Class that repeats the filtering tests with columnar storage. """
+
+    # Read the test-case file to be filtered, with columnar storage
+    d = TestFiltering.rdf.read_file("file_8.txt", "file_8_structure.txt", columnar=True)
+
+
+# TestFilteringIndexed class
+# ==========================
+class TestFilteringIndexed(TestFiltering):
+    """Class that repeats the filtering tests with every quantity indexed. """
+
+    # Read the test-case file to be filtered, and index every quantity
+    d = TestFiltering.rdf.read_file("file_8.txt", "file_8_structure.txt", columnar=True)
+    for quantity in d.quantities:
+        d.create_index(quantity)
@@ -0,0 +1,65 @@
+# Tests for the instrumentation of read_file
+# Created by: Benoit Cote (October, 2026)
+
+# Import Python packages
+import io
+
+# Import Interface tools
+from Interface import read_data_file
+from Interface import instrument
+
+
+# TestInstrument class
+# ====================
+class TestInstrument:
+    """Class that tests the statistics collected while reading. """
+
+    # Instantiate the reading scripts and setting root folder
+    rdf = read_data_file.read_data_file(root_path="./tests/data/")
+
+
+    # Test counters
+    # =============
+    def test_counters(self):
+        '''Testing the stages and counters of a reading. '''
+
+        # Read a file with ignored lines and fields that cannot be converted
+        with instrument.recorder(self.rdf) as rec:
+            d = self.rdf.read_file("file_7.txt", "file_7_structure.txt")
+        assert self.rdf.observer == None
+        assert len(rec.stats) == 1
+        stats = rec.stats[0]
+
+        # Check the stages
+        assert list(stats.stages.keys()) == \
+            ["structure", "scan", "extract", "assemble", "set_data", "validation"]
+        assert all(t >= 0 for t in stats.stages.values())
+
+        # Check the counters
+        with open("./tests/data/file_7.txt", "r") as f:
+            lines = f.read().splitlines()
+        assert stats.lines_scanned == len(lines)
+        assert stats.lines_ignored == 1
+        assert stats.nb_entries == d.nb_entries
+        assert stats.conversion_failures == 4
+        assert stats.bytes_read == sum(len(line) + 1 for line in lines)
+
+
+    # Test summary
+    # ============
+    def test_summary(self):
+        '''Testing the summary table and the disabled instrumentation. '''
+
+        # Nothing is collected without an observer
+        self.rdf.read_file("file_1.txt", "file_1_structure.txt")
+
+        # Print the summary table of a reading
+        rec = instrument.recorder()
+        self.rdf.observer = rec
+        self.rdf.read_file("file_1.txt", "file_1_structure.txt")
+        self.rdf.observer = None
+        out = io.StringIO()
+        rec.print_summary(file=out)
+        assert "file_1.txt" in out.getvalue()
+        assert "entries" in out.getvalue()
+        assert rec.stats[0].as_dict()["nb_entries"] == 3
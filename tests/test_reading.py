@@ -1,8 +1,19 @@
 # Tests for the reading process
 # Created by: Benoit Cote (June, 2022)
 
+# Import Python packages
+import bz2
+import gzip
+import lzma
+import numpy as np
+
 # Import Interface tools
 from Interface import read_data_file
+from Interface import fixed_width
+from Interface import column_builder
+from Interface import structure
+from Interface import compression
+from Interface import write_data_file
 
 
 # TestReading class
@@ -311,3 +322,219 @@ class TestReading:
         assert round(d.data["r1"][3][1],self.prec) == round(10**(4.233),self.prec)
 
 
+
+
+    # Test file #9
+    # ============
+    def test_file_9(self):
+
+        # Read data file
+        d = self.rdf.read_file("file_9.txt", "file_9_structure.txt")
+
+        # Test the number of entries and quantities
+        assert d.nb_entries == 2
+        assert d.nb_quantities == 3
+
+        # Compare read data against raw data
+        assert d.data["name"][0] == "entry one"
+        assert d.data["name"][1] == "entry two"
+        assert list(d.data["x"][0]) == [1, 2]
+        assert list(d.data["x"][1]) == [3]
+        assert list(d.data["y"][0]) == [1.5, 2.5]
+        assert list(d.data["y"][1]) == [3.5]
+
+
+    # Test iter entries
+    # =================
+    def test_iter_entries(self):
+
+        # For each test file ..
+        for i_file in range(1, 10):
+            f = "file_"+str(i_file)+".txt"
+            s = "file_"+str(i_file)+"_structure.txt"
+
+            # Read the file entirely, and entry by entry
+            d = self.rdf.read_file(f, s)
+            entries = list(self.rdf.iter_entries(f, s))
+
+            # Compare the streamed entries with the read data
+            assert len(entries) == d.nb_entries
+            for i_entry, entry in enumerate(entries):
+                for q, value in entry.items():
+                    expected = d.data[q][i_entry]
+                    if isinstance(expected, np.ndarray):
+                        assert list(value) == list(expected)
+                    else:
+                        assert value == expected
+
+
+    # Test compiled structure
+    # =======================
+    def test_compile_structure(self):
+
+        # Compiling twice the same structure file should hit the cache
+        s = self.rdf.compile_structure("file_7_structure.txt")
+        assert self.rdf.compile_structure("file_7_structure.txt") is s
+        assert self.rdf.compile_structure(s) is s
+
+        # Check the pre-screened instructions
+        assert s.ignore == ("Do not",)
+        assert s.bloc[0].lines[0].once
+        assert s.bloc[0].lines[0].names == ("common",)
+        assert s.bloc[0].lines[1].multiline
+        assert s.bloc[0].lines[1].ml_end_point == 2
+        assert s.bloc[0].lines[1].slices[0] == slice(2, 6)
+
+        # Reading with the compiled structure should give the same data
+        d = self.rdf.read_file("file_7.txt", "file_7_structure.txt")
+        d_c = self.rdf.read_file("file_7.txt", s)
+        assert d.quantities == d_c.quantities
+        for q in d.quantities:
+            for i_entry in range(d.nb_entries):
+                assert list(d.data[q][i_entry]) == list(d_c.data[q][i_entry])
+
+
+    # Test multiple files
+    # ===================
+    def test_read_files(self):
+
+        # Read several files on a pool of processes
+        f = ["file_5.txt", "file_5.txt"]
+        s = "file_5_structure.txt"
+        data_list = self.rdf.read_files(f, s, workers=2)
+        assert len(data_list) == 2
+        d = self.rdf.read_file("file_5.txt", s)
+        for d_p in data_list:
+            assert d_p.quantities == d.quantities
+            assert d_p.data["comp1"] == d.data["comp1"]
+
+        # Combine the files into one data object
+        d_c = self.rdf.read_files(f, s, workers=2, concatenate=True)
+        assert d_c.nb_entries == 2 * d.nb_entries
+        assert d_c.data["comp2"] == d.data["comp2"] * 2
+        assert list(d_c.data["T9"][-1]) == list(d.data["T9"][-1])
+
+
+    # Test parallel chunks
+    # ====================
+    def test_read_chunks(self):
+
+        # Split files into small chunks parsed in parallel
+        rdf = read_data_file.read_data_file(root_path="./tests/data/")
+        rdf.min_chunk_size = 1
+        for i_file in [3, 5, 7, 8]:
+            f = "file_"+str(i_file)+".txt"
+            s = "file_"+str(i_file)+"_structure.txt"
+
+            # Compare with the sequential reading
+            d = self.rdf.read_file(f, s)
+            d_p = rdf.read_file(f, s, workers=3)
+            assert d.quantities == d_p.quantities
+            assert d.nb_entries == d_p.nb_entries
+            for q in d.quantities:
+                for i_entry in range(d.nb_entries):
+                    if isinstance(d.data[q][i_entry], np.ndarray):
+                        assert list(d.data[q][i_entry]) == list(d_p.data[q][i_entry])
+                    else:
+                        assert d.data[q][i_entry] == d_p.data[q][i_entry]
+
+
+    # Test compressed files
+    # =====================
+    def test_compressed(self, tmp_path):
+
+        # Compress a data file with each codec (without extension for the last one)
+        with open("./tests/data/file_7.txt", "rb") as f:
+            raw = f.read()
+        with open("./tests/data/file_7_structure.txt", "r") as f:
+            (tmp_path / "structure.txt").write_text(f.read())
+        (tmp_path / "data.gz").write_bytes(gzip.compress(raw))
+        (tmp_path / "data.bz2").write_bytes(bz2.compress(raw))
+        (tmp_path / "data.xz").write_bytes(lzma.compress(raw))
+        (tmp_path / "data.dat").write_bytes(gzip.compress(raw))
+        assert compression.detect(str(tmp_path / "data.dat")) == "gzip"
+
+        # Compressed files give the same data, also in parallel (read sequentially)
+        rdf = read_data_file.read_data_file(root_path=str(tmp_path)+"/")
+        rdf.min_chunk_size = 1
+        d = self.rdf.read_file("file_7.txt", "file_7_structure.txt")
+        for name in ["data.gz", "data.bz2", "data.xz", "data.dat"]:
+            for workers in [1, 2]:
+                d_c = rdf.read_file(name, "structure.txt", workers=workers)
+                assert d_c.quantities == d.quantities
+                assert list(d_c.data["common"][0]) == list(d.data["common"][0])
+                assert list(d_c.data["T9"][-1]) == list(d.data["T9"][-1])
+            assert len(list(rdf.iter_entries(name, "structure.txt"))) == d.nb_entries
+
+        # Written files are compressed according to their extension
+        wdf = write_data_file.write_data_file(root_path=str(tmp_path)+"/", compression_level=1)
+        wdf.write_file("out.txt.gz", "structure.txt", d)
+        wdf.write_file("out.txt", "structure.txt", d)
+        with gzip.open(str(tmp_path / "out.txt.gz"), "rt") as f:
+            assert f.read() == (tmp_path / "out.txt").read_text()
+
+
+    # Test fixed-width extraction
+    # ===========================
+    def test_fixed_width(self):
+
+        # Extract character ranges from lines of different lengths
+        lines = ["  12  3.5 abc", "   7 1e-3 de", " x1  nan", "", "  -4"]
+        slices = (slice(0, 4), slice(4, 9), slice(9, 13))
+        types = (int, float, str)
+        columns = fixed_width.extract_columns(lines, slices, types)
+
+        # Compare with the line-by-line conversion
+        for sl, q_type, column in zip(slices, types, columns):
+            for line, value in zip(lines, column):
+                try:
+                    expected = q_type(line[sl])
+                except:
+                    expected = None
+                if isinstance(expected, float) and np.isnan(expected):
+                    assert np.isnan(value)
+                else:
+                    assert value == expected
+
+
+    # Test column builder
+    # ===================
+    def test_column_builder(self):
+
+        # Assemble entries where a quantity appears on two lines
+        builder = column_builder.column_builder()
+        builder.add_entry([{"a": 1}, {"a": 2, "b": " x  y "}])
+        builder.add_entry([{}, {}])
+        builder.add_entry([{"a": 3}, {"c": 1.5}, {"o$ONCE": 7}])
+        assert builder.nb_entries == 2
+        data = builder.get_data()
+        assert list(data.keys()) == ["a", "a 2", "b", "c", "o"]
+        assert data["a 2"] == [2, 0]
+        assert data["b"] == ["x y", ""]
+        assert data["c"] == [0, 1.5]
+        assert data["o"] == [7, 7]
+
+        # Reading in small blocks of entries gives the same data
+        rdf = read_data_file.read_data_file(root_path="./tests/data/")
+        rdf.block_size = 1
+        d = self.rdf.read_file("file_8.txt", "file_8_structure.txt")
+        d_b = rdf.read_file("file_8.txt", "file_8_structure.txt")
+        assert d.quantities == d_b.quantities
+        assert d.data["label"] == d_b.data["label"]
+        assert d.data["test1"] == d_b.data["test1"]
+
+
+    # Test ignored lines
+    # ==================
+    def test_ignore(self):
+
+        # Ignore lines by index
+        d = self.rdf.read_file("file_1.txt", "file_1_structure.txt", ignore_lines=[1, 3])
+        assert d.data["element"] == ["H", "Li"]
+
+        # All $IGNORE flags are found with a single expression
+        regex = structure.ignore_regex(("HH This", "#", "a.b"))
+        assert not regex.search("# comment") == None
+        assert not regex.search("xx HH This") == None
+        assert regex.search("axb") == None
+        assert structure.ignore_regex(()) == None
@@ -0,0 +1,115 @@
+# Tests for the binary storage and the reading cache
+# Created by: Benoit Cote (October, 2026)
+
+# Import Python packages
+import os
+import numpy as np
+
+# Import Interface tools
+from Interface import read_data_file
+from Interface import storage
+
+
+# TestStorage class
+# =================
+class TestStorage:
+    """Class that tests the binary storage of data objects. """
+
+    # Instantiate the reading scripts and setting root folder
+    rdf = read_data_file.read_data_file(root_path="./tests/data/")
+
+
+    # Test save and load
+    # ==================
+    def test_save_load(self, tmp_path):
+        '''Testing that saved and loaded data objects are identical. '''
+
+        # For each test file ..
+        for i_file in range(1, 10):
+            f = "file_"+str(i_file)+".txt"
+            s = "file_"+str(i_file)+"_structure.txt"
+
+            # Save and load the data
+            d = self.rdf.read_file(f, s)
+            path = str(tmp_path / f)
+            storage.save_data(d, path)
+            d_l = storage.load_data(path)
+
+            # Compare the data entry by entry
+            self.__compare_data(d, d_l)
+
+
+    # Test memory maps
+    # ================
+    def test_mmap(self, tmp_path):
+        '''Testing read-only memory-mapped data objects. '''
+
+        # Save the data and open it with memory maps
+        d = self.rdf.read_file("file_8.txt", "file_8_structure.txt")
+        path = str(tmp_path / "file_8")
+        storage.save_data(d, path)
+        d_m = storage.load_data(path, mmap_mode="r")
+        self.__compare_data(d, d_m)
+        assert isinstance(d_m.data["number"].values, np.memmap)
+        assert isinstance(d_m.data["right"].offsets, np.memmap)
+
+        # Filtering should work on the memory-mapped columns
+        q = d_m.get_quantities(["label", "right"], conditions="right > 10 and h in string")
+        assert q[0][0] == "label2"
+        assert list(q[0][1]) == [13, 24, 35, 47, 58]
+
+        # Memory-mapped columns should be read-only
+        try:
+            d_m.data["number"][0] = 1.0
+            assert False
+        except ValueError:
+            pass
+
+
+    # Test cache
+    # ==========
+    def test_cache(self, tmp_path, monkeypatch):
+        '''Testing that readings are saved in, and loaded from, the cache. '''
+
+        # Read the same file twice with a cache
+        cache_dir = str(tmp_path / "cache")
+        rdf = read_data_file.read_data_file(root_path="./tests/data/", cache_dir=cache_dir)
+        d = rdf.read_file("file_5.txt", "file_5_structure.txt")
+        assert len(os.listdir(cache_dir)) == 1
+        d_c = rdf.read_file("file_5.txt", "file_5_structure.txt")
+        self.__compare_data(d, d_c)
+        assert isinstance(d_c.data["q_value"], list)
+
+        # Another file should create another cache entry
+        rdf.read_file("file_4.txt", "file_4_structure.txt")
+        assert len(os.listdir(cache_dir)) == 2
+
+        # Readings should not be reused once the reading process changed
+        monkeypatch.setattr(read_data_file, "_cache_format", read_data_file._cache_format+1)
+        rdf.read_file("file_4.txt", "file_4_structure.txt")
+        assert len(os.listdir(cache_dir)) == 3
+        monkeypatch.setattr(read_data_file, "_reader_hash", "0")
+        rdf.read_file("file_4.txt", "file_4_structure.txt")
+        assert len(os.listdir(cache_dir)) == 4
+
+        # The least recently used entry should be removed first
+        rdf.cache.max_size = 1
+        rdf.cache.evict(keep=os.listdir(cache_dir)[0])
+        assert len(os.listdir(cache_dir)) == 1
+
+
+    # Compare data
+    # ============
+    def __compare_data(self, d, d_c):
+        '''Compare two data objects entry by entry. '''
+
+        # Compare the quantities and their values
+        assert d.quantities == d_c.quantities
+        assert d.nb_entries == d_c.nb_entries
+        for q in d.quantities:
+            for i_entry in range(d.nb_entries):
+                v, v_c = d.data[q][i_entry], d_c.data[q][i_entry]
+                if isinstance(v, np.ndarray):
+                    assert list(v) == list(v_c)
+                else:
+                    assert v == v_c
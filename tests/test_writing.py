@@ -8,6 +8,8 @@ import numpy as np
 # Import Interface tools
 from Interface import read_data_file
 from Interface import write_data_file
+from Interface import formatting
+from Interface import columns
 
 # TestWriting class
 # =================
@@ -91,6 +93,142 @@ class TestWriting:
         self.write_compare(s_alt, d, float_sci)
 
 
+    # Test flush size
+    # ===============
+    def test_flush_size(self, tmp_path):
+        '''Testing that the output does not depend on how often it is written. '''
+
+        # Write the same data with one entry per write, a few entries
+        # per write, and with a single write
+        rdf, wdf, s = self.tmp_interface(tmp_path, "file_3_structure.txt")
+        d = self.rdf.read_file("file_3.txt", s)
+        texts = []
+        for flush_size in [1, 200, 1<<20]:
+            wdf.write_file(self.out_name, s, d, flush_size=flush_size)
+            with open(tmp_path / self.out_name, "r") as f:
+                texts.append(f.read())
+        assert texts[0] == texts[1] == texts[2]
+        assert len(texts[0]) > 200
+
+
+    # Test format column
+    # ==================
+    def test_format_column(self):
+        '''Testing that whole columns are formatted like values one by one. '''
+
+        # Quantities of different types, with missing values
+        values = [[1.5, None, 1e-7, 2.0], [1, 2, None, 10], ["a", None, "bc", "d"], \
+                  [1, 2.5, None, 3], [np.array([1.0, 2.5]), np.array([3.0]), \
+                   np.array([1, None], dtype=object), np.array([])]]
+
+        # Compare the strings of columns and lists with those of single values
+        for q_values in values:
+            for entries in [q_values, columns.to_column(q_values)]:
+                for float_sci in [False, True]:
+                    expected = []
+                    for value in entries:
+                        for item in (value if isinstance(value, np.ndarray) else [value]):
+                            expected.append(formatting.format_value(item, 3, float_sci, "&"))
+                    column = formatting.format_column(entries, 3, float_sci, "&")
+                    assert column.strings == expected
+
+        # Floats in scientific notation without decimals are formatted one by one
+        assert formatting.format_column([1.5, 2.5], 0, True, "&") == None
+
+
+    # Test line template
+    # ==================
+    def test_line_template(self):
+        '''Testing the compiled templates of output lines. '''
+
+        # Column indexes, with empty characters and no spaces at the end
+        template = formatting.line_template([3, 0], 3, " ", "{&} ")
+        assert template.fill(["a", "b"]) == "b {&} {&} a\n"
+        assert template.fill_columns([["a", ""], ["b", "c"]]) == ["b {&} {&} a\n", "c {&} {&}\n"]
+
+        # Character ranges, truncated and padded, with and without overlaps
+        template = formatting.line_template([(0, 3), (6, 7)], 8, " ", "& ")
+        assert template.max_decimals == [-3, -5]
+        assert template.fill(["abcdef", "g"]) == "abcd  g \n"
+        template = formatting.line_template([(0, 5), (3, 4)], 3, " ", "& ")
+        assert template.fill(["abcdef", "x"]) == "abcxef\n"
+        assert template.fill_columns([["ab"], ["x"]]) == ["ab x  \n"]
+
+
+    # Test open writer
+    # ================
+    def test_open_writer(self, tmp_path):
+        '''Testing that entries written one by one give the same file. '''
+
+        # Write a file with $ONCE and $MULTILINE lines from a data object
+        rdf, wdf, s = self.tmp_interface(tmp_path, "file_7_structure.txt")
+        d = self.rdf.read_file("file_7.txt", s)
+        wdf.write_file(self.out_name, s, d)
+        with open(tmp_path / self.out_name, "r") as f:
+            expected = f.read()
+
+        # Write the same entries from a generator, in small batches
+        entries = ({q: d.data[q][i] for q in d.quantities} for i in range(d.nb_entries))
+        with wdf.open_writer(self.out_name, s, batch_size=2) as w:
+            w.write_entries(entries)
+        with open(tmp_path / self.out_name, "r") as f:
+            assert f.read() == expected
+
+        # Logged quantities are computed, and missing quantities are empty
+        s_log = self.rdf.compile_structure("file_1_structure_log.txt")
+        with wdf.open_writer(self.out_name, s_log) as w:
+            w.write_entry({"element": "H", "value": 100.0})
+            w.write_entry({"element": "He", "Z": 2, "value": 0})
+        with open(tmp_path / self.out_name, "r") as f:
+            assert f.read() == "H &  2.0\nHe 2 -99.0\n"
+
+        # Entries are kept even if the caller reuses the same dictionary
+        entry = dict()
+        with wdf.open_writer(self.out_name, s_log) as w:
+            for element, value in [("H", 100.0), ("He", 10.0), ("Li", 1.0)]:
+                entry["element"] = element
+                entry["value"] = value
+                w.write_entry(entry)
+        with open(tmp_path / self.out_name, "r") as f:
+            assert f.read() == "H &  2.0\nHe &  1.0\nLi &  0.0\n"
+
+        # Missing $MULTILINE quantities are empty on each line of the entry
+        entry = {q: d.data[q][0] for q in d.quantities}
+        for q in ["a", "z"]:
+            with wdf.open_writer(self.out_name, s) as w:
+                w.write_entry({key: entry[key] for key in entry if not key == q})
+            d_new = rdf.read_file(self.out_name, s)
+            assert d_new.nb_entries == 1
+            assert list(d_new.data[q][0]) == [None] * len(entry[q])
+            assert list(d_new.data["T9"][0]) == list(entry["T9"])
+
+        # Entries without any array keep the number of lines of $MULTILINE: N
+        rdf, wdf, s = self.tmp_interface(tmp_path, "file_5_structure.txt")
+        d = self.rdf.read_file("file_5.txt", s)
+        entry = {q: d.data[q][0] for q in d.quantities}
+        with wdf.open_writer(self.out_name, s) as w:
+            w.write_entry({"comp1": "a", "comment": "b", "q_value": 1.0})
+            w.write_entry(entry)
+        with open(tmp_path / self.out_name, "r") as f:
+            assert f.read().splitlines()[1:4] == ["&  &"] * 3
+        d_new = rdf.read_file(self.out_name, s)
+        assert d_new.nb_entries == 2
+        assert d_new.data["comp1"] == ["a", entry["comp1"]]
+        assert d_new.data["q_value"] == [1.0, entry["q_value"]]
+        assert list(d_new.data["rate"][1]) == list(entry["rate"])
+
+
+    # Tmp interface
+    # =============
+    def tmp_interface(self, tmp_path, s):
+
+        # Reading and writing scripts working in a temporary directory,
+        # and the structure (compiled from the test files)
+        rdf = read_data_file.read_data_file(root_path=str(tmp_path))
+        wdf = write_data_file.write_data_file(root_path=str(tmp_path))
+        return rdf, wdf, self.rdf.compile_structure(s)
+
+
     # Write compare
     # =============
     def write_compare(self, s, d, float_sci):
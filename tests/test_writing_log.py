@@ -67,9 +67,14 @@ class TestWriting:
     def write_compare(self, s, d, float_sci):
 
         # Write data file from Data Interface to ascii
+        quantities = list(d.quantities)
         self.wdf.write_file(self.out_name, s, d, append=False, \
                 max_decimal=self.md, float_sci=float_sci)
 
+        # The logged quantities are not added to the input Data object
+        assert d.quantities == quantities
+        assert list(d.data.keys()) == quantities
+
         # Read newly generated ascii file back to Data Interface
         d_new = self.rdf.read_file(self.out_name, s)
 